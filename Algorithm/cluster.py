@@ -10,7 +10,8 @@ from datetime import timedelta, datetime
 from collections import defaultdict
 import json
 from Algorithm.gemini_filter import call_gemini
-from scrapper.database import Database
+from Algorithm.gazetteer import resolve_place
+from scrapper.database import shared_database
 from config import TIME_WINDOW_DAYS, CLUSTER_TIME
 from pathlib import Path
 import time
@@ -18,28 +19,28 @@ from itertools import islice
 from config import batch_size
 from collections import defaultdict
 
-db = Database()
+_lga_column = False
+_lga_warned = False
+
+
+def lga_column_ready(db):
+    """
+    Whether events.lga exists (checked until it does, then cached).
+    Without it events are matched on their location alone
+    """
+    global _lga_column, _lga_warned
+    if not _lga_column:
+        _lga_column = db.has_column("events", "lga")
+        if not _lga_column and not _lga_warned:
+            _lga_warned = True
+            logging.warning("events.lga Missing, Matching Events On Location Only (Run python -m scrapper.migrate)")
+    return _lga_column
 
 def create_event(db, event):
     """Creates a new event and returns its ID safely"""
     try:
-        query = """
-        INSERT INTO events (
-            event_type,
-            title,
-            location,
-            first_detected,
-            last_updated,
-            severity,
-            confidence,
-            state,
-            status
-        )
-        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-        RETURNING id;
-        """
-
-        row = db.fetch_one(query, (
+        columns = ["event_type", "title", "location", "first_detected", "last_updated", "severity", "confidence", "state", "status"]
+        values = [
             event.get("event_type"),
             event.get("summary"),
             event.get("location"),
@@ -49,7 +50,18 @@ def create_event(db, event):
             event.get("confidence"),
             event.get("state"),
             "new"
-        ))
+        ]
+        if event.get("lga"):
+            columns.append("lga")
+            values.append(event["lga"])
+
+        query = f"""
+        INSERT INTO events ({", ".join(columns)})
+        VALUES ({", ".join(["%s"] * len(columns))})
+        RETURNING id;
+        """
+
+        row = db.fetch_one(query, tuple(values))
 
         if not row or "id" not in row:
             logging.error(f"Failed to create event, query returned: {row}")
@@ -129,6 +141,16 @@ def assign_cluster(db, data):
                         'summary': data.get('summary'),
                         'state': data.get('state')
                     }
+        # Signals in the same LGA belong together however the source spelt it; this
+        # also gives a state to signals whose location only named a town. A bare
+        # state name ("Gombe, Nigeria") says nothing about the LGA, and the
+        # location itself is kept as reported
+        place = resolve_place(event_candidate['location'], event_candidate['state'], state_names=False)
+        if place:
+            event_candidate['state'] = place['state']
+            if lga_column_ready(db):
+                event_candidate['lga'] = place['lga']
+
         # Validate required fields
         try:
             validate_event_candidate(event_candidate)
@@ -136,13 +158,20 @@ def assign_cluster(db, data):
             logging.error(f"Invalid event candidate: {e}")
             return None
             
-        query = """
+        # Same LGA, or the same location as reported (events created before LGAs were stored)
+        place_clause = "location = %s"
+        place_params = (event_candidate["location"],)
+        if event_candidate.get("lga"):
+            place_clause = "(lga = %s OR location = %s)"
+            place_params = (event_candidate["lga"], event_candidate["location"])
+
+        query = f"""
         SELECT id, last_updated
         FROM events
         WHERE
             event_type = %s
             AND state = %s
-            AND location = %s
+            AND {place_clause}
             AND last_updated >= %s
         ORDER BY
             last_updated DESC
@@ -154,7 +183,7 @@ def assign_cluster(db, data):
         match = db.fetch_one(query, (
             event_candidate["event_type"],
             event_candidate["state"],
-            event_candidate["location"],
+            *place_params,
             cutoff_time
         ))
         
@@ -245,6 +274,7 @@ def prepare_clusters_for_gemini():
         ea.relevance_score DESC;
     '''
 
+    db = shared_database("cluster")
     records = db.fetch_all(query)
 
     if not records:
@@ -380,6 +410,7 @@ def clustering_pipeline():
         
         # Fetch signals
         query = "SELECT * FROM signals WHERE created_at >= %s ORDER BY created_at ASC"
+        db = shared_database("cluster")
         data_list = db.fetch_all(query, (cutoff_time,))
         logging.info(f"Processing {len(data_list)} signals")
         
@@ -9,6 +9,10 @@ logging.basicConfig(
 import re, json
 from Algorithm.gemini_filter import call_gemini
 from scrapper.database import Database 
+from scrapper.article_fetcher import fetch_article_leads
+from Algorithm.near_duplicates import collapse_near_duplicates
+from Algorithm.gazetteer import GENERIC_WORDS, KeywordAutomaton, get_gazetteer, normalize_place, resolve_place
+from config import DEEP_FETCH
 from pathlib import Path
 from datetime import datetime
 
@@ -52,9 +56,38 @@ STATE_KEYWORDS = {
     "Zamfara": ["zamfara", "zamfarastate", "zamfara state", "gusau", "kaura namoda"]
 }
 
+# Aliases that also mean something else (a title, a country, another town), so a
+# state name of the same length is preferred over them
+AMBIGUOUS_KEYWORDS = {"ph", "phc", "ado", "aba", "epe", "bama", "deba", "offa", "benin", "niger", "delta"}
+
+
+def _state_keywords():
+    """ Normalized keyword -> (state, is the state's own name, is ambiguous) """
+    keywords = {}
+    for state, aliases in STATE_KEYWORDS.items():
+        state_name = normalize_place(state).replace(" ", "")
+        for alias in aliases:
+            keyword = normalize_place(alias)
+            keywords.setdefault(keyword, (
+                state,
+                keyword.replace(" ", "").startswith(state_name),
+                keyword in AMBIGUOUS_KEYWORDS,
+            ))
+    return keywords
+
+
+# Built once: every state keyword found in one pass over the location string
+STATE_MATCHER = KeywordAutomaton(_state_keywords())
+
+
 def extract_state_from_location(location_string):
     """
     Extract Nigerian state from a location string robustly.
+    All state keywords in the string are found in one pass; when they disagree
+    the longest match wins, then a state name over a city, then an unambiguous
+    keyword over an ambiguous one ("ph", "ado"), then the earliest match.
+    Locations naming no state ("Gwoza", "Kafanchan") are looked up in the LGA
+    gazetteer.
     
     Returns:
         state name (str) if found
@@ -64,32 +97,28 @@ def extract_state_from_location(location_string):
         logging.warning("No location provided")
         return None
 
-    # Normalize: lowercase, remove extra spaces
-    location_lower = location_string.lower().strip()
-    
-    # Remove punctuation to handle "Lagos, Nigeria"
-    location_clean = re.sub(r'[^\w\s]', '', location_lower)
-
-    # Split into words for safe matching
-    words = location_clean.split()
-
-    # 1. Match any state keywords first
-    for state, keywords in STATE_KEYWORDS.items():
-        for keyword in keywords:
-            # Match whole words or phrases
-            keyword_lower = keyword.lower()
-            if re.search(rf'\b{re.escape(keyword_lower)}\b', location_clean):
-                return state
-
-    # 2. If only "nigeria" is mentioned or appears alone, return None
-    if "nigeria" in words:
-        # Check if any other word exists besides Nigeria
-        other_words = [w for w in words if w != "nigeria"]
-        if not other_words:
-            return None
+    hits = STATE_MATCHER.find_all(normalize_place(location_string))
+    if not hits:
+        place = resolve_place(location_string)
+        return place["state"] if place else None
+    start, end, (state, is_state_name, is_ambiguous) = max(
+        hits, key=lambda hit: (hit[1] - hit[0], hit[2][1], not hit[2][2], -hit[0])
+    )
+    return state
 
-    # 3. No state found
-    return None
+def headline_places(headline):
+    """
+    Places a headline names: its state keywords ("Lagos", "Onitsha") and LGA or
+    town names from the gazetteer, spaces removed so "Obio Akpor" and
+    "Obio-Akpor" are one place. Keeps near-duplicate collapsing from joining
+    the same kind of incident in two places
+    """
+    text = normalize_place(headline)
+    names = [text[start:end] for start, end, _ in STATE_MATCHER.find_all(text)]
+    gazetteer = get_gazetteer()
+    if gazetteer is not None:
+        names.extend(name for _, _, name in gazetteer.exact.find_all(text))
+    return {name.replace(" ", "") for name in names if name not in GENERIC_WORDS}
 
 def normalize_text(text):
     """
@@ -145,9 +174,11 @@ def ingest_message(msg):
     except Exception as e:
         logging.error(f" An Error Occurred When Filtering Messages: {e}")
 
-def gemini_results_to_signals(gemini_response: dict) -> list[dict]:
+def gemini_results_to_signals(gemini_response: dict, members: dict = None) -> list[dict]:
     """
-    Convert Gemini batch output into DB-ready signal records
+    Convert Gemini batch output into DB-ready signal records.
+    A verdict on a representative headline also applies to its near-duplicates
+    (members: representative id -> article ids), so every article is linked
     """
     try:
         signals = []
@@ -182,6 +213,8 @@ def gemini_results_to_signals(gemini_response: dict) -> list[dict]:
             }
 
             signals.append(signal)
+            for article_id in (members or {}).get(item["id"], []):
+                signals.append({**signal, "article_id": article_id})
         database = Database()
         status = database.insert('signals', signals)
         if status is False:
@@ -202,6 +235,51 @@ def extract_json(text: str):
         raise ValueError("No JSON object found in Gemini response")
     return json.loads(match.group())
 
+def filter_rows(rows):
+    '''
+    Keyword filter parsed_articles rows, then classify the matches with Gemini
+    and store the real incidents as signals
+    Args:
+        rows: parsed_articles rows (id, title, news_url)
+    Returns:
+        Status of the signals insert, or None when no row matched a keyword
+    '''
+    results = []
+
+    urls = {}
+    for row in rows:
+        id = row.get('id')
+        msg = row.get('title')
+        result = ingest_message(msg)
+
+        if result:
+            results.append({'id' : id,
+                            'headline': msg})
+            urls[id] = row.get('news_url')
+    logging.info(f"Keyword Filtering Completed, Calling Gemini in Progress. {len(results)} keywords filtered.")
+    if len(results) == 0:
+        return None
+
+    # The same story from several sources is classified once
+    results, members = collapse_near_duplicates(results, places=headline_places)
+    urls = {result['id']: urls[result['id']] for result in results}
+
+    # Give Gemini the article's opening paragraphs, not just the headline
+    if DEEP_FETCH:
+        leads = fetch_article_leads([{'id': id, 'news_url': url} for id, url in urls.items()])
+        for result in results:
+            if leads.get(result['id']):
+                result['lead'] = leads[result['id']]
+    path = Path.cwd()
+    with open(f"{path}/Algorithm/system_instructions/filter_instructions.txt", "r") as w:
+        instructions = w.read()
+    prompt = f"{instructions} {results}"
+    response = call_gemini(prompt)
+    extracted_json = extract_json(response)
+    logging.info("Retrieved Gemini Response, Inserting to Database")
+    status = gemini_results_to_signals(extracted_json, members)
+    return status
+
 def filter_pipeline():
     '''
     Pipeline For Filtering Messages 
@@ -216,30 +294,7 @@ def filter_pipeline():
             ORDER BY scraped_at DESC;
             """
         rows = database.fetch_all(query)
-        results = []
-
-        for row in rows:
-            id = row.get('id')
-            msg = row.get('title')
-            result = ingest_message(msg)
-
-            if result:
-                results.append({'id' : id,
-                                'headline': msg})
-        logging.info(f"Keyword Filtering Completed, Calling Gemini in Progress. {len(results)} keywords filtered.")
-        if len(results) == 0:
-            return None
-        path = Path.cwd()
-        with open(f"{path}/Algorithm/system_instructions/filter_instructions.txt", "r") as w:
-            instructions = w.read()
-        prompt = f"{instructions} {results}"
-        response = call_gemini(prompt)
-        extracted_json = extract_json(response)
-        logging.info("Retrieved Gemini Response, Inserting to Database")
-        status = gemini_results_to_signals(extracted_json)
-        return status
+        return filter_rows(rows)
     except Exception as e:
         import traceback
         logging.error(f"An Error Occurred During The Filtering Pipeline. {e}\n{traceback.format_exc()}")
-
-
@@ -0,0 +1,328 @@
+import logging,sys
+logger = logging.getLogger("runner")
+logging.basicConfig(
+    stream=sys.stdout,
+    level=logging.INFO,
+    format="%(asctime)s [%(levelname)s] %(message)s",
+)
+
+import csv
+import re
+from pathlib import Path
+from config import GAZETTEER_MAX_DISTANCE, GAZETTEER_MIN_FUZZY_LENGTH, GAZETTEER_MIN_SIMILARITY
+
+GAZETTEER_FILE = Path(__file__).resolve().parent / "data" / "nigeria_lgas.csv"
+
+# Location strings are matched lowercased, without punctuation and with single spaces,
+# so "Ado-Ekiti," and "ado  ekiti" read the same way the keywords do
+PUNCTUATION_PATTERN = re.compile(r"[^\w\s]")
+SPACE_PATTERN = re.compile(r"\s+")
+
+
+def normalize_place(text):
+    """ Lowercase, strip punctuation and collapse whitespace """
+    return SPACE_PATTERN.sub(" ", PUNCTUATION_PATTERN.sub("", (text or "").lower())).strip()
+
+
+class KeywordAutomaton:
+    """
+    Aho–Corasick automaton over a fixed set of keywords, built once: finds every
+    keyword occurring in a text in one pass over its characters, however many
+    keywords there are. Only whole-word hits are reported (the characters around
+    a hit must be the text's edges or spaces, as the text is normalized)
+    """
+
+    def __init__(self, keywords):
+        """
+        Args:
+            keywords: dict of normalized keyword -> value reported for its hits
+        """
+        self.goto = [{}]
+        self.fail = [0]
+        self.output = [[]]
+        for keyword, value in keywords.items():
+            self._add(keyword, value)
+        self._link()
+
+    def _add(self, keyword, value):
+        node = 0
+        for char in keyword:
+            following = self.goto[node].get(char)
+            if following is None:
+                following = len(self.goto)
+                self.goto[node][char] = following
+                self.goto.append({})
+                self.fail.append(0)
+                self.output.append([])
+            node = following
+        self.output[node].append((len(keyword), value))
+
+    def _link(self):
+        """ Breadth-first failure links; each node also inherits the outputs of its failure node """
+        queue = list(self.goto[0].values())
+        for node in queue:
+            for char, following in self.goto[node].items():
+                queue.append(following)
+                fallback = self.fail[node]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                target = self.goto[fallback].get(char, 0)
+                self.fail[following] = target if target != following else 0
+                self.output[following] = self.output[following] + self.output[self.fail[following]]
+
+    def find_all(self, text):
+        """
+        Args:
+            text: Normalized text (see normalize_place)
+        Returns:
+            list of (start, end, value) for every whole-word keyword hit
+        """
+        goto, fail, output = self.goto, self.fail, self.output
+        hits = []
+        node = 0
+        last = len(text) - 1
+        for index, char in enumerate(text):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            if output[node] and (index == last or text[index + 1] == " "):
+                for length, value in output[node]:
+                    start = index - length + 1
+                    if start == 0 or text[start - 1] == " ":
+                        hits.append((start, index + 1, value))
+        return hits
+
+
+# Words that describe a place rather than name one; never fuzzy-matched on their own
+GENERIC_WORDS = {
+    "nigeria", "state", "lga", "local", "government", "area", "council", "town", "city", "village",
+    "community", "communities", "market", "road", "street", "junction", "district", "axis", "near",
+    "north", "south", "east", "west", "central", "northern", "southern", "eastern", "western",
+    "and", "the", "of", "in",
+}
+
+# Other countries, mostly Nigeria's region. A location naming one is not in Nigeria, whatever
+# its towns sound like ("Sudan" is not Kudan, "Bali, Indonesia" not Bali in Taraba). Niger,
+# Benin and Chad are also a state, a city and a lake in Nigeria, so only their longer forms count
+FOREIGN_COUNTRIES = {
+    "ghana", "cameroon", "cameroun", "niger republic", "republic of niger", "benin republic",
+    "republic of benin", "chad republic", "republic of chad", "togo", "mali", "burkina faso",
+    "senegal", "gambia", "guinea", "guinea bissau", "sierra leone", "liberia", "ivory coast",
+    "cote divoire", "mauritania", "morocco", "algeria", "tunisia", "libya", "egypt", "sudan",
+    "south sudan", "ethiopia", "eritrea", "somalia", "kenya", "uganda", "tanzania", "rwanda",
+    "burundi", "congo", "drc", "gabon", "equatorial guinea", "central african republic", "angola",
+    "zambia", "zimbabwe", "mozambique", "malawi", "namibia", "botswana", "south africa",
+    "madagascar", "united kingdom", "uk", "england", "united states", "usa",
+    "canada", "france", "germany", "italy", "spain", "netherlands", "ireland", "russia",
+    "ukraine", "israel", "palestine", "gaza", "lebanon", "syria", "iraq", "iran", "yemen",
+    "saudi arabia", "uae", "united arab emirates", "qatar", "turkey", "india", "pakistan",
+    "afghanistan", "china", "japan", "indonesia", "philippines", "malaysia", "brazil", "mexico",
+    "haiti", "australia",
+}
+FOREIGN_COUNTRY_MATCHER = KeywordAutomaton({country: country for country in FOREIGN_COUNTRIES})
+
+
+def names_foreign_country(text):
+    """ Whether a normalized location string names a country other than Nigeria """
+    return bool(FOREIGN_COUNTRY_MATCHER.find_all(text))
+
+
+def place_variants(name):
+    """
+    Normalized forms of a gazetteer name: "Obio/Akpor" is also "obio akpor", and
+    "Birnin Gwari" also "birningwari" (what "Birnin-Gwari" normalizes to)
+    """
+    spaced = normalize_place(re.sub(r"[-/]", " ", name))
+    return {normalize_place(name), spaced, spaced.replace(" ", "")} - {""}
+
+
+def edit_distance(first, second, limit):
+    """
+    Levenshtein distance between two strings, or limit + 1 as soon as it is
+    known to exceed limit
+    """
+    if abs(len(first) - len(second)) > limit:
+        return limit + 1
+    previous = list(range(len(second) + 1))
+    for row, char in enumerate(first, 1):
+        current = [row]
+        for column, other in enumerate(second, 1):
+            current.append(min(previous[column] + 1, current[column - 1] + 1, previous[column - 1] + (char != other)))
+        if min(current) > limit:
+            return limit + 1
+        previous = current
+    return previous[-1]
+
+
+def trigrams(word):
+    """ Distinct letter trigrams of a word, padded so its first and last letters count fully """
+    padded = f"  {word}  "
+    return {padded[index:index + 3] for index in range(len(padded) - 2)}
+
+
+class TrigramIndex:
+    """
+    Names indexed by their letter trigrams. One edit changes at most three
+    trigrams, so a name within d edits of a query shares all but 3 * d of the
+    query's trigrams; only those candidates get an edit distance computed
+    """
+
+    def __init__(self, names=()):
+        self.postings = {}
+        for name in names:
+            for gram in trigrams(name):
+                self.postings.setdefault(gram, []).append(name)
+
+    def search(self, word, limit):
+        """
+        Returns:
+            list of (distance, name) for the names within limit edits of word
+        """
+        grams = trigrams(word)
+        shared = {}
+        for gram in grams:
+            for name in self.postings.get(gram, ()):
+                shared[name] = shared.get(name, 0) + 1
+        required = max(1, len(grams) - 3 * limit)
+        found = []
+        for name, count in shared.items():
+            if count >= required:
+                distance = edit_distance(word, name, limit)
+                if distance <= limit:
+                    found.append((distance, name))
+        return found
+
+
+class GazetteerIndex:
+    """
+    In-memory index of the Local Government Areas in GAZETTEER_FILE, their
+    towns and alternate spellings. Names found verbatim in a location string
+    come from a KeywordAutomaton (a trie of every name with Aho–Corasick
+    links); the rest are looked up in a TrigramIndex within
+    GAZETTEER_MAX_DISTANCE edits (fewer for short names, see
+    GAZETTEER_MIN_SIMILARITY), so "Maidugiri" or "Kachiya" still resolve.
+    Locations naming another country resolve to nothing
+    """
+
+    def __init__(self, rows):
+        self.entries = []
+        self.names = {}
+        for row in rows:
+            entry = {
+                "state": row["state"],
+                "lga": row["lga"],
+                "latitude": float(row["latitude"]),
+                "longitude": float(row["longitude"]),
+            }
+            self.entries.append(entry)
+            for name in [row["lga"], *filter(None, (row.get("aliases") or "").split("|"))]:
+                for variant in place_variants(name):
+                    self.names.setdefault(variant, []).append(len(self.entries) - 1)
+        self.exact = KeywordAutomaton({name: name for name in self.names})
+        self.fuzzy = TrigramIndex(self.names)
+        # State names are not misspelt LGAs ("Abuja" is not "Abua")
+        self.not_fuzzy = GENERIC_WORDS | {"abuja", "fct"} | {
+            word for country in FOREIGN_COUNTRIES for word in country.split()
+        } | {
+            word for entry in self.entries for word in normalize_place(entry["state"]).split()
+        }
+        self.state_names = {"abuja", "fct"} | {
+            variant for entry in self.entries for variant in place_variants(entry["state"])
+        }
+
+    @classmethod
+    def load(cls, path=GAZETTEER_FILE):
+        """
+        Args:
+            path: Gazetteer csv (state, lga, latitude, longitude, aliases), # lines are comments
+        Returns:
+            GazetteerIndex, or None if the file cannot be read
+        """
+        try:
+            with open(path, newline="", encoding="utf-8") as f:
+                index = cls(csv.DictReader(line for line in f if not line.startswith("#")))
+            logging.info(f"Loaded Gazetteer Of {len(index.entries)} LGAs And {len(index.names)} Place Names")
+            return index
+        except Exception as e:
+            logging.error(f"Failed To Load Gazetteer {path}: {e}")
+            return None
+
+    def _entry(self, name, state):
+        """ The LGA a name refers to (within state, if given), None if it names several """
+        candidates = {index for index in self.names[name] if state is None or self.entries[index]["state"] == state}
+        if len(candidates) != 1:
+            return None
+        return self.entries[candidates.pop()]
+
+    def _fuzzy_candidates(self, text):
+        """ Runs of up to three words of text worth a fuzzy lookup """
+        words = text.split()
+        for size in (3, 2, 1):
+            for start in range(len(words) - size + 1):
+                run = words[start:start + size]
+                if all(word in self.not_fuzzy for word in run):
+                    continue
+                gram = " ".join(run)
+                if len(gram) >= GAZETTEER_MIN_FUZZY_LENGTH:
+                    yield gram
+
+    def lookup(self, location_string, state=None, state_names=True):
+        """
+        Resolve a free-text location to an LGA
+        Args:
+            location_string: e.g. "Gwoza, Borno State" or "Kafanchan"
+            state: State already known for the location, to tell apart LGAs
+                   sharing a name ("Surulere" is in Lagos and in Oyo)
+            state_names: Let a state's name stand for the LGA of the same name
+                         (with False, "Gombe, Nigeria" names no LGA)
+        Returns:
+            dict of state, lga, latitude, longitude, name (as matched) and
+            match ("exact" or "fuzzy"), or None
+        """
+        text = normalize_place(location_string)
+        if not text or names_foreign_country(text):
+            return None
+
+        # Longest names first; an unambiguous one settles the state for the rest
+        hits = sorted(self.exact.find_all(text), key=lambda hit: (hit[0] - hit[1], hit[0]))
+        if not state_names:
+            hits = [hit for hit in hits if hit[2] not in self.state_names]
+        if state is None:
+            for _, _, name in hits:
+                states = {self.entries[index]["state"] for index in self.names[name]}
+                if len(states) == 1:
+                    state = states.pop()
+                    break
+        for _, _, name in hits:
+            entry = self._entry(name, state)
+            if entry:
+                return {**entry, "name": name, "match": "exact"}
+
+        matches = []
+        for gram in self._fuzzy_candidates(text):
+            limit = min(GAZETTEER_MAX_DISTANCE, int(len(gram) * (1 - GAZETTEER_MIN_SIMILARITY)))
+            matches.extend((distance, -len(name), name) for distance, name in self.fuzzy.search(gram, limit))
+        for _, _, name in sorted(matches):
+            entry = self._entry(name, state)
+            if entry:
+                return {**entry, "name": name, "match": "fuzzy"}
+        return None
+
+
+_gazetteer = None
+
+
+def get_gazetteer():
+    """ Return the shared index, building it on first use """
+    global _gazetteer
+    if _gazetteer is None:
+        _gazetteer = GazetteerIndex.load()
+    return _gazetteer
+
+
+def resolve_place(location_string, state=None, state_names=True):
+    """ GazetteerIndex.lookup on the shared index; None if it is unavailable """
+    gazetteer = get_gazetteer()
+    if gazetteer is None or not location_string:
+        return None
+    return gazetteer.lookup(location_string, state, state_names)
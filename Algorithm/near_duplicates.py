@@ -0,0 +1,124 @@
+import logging,sys
+logger = logging.getLogger("runner")
+logging.basicConfig(
+    stream=sys.stdout,
+    level=logging.INFO,
+    format="%(asctime)s [%(levelname)s] %(message)s",
+)
+
+import re
+import zlib
+import random
+from config import NEAR_DUPLICATE_THRESHOLD, NEAR_DUPLICATE_MIN_SHARED, MINHASH_PERMUTATIONS, MINHASH_BANDS
+
+# Words that carry no information about which incident a headline reports
+STOPWORDS = {
+    "a", "an", "the", "and", "or", "of", "in", "on", "at", "to", "for", "from", "by", "with",
+    "as", "is", "are", "was", "were", "be", "been", "has", "have", "had", "its", "it", "this",
+    "that", "after", "over", "into", "amid", "says", "say", "said", "new", "breaking", "video",
+    "photos", "just", "nigeria", "nigerian",
+}
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+_PRIME = (1 << 61) - 1
+_rng = random.Random(20240601)
+# Fixed (a, b) pairs: h_i(x) = (a * x + b) mod p, one per permutation
+_PERMUTATIONS = [(_rng.randrange(1, _PRIME), _rng.randrange(0, _PRIME)) for _ in range(MINHASH_PERMUTATIONS)]
+_ROWS = MINHASH_PERMUTATIONS // MINHASH_BANDS
+
+
+def headline_tokens(text):
+    """ Normalized word set of a headline (lowercase, no punctuation or stopwords) """
+    return {token for token in TOKEN_PATTERN.findall((text or "").lower()) if token not in STOPWORDS and len(token) > 1}
+
+
+def minhash(tokens):
+    """ MinHash signature of a token set """
+    values = [zlib.crc32(token.encode("utf-8")) for token in tokens]
+    return [min((a * value + b) % _PRIME for value in values) for a, b in _PERMUTATIONS]
+
+
+def jaccard(first, second):
+    if not first or not second:
+        return 0.0
+    return len(first & second) / len(first | second)
+
+
+def places_agree(first, second):
+    """
+    Whether two place sets can describe the same incident: both name no place,
+    or one names the same places as the other and possibly more ("Zamfara" and
+    "Gusau, Zamfara", but not "Lagos" and "Kano", nor "Lagos" and no place)
+    """
+    if first == second:
+        return True
+    return bool(first and second) and (first <= second or second <= first)
+
+
+def collapse_near_duplicates(rows, text_key="headline", id_key="id", places=None):
+    """
+    Group headlines that report the same story (token Jaccard similarity of at
+    least NEAR_DUPLICATE_THRESHOLD and NEAR_DUPLICATE_MIN_SHARED words in
+    common). Candidate pairs come from MinHash LSH buckets (MINHASH_BANDS bands
+    of the signature), so only headlines sharing a bucket are compared; each
+    pair is then confirmed on the exact similarity. Headlines differing only by
+    place ("Flood kills two in Lagos" / "in Kano") are separate incidents, so
+    two groups are only joined when their places agree (see places_agree)
+    Args:
+        rows: Dicts with an id and a headline
+        text_key: Key of the headline
+        id_key: Key of the id
+        places: Function of a headline returning the set of places it names;
+                without it every headline is taken to name none
+    Returns:
+        (representatives, members): one row per group (its longest headline)
+        and a dict of representative id -> ids of the other rows in its group
+    """
+    tokens = [headline_tokens(row.get(text_key)) for row in rows]
+    parent = list(range(len(rows)))
+    # Places named anywhere in each group, kept on its root
+    group_places = [frozenset(places(row.get(text_key)) if places else ()) for row in rows]
+
+    def find(index):
+        while parent[index] != index:
+            parent[index] = parent[parent[index]]
+            index = parent[index]
+        return index
+
+    buckets = {}
+    for index, row_tokens in enumerate(tokens):
+        if not row_tokens:
+            continue
+        signature = minhash(row_tokens)
+        for band in range(MINHASH_BANDS):
+            key = (band, tuple(signature[band * _ROWS:(band + 1) * _ROWS]))
+            for other in buckets.setdefault(key, []):
+                root, other_root = find(index), find(other)
+                if (
+                    root != other_root
+                    and len(row_tokens & tokens[other]) >= NEAR_DUPLICATE_MIN_SHARED
+                    and jaccard(row_tokens, tokens[other]) >= NEAR_DUPLICATE_THRESHOLD
+                    and places_agree(group_places[root], group_places[other_root])
+                ):
+                    parent[root] = other_root
+                    group_places[other_root] = group_places[other_root] | group_places[root]
+            buckets[key].append(index)
+
+    groups = {}
+    for index in range(len(rows)):
+        groups.setdefault(find(index), []).append(index)
+
+    representatives = []
+    members = {}
+    for group in groups.values():
+        # The most complete headline speaks for the group
+        best = max(group, key=lambda index: (len(rows[index].get(text_key) or ""), -index))
+        representatives.append(rows[best])
+        others = [rows[index][id_key] for index in group if index != best]
+        if others:
+            members[rows[best][id_key]] = others
+
+    if members:
+        collapsed = sum(len(ids) for ids in members.values())
+        logging.info(f"Collapsed {collapsed} Near-Duplicate Headlines Into {len(members)} Groups")
+    return representatives, members
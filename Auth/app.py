@@ -1,13 +1,38 @@
+from contextlib import asynccontextmanager
+import logging
 from fastapi import FastAPI, Query, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
 from Auth.db_communicator import get_all_events, search_events
 from main import pipeline
 from Auth.verifier import verify_request
+from scrapper.browser import browser_manager
+from scrapper.parse_pool import shutdown_parse_pool
+from config import TELEGRAM_LISTENER
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Keep Chromium warm so /run-pipeline does not pay the launch cost on every call
+    try:
+        await browser_manager.start(keep_warm=True)
+    except Exception as e:
+        logging.error(f"Failed To Start Browser, It Will Be Launched On First Run: {e}")
+    if TELEGRAM_LISTENER:
+        from scrapper.telegram_listener import telegram_listener
+        try:
+            await telegram_listener.start()
+        except Exception as e:
+            logging.error(f"Failed To Start Telegram Listener, Channels Are Read By The Pipeline Only: {e}")
+    yield
+    if TELEGRAM_LISTENER:
+        await telegram_listener.stop()
+    await browser_manager.stop()
+    shutdown_parse_pool()
 
 app = FastAPI(
     title="FlashReport API",
     description="API interface for FlashReport event detection and retrieval",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 origins = [
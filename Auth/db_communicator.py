@@ -6,9 +6,7 @@ logging.basicConfig(
     format="%(asctime)s [%(levelname)s] %(message)s",
 )
 
-from scrapper.database import Database 
-
-db = Database()
+from scrapper.database import shared_database
 
 def get_all_events(limit=100):
     try:
@@ -48,7 +46,7 @@ def get_all_events(limit=100):
         LIMIT %s
         """
 
-        rows = db.fetch_all(query, (limit * 5,))
+        rows = shared_database("api").fetch_all(query, (limit * 5,))
 
         events = {}
 
@@ -139,7 +137,7 @@ def search_events(event_type, location=None, limit=15):
 
         params.append(limit * 5)
 
-        rows = db.fetch_all(query, tuple(params))
+        rows = shared_database("api").fetch_all(query, tuple(params))
 
         events = {}
 
@@ -1,3 +1,88 @@
 TIME_WINDOW_DAYS = 30
 CLUSTER_TIME = 4
 batch_size = 15
+
+# Scraping
+SCRAPE_CONCURRENCY = 4
+BLOCK_REQUESTS = True
+HTTP_TIMEOUT = 20
+HTTP_MAX_CONNECTIONS = 10
+
+# Local scraper state (HTTP validators, schedules, breakers)
+STATE_DIR = ".flashreport_state"
+BROWSER_MAX_USES = 20
+PARSE_WORKERS = 2
+DOM_EXTRACTION = True
+# 'bs4' - hand-written BeautifulSoup adapters, 'lxml' - compiled selector specs (scrapper.extractor)
+PARSE_ENGINE = "bs4"
+
+# Preprocessor: distinct date strings memoized (relative and absolute parsing)
+DATE_CACHE_SIZE = 4096
+
+# Known-article index: hashes of recently stored articles, dropped before preprocessing
+KNOWN_ARTICLES_DAYS = 7
+KNOWN_ARTICLES_MAX = 200000
+
+# Adaptive scheduling: each source is polled so a scrape finds about
+# SCHEDULE_TARGET_ARTICLES new articles, between the min and max interval (seconds)
+SCHEDULE_MIN_INTERVAL = 5 * 60
+SCHEDULE_MAX_INTERVAL = 4 * 60 * 60
+SCHEDULE_TARGET_ARTICLES = 3
+SCHEDULE_SMOOTHING = 0.3
+SCHEDULE_GRACE = 60
+
+# Per-source fault isolation: page load timeout (ms), total latency budget per source
+# including retries (seconds), retries with jittered exponential backoff, circuit breaker
+PAGE_LOAD_TIMEOUT = 60000
+SOURCE_BUDGET = 150
+SOURCE_RETRIES = 2
+RETRY_BACKOFF = 2
+BREAKER_THRESHOLD = 3
+BREAKER_COOLDOWN = 30 * 60
+
+# Raw page archive (zstd) and content-hash change detection: a source whose page
+# is unchanged since its last stored run is not parsed or written again
+SNAPSHOTS = True
+SNAPSHOT_DIR = f"{STATE_DIR}/snapshots"
+SNAPSHOT_KEEP = 48
+SNAPSHOT_MAX_AGE_DAYS = 7
+SNAPSHOT_LEVEL = 10
+
+# Telegram: channels read concurrently (at most TELEGRAM_CONCURRENCY at once). A FloodWait
+# up to TELEGRAM_MAX_FLOOD_WAIT seconds is slept off and retried, a longer one skips the channel
+TELEGRAM_CONCURRENCY = 3
+TELEGRAM_RETRIES = 2
+TELEGRAM_MAX_FLOOD_WAIT = 60
+# Channels are read from their last stored message id (sources.last_message_id); a channel
+# without one, or one not read for a long time, only goes back TELEGRAM_BACKFILL_HOURS
+TELEGRAM_BACKFILL_HOURS = 3
+# Real-time listener (scrapper.telegram_listener), started with the API when enabled:
+# messages are inserted every TELEGRAM_FLUSH_INTERVAL seconds or TELEGRAM_FLUSH_MAX messages
+TELEGRAM_LISTENER = False
+TELEGRAM_FLUSH_INTERVAL = 5
+TELEGRAM_FLUSH_MAX = 200
+
+# Near-duplicate headlines (same story from several sources) are sent to Gemini once:
+# MinHash LSH candidates confirmed at NEAR_DUPLICATE_THRESHOLD token Jaccard similarity,
+# sharing at least NEAR_DUPLICATE_MIN_SHARED content words and naming no conflicting places
+NEAR_DUPLICATE_THRESHOLD = 0.6
+NEAR_DUPLICATE_MIN_SHARED = 4
+MINHASH_PERMUTATIONS = 32
+MINHASH_BANDS = 16
+
+# LGA gazetteer (Algorithm/data/nigeria_lgas.csv): places that match no name exactly are
+# looked up within GAZETTEER_MAX_DISTANCE edits, if at least GAZETTEER_MIN_FUZZY_LENGTH letters
+# long and still GAZETTEER_MIN_SIMILARITY alike (1 - edits / length): one edit from 7 letters, two from 14
+GAZETTEER_MAX_DISTANCE = 2
+GAZETTEER_MIN_FUZZY_LENGTH = 7
+GAZETTEER_MIN_SIMILARITY = 0.85
+
+# Article deep fetch: lead paragraphs of keyword-matched candidates, sent to Gemini with the headline
+DEEP_FETCH = True
+DEEP_FETCH_CONCURRENCY = 6
+DEEP_FETCH_MAX_ARTICLES = 40
+DEEP_FETCH_DOMAIN_INTERVAL = 1.0
+DEEP_FETCH_TIMEOUT = 10
+DEEP_FETCH_CACHE_HOURS = 48
+LEAD_PARAGRAPHS = 3
+LEAD_MAX_CHARS = 600
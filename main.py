@@ -16,8 +16,9 @@ async def pipeline():
     logging.info("Pipeline Process Initialized")
     start = time.time()
     scrap = await main()
-    fill = filter_pipeline()
-    clus = clustering_pipeline()
+    # Gemini calls, article deep fetch and database work are blocking: keep them off the event loop
+    fill = await asyncio.to_thread(filter_pipeline)
+    clus = await asyncio.to_thread(clustering_pipeline)
     end = time.time()
     logging.info(f"Pipeline Process Completed. Time Taken {end-start:.2f} seconds")
     if scrap and fill and clus:
@@ -0,0 +1,2 @@
+-- Per-channel Telegram watermark: id of the newest message already ingested
+ALTER TABLE "sources" ADD COLUMN IF NOT EXISTS last_message_id BIGINT;
@@ -0,0 +1,2 @@
+-- Canonical form of an article's link (scrapper.canonical.canonical_url); NULL for Telegram messages
+ALTER TABLE "parsed_articles" ADD COLUMN IF NOT EXISTS canonical_url TEXT;
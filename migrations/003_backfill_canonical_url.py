@@ -0,0 +1,73 @@
+"""
+Re-key the scraped articles stored before canonical urls on them.
+
+Their hash was the hash of the title alone (the scraper hashed title + url but
+read the link from a key the adapters never set); articles are now keyed on
+the hash of their canonical url. Without this, every article still on a front
+page would be inserted again under its new hash, and produce its signals and
+events twice.
+
+Only rows whose hash is the legacy title hash (or already the canonical one)
+are touched, so Telegram messages keep theirs. Relative links are resolved
+against their source's homepage; rows whose link names no article ("#",
+"javascript:...") keep the title hash, which is still their key. A row is left as it is when its
+new hash or canonical url already belongs to another row (the article was
+stored again since); the oldest row of a url is the one re-keyed.
+"""
+import logging
+
+from scrapper.canonical import canonical_url
+from scrapper.preprocessor import compute_article_hash
+from scrapper.registry import SOURCES
+
+
+def apply(database):
+    """
+    Args:
+        database: Open Database connection
+    Returns:
+        True if the backfill succeeded
+    """
+    rows = database.fetch_all(
+        """
+        SELECT id, source_id, title, news_url, hash FROM parsed_articles
+        WHERE canonical_url IS NULL AND COALESCE(news_url, '') <> ''
+        ORDER BY scraped_at, id
+        """
+    )
+    taken_hashes = {row["hash"] for row in database.fetch_all("SELECT hash FROM parsed_articles")}
+    taken_urls = {
+        row["canonical_url"]
+        for row in database.fetch_all("SELECT canonical_url FROM parsed_articles WHERE canonical_url IS NOT NULL")
+    }
+
+    homepages = {source["source_id"]: source["url"] for source in SOURCES}
+
+    updates = []
+    skipped = 0
+    for row in rows:
+        url = canonical_url(row["news_url"], homepages.get(str(row["source_id"])))
+        if url is None:
+            continue
+        new_hash = compute_article_hash("", url)
+        if row["hash"] == new_hash:
+            if url in taken_urls:
+                skipped += 1
+                continue
+        elif row["hash"] == compute_article_hash(row["title"] or "", ""):
+            if url in taken_urls or new_hash in taken_hashes:
+                skipped += 1
+                continue
+        else:
+            continue
+        taken_urls.add(url)
+        taken_hashes.add(new_hash)
+        updates.append((url, new_hash, row["id"]))
+
+    logging.info(f"Re-Keying {len(updates)} Articles On Their Canonical Url, {skipped} Already Stored Again")
+    if not updates:
+        return True
+    return database.execute_batch(
+        'UPDATE "parsed_articles" SET canonical_url = %s, hash = %s WHERE id = %s',
+        updates,
+    )
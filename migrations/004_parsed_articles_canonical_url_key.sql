@@ -0,0 +1,2 @@
+-- One row per canonical url, built without locking out the scrapers' inserts
+CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS parsed_articles_canonical_url_key ON "parsed_articles" (canonical_url);
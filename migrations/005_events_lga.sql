@@ -0,0 +1,2 @@
+-- Local Government Area of an event, resolved from its location by the gazetteer (Algorithm/gazetteer.py)
+ALTER TABLE "events" ADD COLUMN IF NOT EXISTS lga TEXT;
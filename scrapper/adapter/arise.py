@@ -13,6 +13,24 @@ from pathlib import Path
 import time
 
 
+# Selector spec for in-page extraction (see scrapper.dom_extract)
+ARISE_SELECTORS = [
+    {"container": "article.snippet.typography.featured", "first": True,
+     "link": "h3 a", "image": "img.wp-post-image", "image_attrs": ["src"]},
+    {"container": "div.panel", "heading": "h2.panel-title",
+     "heading_match": ["LATEST NEWS", "GLOBAL", "AFRICA", "POLITICS", "BUSINESS", "SPORT", "ENTERTAINMENT"],
+     "item": "article.snippet", "link": "h3 a", "image": "img.wp-post-image", "image_attrs": ["src"]},
+    {"container": "div.epyt-gallery", "first": True, "item": "div.epyt-gallery-thumb",
+     "title": "div.epyt-gallery-title", "url_template": "https://www.youtube.com/watch?v={data-videoid}",
+     "image": "div.epyt-gallery-img", "image_style": True},
+    {"container": "div.arise-sidebar", "heading": "h2.panel-title", "heading_match": ["POPULAR"],
+     "item": "article.snippet", "link": "h3 a", "image": "img.wp-post-image", "image_attrs": ["src"]},
+    {"container": "div.arise-sidebar", "heading": "h2.panel-title", "heading_match": ["TOP STORIES"],
+     "item": "article.snippet", "link": "h3 a", "image": "img.wp-post-image", "image_attrs": ["src"]},
+    {"container": "div.arise-sidebar", "heading": "h2.panel-title", "heading_match": ["EXCLUSIVES"],
+     "item": "article.snippet", "link": "h3 a", "image": "img.wp-post-image", "image_attrs": ["src"]},
+]
+
 def parse_arise_news(html_content):
     """
     Parse Arise TV News website content and extract articles
@@ -11,6 +11,29 @@ logging.basicConfig(
     format="%(asctime)s [%(levelname)s] %(message)s",
 )
 
+# Selector spec for in-page extraction (see scrapper.dom_extract)
+BUSINESSDAY_SELECTORS = [
+    {"container": "div.top_stories", "first": True, "item": "article",
+     "link": "h2.post-title a", "time": "span.time"},
+    {"container": "div.main", "first": True, "item": "article", "limit": 1,
+     "link": "h2 a", "image": "img", "image_attrs": ["data-src", "src"], "time": "span.post-time"},
+    {"container": "div.recent", "first": True, "item": "article",
+     "link": "h2.post-title a", "time": "span.time"},
+    {"container": "div.pro-section", "first": True, "item": "article",
+     "link": "h2.post-title a", "image": "img", "image_attrs": ["data-src", "src"], "time": "span.post-date"},
+    {"container": "div.other-news-section", "first": True, "item": "article",
+     "link": "h2.post-title a", "image": "img", "image_attrs": ["data-src", "src"], "time": "span.post-time"},
+    {"container": "div.columnist-news", "first": True, "item": "article",
+     "link": "h2.post-title a", "time": "span.post-time"},
+    {"container": "div.opinion-news", "first": True, "item": "article",
+     "link": "p.post-title a", "time": "span.post-time"},
+    {"container": "section.news-block-2", "heading": "div.section-heading", "item": "article",
+     "link": "h2.post-title a", "image": "img", "image_attrs": ["data-src", "src"],
+     "time": "span.post-date, span.post-time"},
+    {"container": "section.news-block-3", "item": "article",
+     "link": "h2.post-title a", "image": "img", "image_attrs": ["data-src", "src"], "time": "span.post-date"},
+]
+
 def parse_businessday_news(html_content):
     """
     Parse BusinessDay website content and extract articles
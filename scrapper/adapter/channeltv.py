@@ -12,6 +12,26 @@ from datetime import datetime
 import time
 
 
+# Selector spec for in-page extraction (see scrapper.dom_extract)
+CHANNEL_SELECTORS = [
+    {"container": "div.leading-article", "first": True, "link": "h3.post-title a",
+     "image": "div.main__article-thumbnail img", "image_global": True, "image_attrs": ["data-lazy-src", "src"]},
+    {"container": "section.headlines", "first": True, "item": "article.post",
+     "link": "h3.post-title a, h3.sumry-title a", "image": "img", "image_attrs": ["data-lazy-src", "src"],
+     "time": "div.post_time span"},
+    {"container": "section.features", "first": True, "item": "article.post",
+     "link": "h3.post-title a, h3.sumry-title a", "image": "img", "image_attrs": ["data-lazy-src", "src"]},
+    {"container": "section.more_stories", "first": True, "item": "article.post",
+     "link": "h3.post-title a, h3.sumry-title a", "image": "img", "image_attrs": ["data-lazy-src", "src"]},
+    {"container": "div.latest_stories", "first": True, "item": "article.post",
+     "link": "h3.post-title a, h3.sumry-title a", "image": "img", "image_attrs": ["data-lazy-src", "src"],
+     "time": "div.post_time span"},
+    {"container": "section.sports", "first": True, "item": "article.post",
+     "link": "h3.post-title a, h3.sumry-title a", "image": "img", "image_attrs": ["data-lazy-src", "src"]},
+    {"container": "section.politics", "first": True, "item": "article.post",
+     "link": "h3.post-title a, h3.sumry-title a", "image": "img", "image_attrs": ["data-lazy-src", "src"]},
+]
+
 def parse_channel_news(html_content):
     """
     Parse Channels TV website content and extract articles
@@ -0,0 +1,166 @@
+import logging,sys
+logger = logging.getLogger("runner")
+logging.basicConfig(
+    stream=sys.stdout,
+    level=logging.INFO,
+    format="%(asctime)s [%(levelname)s] %(message)s",
+)
+
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from lxml import etree
+
+# Feed adapter: RSS 2.0, Atom and Google News sitemaps, parsed incrementally.
+# Produces the same {title, news_url, image_url, published_at} records as the
+# HTML adapters, with published_at as an ISO timestamp taken from the feed.
+
+ITEM_TAGS = {"item", "entry", "url"}
+
+
+def _local(tag):
+    return tag.rsplit("}", 1)[-1] if isinstance(tag, str) else ""
+
+
+def _child(elem, name):
+    for child in elem:
+        if _local(child.tag) == name:
+            return child
+    return None
+
+
+def _text(elem):
+    return " ".join((elem.text or "").split()) if elem is not None else ""
+
+
+def to_iso(value):
+    """
+    Normalize an RFC 822 (RSS pubDate) or ISO 8601 (Atom, sitemaps) date
+    Returns:
+        ISO timestamp or None when the date cannot be read
+    """
+    value = (value or "").strip()
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        try:
+            parsed = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.isoformat()
+
+
+def _image(elem):
+    """ First image of an item: media:content/thumbnail, an image enclosure or image:image/image:loc """
+    for child in elem.iter():
+        name = _local(child.tag)
+        if name in ("content", "thumbnail") and child.get("url") and child.get("medium", "image") == "image":
+            return child.get("url")
+        if name == "enclosure" and child.get("url") and (child.get("type") or "").startswith("image"):
+            return child.get("url")
+        if name == "image" and _child(child, "loc") is not None:
+            return _text(_child(child, "loc"))
+    return None
+
+
+def item_to_record(elem):
+    """
+    Turn one feed element (RSS item, Atom entry or sitemap url) into an article record
+    Returns:
+        record dict or None when it has no title or link
+    """
+    kind = _local(elem.tag)
+    if kind == "url":
+        news = _child(elem, "news")
+        if news is None:
+            return None
+        title = _text(_child(news, "title"))
+        link = _text(_child(elem, "loc"))
+        published = _text(_child(news, "publication_date"))
+    elif kind == "entry":
+        title = _text(_child(elem, "title"))
+        link = ""
+        for child in elem:
+            if _local(child.tag) == "link" and child.get("rel", "alternate") == "alternate":
+                link = child.get("href", "")
+                break
+        published = _text(_child(elem, "published")) or _text(_child(elem, "updated"))
+    else:
+        title = _text(_child(elem, "title"))
+        link = _text(_child(elem, "link"))
+        published = _text(_child(elem, "pubDate"))
+
+    if not title or not link:
+        return None
+    record = {"title": title, "news_url": link, "image_url": _image(elem)}
+    published_at = to_iso(published)
+    if published_at:
+        record["published_at"] = published_at
+    return record
+
+
+class FeedParser:
+    """
+    Incremental feed parser: feed() it chunks as they arrive from the network and
+    each item is turned into a record and freed as soon as its closing tag is read,
+    so memory stays flat however long the feed is
+    """
+
+    def __init__(self):
+        self._parser = etree.XMLPullParser(
+            events=("end",), recover=True, resolve_entities=False, no_network=True
+        )
+        self.records = []
+        self._seen = set()
+
+    def feed(self, chunk):
+        self._parser.feed(chunk)
+        self._drain()
+
+    def close(self):
+        """
+        Finish parsing
+        Returns:
+            records: List of article records, deduplicated by title
+        """
+        try:
+            self._parser.close()
+        except etree.XMLSyntaxError as e:
+            logging.warning(f"Feed Ended With Malformed XML: {e}")
+        self._drain()
+        return self.records
+
+    def _drain(self):
+        for _, elem in self._parser.read_events():
+            if _local(elem.tag) not in ITEM_TAGS:
+                continue
+            record = item_to_record(elem)
+            if record and record["title"] not in self._seen:
+                self._seen.add(record["title"])
+                self.records.append(record)
+            # Free the finished item and everything before it
+            elem.clear()
+            parent = elem.getparent()
+            if parent is not None:
+                while elem.getprevious() is not None:
+                    del parent[0]
+
+
+def parse_feed(content):
+    """
+    Parse a complete RSS/Atom/news sitemap document
+    Args:
+        content: Feed XML (bytes or str)
+    Returns:
+        records: List of article records, or None on failure
+    """
+    try:
+        parser = FeedParser()
+        parser.feed(content.encode("utf-8") if isinstance(content, str) else content)
+        return parser.close()
+    except Exception as e:
+        logging.error(f"An Error Occurred When Parsing Feed: {e}")
+        return None
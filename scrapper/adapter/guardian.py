@@ -11,6 +11,35 @@ logging.basicConfig(
     format="%(asctime)s [%(levelname)s] %(message)s",
 )
 
+# Selector spec for in-page extraction (see scrapper.dom_extract)
+GUARDIAN_SELECTORS = [
+    {"container": "div.breaking-news-widget", "first": True, "link": "a", "no_image": True},
+    {"container": "section.top-section", "first": True, "item": "article.top-news-article", "limit": 1,
+     "link": "h2.post-title a", "image": "img", "image_attrs": ["src"]},
+    {"container": "section.top-section", "first": True, "item": "article.top-section-news-widget-one",
+     "link": "h2.post-title a", "image": "img", "image_attrs": ["src", "data-src"]},
+    {"container": "div.latest-news-top-section", "first": True, "item": "article",
+     "link": "h2 a", "time": "div.post-meta span:nth-of-type(2)"},
+    {"container": "section.news-group-one", "heading": "header",
+     "item": "article.news-type-one, article.news-type-two, article.news-type-three",
+     "link": "h2.post-title a", "image": "img", "image_attrs": ["data-src", "src"], "time": "span.post-date"},
+    {"container": "section.news-group-two", "heading": "header", "item": "article.news-type-four",
+     "link": "h2.post-title a", "image": "img", "image_attrs": ["data-src", "src"], "time": "p.post-meta"},
+    {"container": "section.news-group-three", "heading": "header",
+     "item": "article.news-type-five, article.news-type-two",
+     "link": "h2.post-title a", "image": "img", "image_attrs": ["data-src", "src"], "time": "span.post-date"},
+    {"container": "section.guardian-life-section", "first": True, "item": "article",
+     "link": "h2.post-title a", "image": "img", "image_attrs": ["data-src", "src"]},
+    {"container": "section.gwoman-section", "first": True, "item": "article",
+     "link": "h2.post-title a", "image": "img", "image_attrs": ["data-src", "src"], "time": "p.post-date"},
+    {"container": "section.gangels-section", "first": True, "item": "article",
+     "link": "h2.post-title a", "image": "img", "image_attrs": ["data-src", "src"], "time": "span.post-date"},
+    {"container": "section.gtv-section", "first": True, "item": "article",
+     "link": "h2.post-title a", "image": "img", "image_attrs": ["data-src", "src"], "time": "p.post-date"},
+    {"container": "section.marie-claire-section", "first": True, "item": "article",
+     "link": "h2.post-title a", "image": "img", "image_attrs": ["data-src", "src"], "time": "span.post-date"},
+]
+
 def parse_guardian_news(html_content):
     """
     Parse The Guardian Nigeria website content and extract articles
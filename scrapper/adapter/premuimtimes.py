@@ -11,6 +11,17 @@ from bs4 import BeautifulSoup
 from datetime import datetime
 import time
 
+# Selector spec for in-page extraction (see scrapper.dom_extract)
+PREMUIMTIMES_SELECTORS = [
+    {"container": "article.jeg_post.jeg_hero_item_1", "first": True, "link": "h2.jeg_post_title a",
+     "image": "div.thumbnail-container img", "image_attrs": ["data-src", "src"], "time": "div.jeg_meta_date a"},
+    {"container": "div.jeg_postblock_21, div.jeg_postblock_22, div.jeg_postblock_39", "item": "article.jeg_post",
+     "link": "h3.jeg_post_title a", "image": "div.thumbnail-container img", "image_attrs": ["data-src", "src"],
+     "time": "div.jeg_meta_date a"},
+    {"container": "div.jeg_newsfeed_list", "first": True, "item": "div.jeg_newsfeed_item",
+     "link": "h3.jeg_post_title a", "image": "img", "image_attrs": ["data-src", "src"]},
+]
+
 def parse_premuimtimes_news(html_content):
     """
     Parse Premium Times website content and extract articles
@@ -11,6 +11,22 @@ from datetime import datetime
 from pathlib import Path
 import time
 
+# Selector spec for in-page extraction (see scrapper.dom_extract)
+PUNCH_SELECTORS = [
+    {"container": "div.just-in-timeline", "first": True, "item": "li.new-item",
+     "link": "h3.entry-title a", "time": "div.meta-time"},
+    {"container": "div.feature-article", "first": True,
+     "link": "h2.post-title a", "image": "img", "image_attrs": ["data-src", "src"]},
+    {"container": "div.top-news", "first": True, "item": "article",
+     "link": "h2.post-title a", "image": "img", "image_attrs": ["data-src", "src"]},
+    {"container": "div.col-lg-12.nine-post", "first": True, "item": "div.news-widget-1", "limit": 1,
+     "link": "h2.post-title a", "image": "img", "image_attrs": ["data-src", "src"]},
+    {"container": "div.col-lg-12.nine-post", "first": True, "item": "div.news-widget-2 article",
+     "link": "h2.post-title a", "image": "img", "image_attrs": ["data-src", "src"]},
+    {"container": "div.news-section-three", "item": "article",
+     "link": "h2.post-title a", "image": "img", "image_attrs": ["data-src", "src"]},
+]
+
 def parse_punch_news(html_content):
     """
     Parse Punch News website content and extract articles
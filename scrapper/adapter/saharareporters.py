@@ -9,6 +9,13 @@ logging.basicConfig(
     format="%(asctime)s [%(levelname)s] %(message)s",
 )
 
+# Selector spec for in-page extraction (see scrapper.dom_extract)
+SAHARAREPORTERS_SELECTORS = [
+    {"item": "div.node--type-article", "link": "h2.title a", "absolute": True,
+     "image": "img[property='schema:image']", "image_attrs": ["src"],
+     "time_pattern": r"(January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},\s+\d{4}"},
+]
+
 def parse_saharareporters_news(html_content):
     try:
         start = time.time()
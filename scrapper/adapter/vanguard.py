@@ -12,6 +12,27 @@ from datetime import datetime
 import time
 
 
+# Selector spec for in-page extraction (see scrapper.dom_extract)
+VANGUARD_SELECTORS = [
+    {"container": "div.section-format-vertical_list", "first": True, "item": "article.entry",
+     "link": "h3.entry-title a", "image": "img", "image_attrs": ["data-lazy-src", "src"],
+     "time": "div.entry-date"},
+    {"container": "div.section-content-featured",
+     "link": "h3.entry-title a", "image": "img", "image_attrs": ["data-lazy-src", "src"]},
+    {"container": "section.section-category-preview", "first": True,
+     "heading": "h2.heading-title", "heading_match": ["Politics"], "item": "article.entry-card",
+     "link": "h3.entry-title a", "image": "img", "image_attrs": ["data-lazy-src", "src"]},
+    {"container": "div.section-fulwidth", "heading": "h2.heading-title",
+     "item": "div.section-content-entry-list article.entry-card",
+     "link": "h3.entry-title a", "image": "img", "image_attrs": ["data-lazy-src", "src"]},
+    {"container": "div.section-fulwidth", "heading": "h2.heading-title",
+     "heading_match": ["Metro", "Entertainment", "Sports", "Business"], "item": "article.entry-card",
+     "link": "h3.entry-title a", "image": "img", "image_attrs": ["data-lazy-src", "src"]},
+    {"container": "div.section-format-horizontal_list", "first": True, "item": "article.entry",
+     "link": "h3.entry-title a", "image": "img", "image_attrs": ["data-lazy-src", "src"],
+     "time": "div.entry-date"},
+]
+
 def parse_vanguard_news(html_content):
     """
     Parse Vanguard News website content and extract articles
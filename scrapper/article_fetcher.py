@@ -0,0 +1,179 @@
+import hashlib
+import json
+import logging
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from urllib.parse import urlsplit
+
+import httpx
+import lxml.html
+
+from scrapper.fetcher import HTTP_HEADERS
+from config import (
+    STATE_DIR,
+    DEEP_FETCH_CONCURRENCY,
+    DEEP_FETCH_MAX_ARTICLES,
+    DEEP_FETCH_DOMAIN_INTERVAL,
+    DEEP_FETCH_TIMEOUT,
+    DEEP_FETCH_CACHE_HOURS,
+    LEAD_PARAGRAPHS,
+    LEAD_MAX_CHARS,
+)
+
+logger = logging.getLogger("runner")
+logging.basicConfig(
+    stream=sys.stdout,
+    level=logging.INFO,
+    format="%(asctime)s [%(levelname)s] %(message)s",
+)
+
+CACHE_DIR = Path(STATE_DIR) / "article_cache"
+
+# Per-domain politeness: a request to a host waits until DEEP_FETCH_DOMAIN_INTERVAL
+# has passed since the previous one
+_domain_locks = {}
+_domain_next = {}
+_domain_guard = threading.Lock()
+
+# Containers that usually hold the article body, tried in order
+_BODY_XPATHS = [
+    "//article",
+    "//*[contains(@class, 'entry-content') or contains(@class, 'post-content') "
+    "or contains(@class, 'article-body') or contains(@class, 'field--name-body')]",
+]
+_NOISE_XPATH = "//script | //style | //noscript | //nav | //header | //footer | //aside | //form | //figure"
+
+
+def _cache_path(url):
+    return CACHE_DIR / f"{hashlib.sha256(url.encode('utf-8')).hexdigest()}.json"
+
+
+def read_cache(url):
+    """ Cached lead of a url, or None when missing or older than DEEP_FETCH_CACHE_HOURS """
+    try:
+        path = _cache_path(url)
+        if not path.exists():
+            return None
+        with open(path, "r", encoding="utf-8") as f:
+            entry = json.load(f)
+        if time.time() - entry.get("fetched_at", 0) > DEEP_FETCH_CACHE_HOURS * 3600:
+            return None
+        return entry
+    except Exception:
+        return None
+
+
+def prune_cache():
+    """ Delete cached leads older than DEEP_FETCH_CACHE_HOURS (they are never read again) """
+    if not CACHE_DIR.exists():
+        return
+    cutoff = time.time() - DEEP_FETCH_CACHE_HOURS * 3600
+    for path in CACHE_DIR.glob("*.json"):
+        try:
+            if path.stat().st_mtime < cutoff:
+                path.unlink(missing_ok=True)
+        except OSError:
+            continue
+
+
+def write_cache(url, lead):
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(_cache_path(url), "w", encoding="utf-8") as f:
+            json.dump({"url": url, "lead": lead, "fetched_at": time.time()}, f)
+    except Exception as e:
+        logging.warning(f"Failed To Cache Article {url}: {e}")
+
+
+def extract_lead(html_content):
+    """
+    Extract the opening paragraphs of an article page
+    Args:
+        html_content: Raw HTML of the article
+    Returns:
+        Lead text (up to LEAD_PARAGRAPHS paragraphs, LEAD_MAX_CHARS characters) or ""
+    """
+    root = lxml.html.document_fromstring(html_content)
+    for node in root.xpath(_NOISE_XPATH):
+        node.drop_tree()
+
+    body = root
+    for xpath in _BODY_XPATHS:
+        found = root.xpath(xpath)
+        if found:
+            body = found[0]
+            break
+
+    paragraphs = []
+    for p in body.iter("p"):
+        text = " ".join(p.text_content().split())
+        # Short paragraphs are bylines, captions and "Read also" links
+        if len(text) >= 40:
+            paragraphs.append(text)
+        if len(paragraphs) >= LEAD_PARAGRAPHS:
+            break
+    return " ".join(paragraphs)[:LEAD_MAX_CHARS]
+
+
+def _wait_for_domain(url):
+    host = urlsplit(url).hostname or ""
+    with _domain_guard:
+        lock = _domain_locks.setdefault(host, threading.Lock())
+    with lock:
+        delay = _domain_next.get(host, 0) - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        _domain_next[host] = time.monotonic() + DEEP_FETCH_DOMAIN_INTERVAL
+
+
+def fetch_lead(client, url):
+    """
+    Lead paragraphs of one article, from the cache or the network
+    Returns:
+        Lead text, or None on failure
+    """
+    cached = read_cache(url)
+    if cached is not None:
+        return cached.get("lead")
+    try:
+        _wait_for_domain(url)
+        response = client.get(url)
+        response.raise_for_status()
+        lead = extract_lead(response.text)
+        write_cache(url, lead)
+        return lead
+    except Exception as e:
+        logging.warning(f"Failed To Fetch Article {url}: {e}")
+        return None
+
+
+def fetch_article_leads(candidates):
+    """
+    Fetch the article pages of keyword-matched candidates concurrently
+    Args:
+        candidates: List of {"id", "news_url"} dicts
+    Returns:
+        Dict of id -> lead text for the articles that have one
+    """
+    start = time.time()
+    prune_cache()
+    candidates = [c for c in candidates if (c.get("news_url") or "").startswith("http")]
+    candidates = candidates[:DEEP_FETCH_MAX_ARTICLES]
+    if not candidates:
+        return {}
+
+    with httpx.Client(
+        headers=HTTP_HEADERS,
+        timeout=DEEP_FETCH_TIMEOUT,
+        follow_redirects=True,
+        limits=httpx.Limits(max_connections=DEEP_FETCH_CONCURRENCY),
+    ) as client, ThreadPoolExecutor(max_workers=DEEP_FETCH_CONCURRENCY) as executor:
+        leads = list(executor.map(lambda c: fetch_lead(client, c["news_url"]), candidates))
+
+    results = {c["id"]: lead for c, lead in zip(candidates, leads) if lead}
+    end = time.time()
+    logging.info(f"Fetched Leads For {len(results)} Of {len(candidates)} Articles. Time Taken: {end - start:.2f} seconds")
+    return results
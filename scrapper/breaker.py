@@ -0,0 +1,57 @@
+import logging
+import sys
+import time
+
+from scrapper.state import StateStore
+from config import BREAKER_THRESHOLD, BREAKER_COOLDOWN
+
+logger = logging.getLogger("runner")
+logging.basicConfig(
+    stream=sys.stdout,
+    level=logging.INFO,
+    format="%(asctime)s [%(levelname)s] %(message)s",
+)
+
+# Per source: {"failures": consecutive failed runs, "open_until": epoch seconds}
+breakers = StateStore("breakers")
+
+
+def is_open(source_name, now=None):
+    """
+    Check whether a source's circuit is open (skipped until its cooldown ends).
+    Once the cooldown is over the next run is a trial: one success closes the
+    circuit, one failure opens it again
+    """
+    breaker = breakers.get(source_name)
+    if not breaker:
+        return False
+    return (now or time.time()) < breaker.get("open_until", 0)
+
+
+def record_success(source_name):
+    if breakers.get(source_name):
+        logging.info(f"Circuit Closed For {source_name}")
+        breakers.set(source_name, {"failures": 0, "open_until": 0})
+
+
+def record_failure(source_name, now=None):
+    """
+    Count a failed run; after BREAKER_THRESHOLD consecutive failures the source
+    is skipped for BREAKER_COOLDOWN seconds
+    Returns:
+        True if the circuit is now open
+    """
+    now = now or time.time()
+    breaker = breakers.get(source_name) or {"failures": 0, "open_until": 0}
+    failures = breaker["failures"] + 1
+    open_until = breaker["open_until"]
+    if failures >= BREAKER_THRESHOLD:
+        open_until = now + BREAKER_COOLDOWN
+        logging.warning(f"Circuit Opened For {source_name} After {failures} Failures, "
+                        f"Skipping For {BREAKER_COOLDOWN / 60:.0f} Minutes")
+    breakers.set(source_name, {"failures": failures, "open_until": open_until})
+    return failures >= BREAKER_THRESHOLD
+
+
+def save_breakers():
+    return breakers.save()
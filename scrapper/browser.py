@@ -0,0 +1,148 @@
+import asyncio
+import logging
+import sys
+import time
+
+from config import BROWSER_MAX_USES
+
+logger = logging.getLogger("runner")
+logging.basicConfig(
+    stream=sys.stdout,
+    level=logging.INFO,
+    format="%(asctime)s [%(levelname)s] %(message)s",
+)
+
+
+class BrowserManager:
+    """
+    Keeps one Chromium instance warm across pipeline runs.
+    Each run acquires the browser and opens its own contexts on it. The browser
+    is relaunched when it has crashed/disconnected, or after max_uses runs once
+    no run is using it.
+    """
+
+    def __init__(self, max_uses: int = BROWSER_MAX_USES):
+        self.max_uses = max_uses
+        self.keep_warm = False
+        self._playwright = None
+        self._browser = None
+        self._uses = 0
+        self._active = 0
+        self._lock = None
+
+    def _get_lock(self):
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        return self._lock
+
+    def is_healthy(self) -> bool:
+        """Check the browser is launched and still connected"""
+        return self._browser is not None and self._browser.is_connected()
+
+    async def _launch(self):
+        start = time.time()
+        if self._playwright is None:
+            # Imported here so importing the API does not load the Playwright driver
+            from playwright.async_api import async_playwright
+            self._playwright = await async_playwright().start()
+        self._browser = await self._playwright.chromium.launch(headless=True)
+        self._uses = 0
+        logging.info(f"Browser Launched. Time Taken: {time.time() - start:.2f} seconds")
+
+    async def _close(self):
+        if self._browser is not None:
+            try:
+                await self._browser.close()
+            except Exception as e:
+                logging.warning(f"Failed To Close Browser Cleanly: {e}")
+            self._browser = None
+        if self._playwright is not None:
+            try:
+                await self._playwright.stop()
+            except Exception as e:
+                logging.warning(f"Failed To Stop Playwright Cleanly: {e}")
+            self._playwright = None
+
+    async def start(self, keep_warm: bool = False):
+        """
+        Launch the browser ahead of the first run
+        Args:
+            keep_warm: Keep the browser open between runs (long-running API process)
+        """
+        self.keep_warm = keep_warm or self.keep_warm
+        async with self._get_lock():
+            if not self.is_healthy():
+                await self._close()
+                await self._launch()
+
+    async def stop(self):
+        """Close the browser and the Playwright driver"""
+        async with self._get_lock():
+            await self._close()
+            self.keep_warm = False
+            logging.info("Browser Stopped")
+
+    async def acquire(self):
+        """
+        Hand the warm browser to a run, relaunching it first if it crashed
+        or has been used max_uses times
+        Returns:
+            browser: Connected Playwright browser
+        """
+        async with self._get_lock():
+            if self._browser is not None and not self._browser.is_connected():
+                logging.warning("Browser Disconnected, Relaunching")
+                await self._close()
+            elif self._browser is not None and self._uses >= self.max_uses and self._active == 0:
+                logging.info(f"Browser Reached {self._uses} Uses, Relaunching")
+                await self._close()
+
+            if self._browser is None:
+                await self._launch()
+
+            self._uses += 1
+            self._active += 1
+            return self._browser
+
+    async def release(self):
+        """Return the browser after a run. Closes it unless it is kept warm"""
+        async with self._get_lock():
+            self._active = max(self._active - 1, 0)
+            if not self.keep_warm and self._active == 0:
+                await self._close()
+
+
+browser_manager = BrowserManager()
+
+
+class LazyBrowser:
+    """
+    A run's handle on the shared browser, acquired from the manager only the
+    first time a source has to be rendered, so a run served entirely by feeds
+    and plain HTTP never launches Chromium
+    """
+
+    def __init__(self, manager: BrowserManager = browser_manager):
+        self.manager = manager
+        self._acquiring = None
+
+    async def get(self):
+        """
+        Returns:
+            browser: Connected Playwright browser (acquired on the first call)
+        """
+        if self._acquiring is None:
+            self._acquiring = asyncio.ensure_future(self.manager.acquire())
+        # Shielded: a source cancelled by its budget must not abandon an acquire the run will release
+        return await asyncio.shield(self._acquiring)
+
+    async def release(self):
+        """Return the browser to the manager, if it was ever acquired"""
+        acquiring, self._acquiring = self._acquiring, None
+        if acquiring is None:
+            return
+        try:
+            await acquiring
+        except Exception:
+            return
+        await self.manager.release()
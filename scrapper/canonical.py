@@ -0,0 +1,95 @@
+import logging
+import re
+import sys
+from urllib.parse import urljoin, urlsplit, parse_qsl, urlencode
+
+
+logger = logging.getLogger("runner")
+logging.basicConfig(
+    stream=sys.stdout,
+    level=logging.INFO,
+    format="%(asctime)s [%(levelname)s] %(message)s",
+)
+
+# Query parameters that only track where a click came from
+TRACKING_PARAMS = {
+    "fbclid", "gclid", "dclid", "yclid", "msclkid", "igshid", "mc_cid", "mc_eid",
+    "ref", "ref_src", "referrer", "cmpid", "ocid", "ncid", "s_cid", "_ga", "share",
+    "amp", "outputtype", "utm",
+}
+TRACKING_PREFIXES = ("utm_", "__twitter", "_hs")
+
+# Host prefixes of mobile / AMP editions of the same site
+VARIANT_HOST = re.compile(r"^(?:www|m|mobile|amp)\.")
+# /amp or /amp/ as the first or last path segment
+AMP_PATH = re.compile(r"^/amp(?=/)|/amp/?$")
+
+# parsed_articles.canonical_url comes from migrations 002-004 (see scrapper.migrate)
+_canonical_column = False
+_canonical_warned = False
+
+
+def canonical_url(url, base_url=None):
+    """
+    Canonical form of an article link, so the same article reached through
+    tracking links, AMP pages or the mobile site has one url:
+    https, lowercased host without www/m/amp, no default port, no tracking
+    parameters (utm_*, fbclid, ...), remaining parameters sorted, no fragment,
+    no /amp path segment and no trailing slash.
+    Links that do not identify an article get no canonical url (the article is
+    then keyed on its title): fragments ("#"), other schemes ("javascript:",
+    "mailto:"), a site's front page, and relative links without a base_url
+    Args:
+        url: Article link
+        base_url: Page the link was found on, to resolve relative links against
+    Returns:
+        Canonical url, or None
+    """
+    url = (url or "").strip()
+    if not url or url.startswith("#"):
+        return None
+    if base_url:
+        url = urljoin(base_url, url)
+    parts = urlsplit(url)
+    if parts.scheme.lower() not in ("http", "https", "") or not parts.hostname:
+        return None
+
+    host = (parts.hostname or "").lower()
+    host = VARIANT_HOST.sub("", host)
+    try:
+        port = parts.port
+    except ValueError:
+        port = None
+    if port and port not in (80, 443):
+        host = f"{host}:{port}"
+
+    path = AMP_PATH.sub("", parts.path) or "/"
+    if len(path) > 1:
+        path = path.rstrip("/")
+
+    query = ""
+    if parts.query:
+        query = urlencode(sorted(
+            (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+            if key.lower() not in TRACKING_PARAMS and not key.lower().startswith(TRACKING_PREFIXES)
+        ))
+
+    if path == "/" and not query:
+        return None
+    return f"https://{host}{path}?{query}" if query else f"https://{host}{path}"
+
+
+def canonical_column_ready(database):
+    """
+    Whether parsed_articles.canonical_url exists (checked until it does, then cached).
+    Without it articles are stored without their canonical url
+    Args:
+        database: Open Database connection
+    """
+    global _canonical_column, _canonical_warned
+    if not _canonical_column:
+        _canonical_column = database.has_column("parsed_articles", "canonical_url")
+        if not _canonical_column and not _canonical_warned:
+            _canonical_warned = True
+            logging.warning("parsed_articles.canonical_url Missing, Storing Articles Without It (Run python -m scrapper.migrate)")
+    return _canonical_column
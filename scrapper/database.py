@@ -287,6 +287,26 @@ class Database:
             self.conn.rollback()
             return False
 
+    def has_column(self, table: str, column: str) -> bool:
+        """
+        Check whether a column exists (added by a migration, see scrapper.migrate)
+        
+        Args:
+            table: Table name
+            column: Column name
+            
+        Returns:
+            True if the column exists
+        """
+        row = self.fetch_one(
+            """
+            SELECT 1 AS found FROM information_schema.columns
+            WHERE table_schema = current_schema() AND table_name = %s AND column_name = %s
+            """,
+            (table, column),
+        )
+        return bool(row)
+
     def is_connected(self) -> bool:
         """Check if database connection is alive"""
         try:
@@ -331,4 +351,25 @@ class Database:
         if cls._pool:
             cls._pool.closeall()
             cls._pool = None
+            _shared.clear()
             logging.info("All database connections closed")
+
+
+# Long-lived connections of modules that keep one for the life of the process
+_shared = {}
+
+
+def shared_database(name: str) -> Database:
+    """
+    Long-lived connection for a module, taken from the pool on first use
+    rather than at import, so importing the API needs no database
+    
+    Args:
+        name: Owner of the connection (one connection per name)
+        
+    Returns:
+        Database instance
+    """
+    if name not in _shared:
+        _shared[name] = Database()
+    return _shared[name]
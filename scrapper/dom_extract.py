@@ -0,0 +1,128 @@
+import logging
+import sys
+from datetime import datetime
+
+logger = logging.getLogger("runner")
+logging.basicConfig(
+    stream=sys.stdout,
+    level=logging.INFO,
+    format="%(asctime)s [%(levelname)s] %(message)s",
+)
+
+# Runs inside the page. Walks each adapter's selector spec and returns only
+# {title, news_url, image_url, published_at} records, deduplicated by title.
+#
+# Spec keys (all optional except one of link/title):
+#   container      CSS for the section(s); defaults to the whole document
+#   first          only use the first matching container
+#   heading        CSS of the section heading inside the container
+#   heading_match  keep the container only if its heading contains one of these (case-insensitive)
+#   item           CSS of the articles inside the container; defaults to the container itself
+#   limit          maximum number of items per container
+#   link           CSS of the article anchor (title text + href)
+#   title          CSS of the title text when it is not the anchor
+#   url_template   build the url from item attributes, e.g. "https://x/?v={data-id}"
+#   image          CSS of the image; image_attrs lists the attributes to try in order
+#   image_global   look the image up in the whole document instead of the item
+#   image_style    read the image from a background url(...) in the style attribute
+#   no_image       leave image_url out of the records (sections the adapter gives no image field)
+#   time           CSS of the element holding the publish time
+#   time_pattern   regex matched against the item text instead
+#   absolute       resolve relative urls against the page
+EXTRACT_SCRIPT = """
+(specs) => {
+    const clean = (text) => (text || '').replace(/\\s+/g, ' ').trim();
+    const records = [];
+    const seen = new Set();
+
+    for (const spec of specs) {
+        let containers = spec.container ? Array.from(document.querySelectorAll(spec.container)) : [document];
+        if (spec.first) containers = containers.slice(0, 1);
+
+        for (const container of containers) {
+            if (spec.heading) {
+                const heading = container.querySelector(spec.heading);
+                if (!heading) continue;
+                const headingText = clean(heading.textContent).toUpperCase();
+                const matches = spec.heading_match || [];
+                if (matches.length && !matches.some((m) => headingText.includes(m.toUpperCase()))) continue;
+            }
+
+            let items = spec.item ? Array.from(container.querySelectorAll(spec.item)) : [container];
+            if (spec.limit) items = items.slice(0, spec.limit);
+
+            for (const item of items) {
+                const link = spec.link ? item.querySelector(spec.link) : null;
+                const titleElem = spec.title ? item.querySelector(spec.title) : link;
+                if (!titleElem) continue;
+
+                const title = clean(titleElem.textContent);
+                if (!title || seen.has(title)) continue;
+
+                const record = {title: title, news_url: '', image_url: null};
+
+                if (link) {
+                    record.news_url = spec.absolute ? link.href : (link.getAttribute('href') || '');
+                } else if (spec.url_template) {
+                    record.news_url = spec.url_template.replace(/\\{([\\w-]+)\\}/g, (_, attr) => item.getAttribute(attr) || '');
+                }
+
+                if (spec.no_image) delete record.image_url;
+
+                if (spec.image) {
+                    const img = (spec.image_global ? document : item).querySelector(spec.image);
+                    if (img && spec.image_style) {
+                        const match = (img.getAttribute('style') || '').match(/url\\(([^)]*)\\)/);
+                        record.image_url = match ? match[1] : null;
+                    } else if (img) {
+                        let value = '';
+                        for (const attr of (spec.image_attrs || ['src'])) {
+                            value = img.getAttribute(attr);
+                            if (value) break;
+                        }
+                        value = value || '';
+                        record.image_url = (spec.absolute && value) ? new URL(value, document.baseURI).href : value;
+                    }
+                }
+
+                if (spec.time) {
+                    const timeElem = item.querySelector(spec.time);
+                    if (timeElem) record.published_at = clean(timeElem.textContent);
+                } else if (spec.time_pattern) {
+                    const match = new RegExp(spec.time_pattern).exec(clean(item.textContent));
+                    if (match) record.published_at = match[0];
+                }
+
+                seen.add(title);
+                records.push(record);
+            }
+        }
+    }
+    return records;
+}
+"""
+
+
+async def extract_in_page(page, selectors):
+    """
+    Run an adapter's selector spec inside the loaded page
+    Args:
+        page: Playwright page that has finished loading
+        selectors: The adapter's SELECTORS list
+    Returns:
+        records: List of article dicts
+    """
+    return await page.evaluate(EXTRACT_SCRIPT, selectors)
+
+
+def records_to_parsed_data(source_name, source_url, records):
+    """
+    Wrap in-page records in the same structure the parse_*_news functions return
+    """
+    return {
+        'source': source_name,
+        'source_url': source_url,
+        'scraped_at': datetime.now().isoformat(),
+        'articles': records,
+        'total_articles': len(records),
+    }
@@ -0,0 +1,301 @@
+import logging
+import re
+import sys
+import time
+from urllib.parse import urljoin
+
+import lxml.html
+from lxml import etree
+
+from scrapper.dom_extract import records_to_parsed_data
+
+logger = logging.getLogger("runner")
+logging.basicConfig(
+    stream=sys.stdout,
+    level=logging.INFO,
+    format="%(asctime)s [%(levelname)s] %(message)s",
+)
+
+# Compiled specs, cached per source name for the life of the process (or parser worker)
+_compiled_specs = {}
+
+# The CSS subset used by the selector specs: tags, .class, #id, [attr], [attr='value'],
+# :nth-of-type(n), and the descendant / child combinators
+_CSS_TOKEN = re.compile(
+    r"""
+      (?P<combinator>\s*>\s*|\s+)
+    | (?P<tag>\*|[a-zA-Z][\w-]*)
+    | \.(?P<cls>[\w-]+)
+    | \#(?P<id>[\w-]+)
+    | \[(?P<attr>[\w:-]+)(?:=(?P<quote>['"])(?P<value>.*?)(?P=quote))?\]
+    | :nth-of-type\((?P<nth>\d+)\)
+    """,
+    re.X,
+)
+
+
+def _quote(value):
+    return f"'{value}'" if "'" not in value else f'"{value}"'
+
+
+def _parse_css(selector):
+    """
+    Split one complex selector into compounds and combinators
+    Returns:
+        (compounds, combinators) where each compound is {"tag", "nth", "predicates"}
+    """
+    compounds = [{"tag": "*", "nth": None, "predicates": []}]
+    combinators = []
+    pos = 0
+    selector = selector.strip()
+    while pos < len(selector):
+        match = _CSS_TOKEN.match(selector, pos)
+        if not match:
+            raise ValueError(f"Unsupported selector: {selector!r}")
+        pos = match.end()
+        current = compounds[-1]
+
+        if match.group("combinator") is not None:
+            combinators.append(">" if ">" in match.group("combinator") else " ")
+            compounds.append({"tag": "*", "nth": None, "predicates": []})
+        elif match.group("tag"):
+            current["tag"] = match.group("tag")
+        elif match.group("cls"):
+            current["predicates"].append(
+                f"contains(concat(' ', normalize-space(@class), ' '), ' {match.group('cls')} ')"
+            )
+        elif match.group("id"):
+            current["predicates"].append(f"@id={_quote(match.group('id'))}")
+        elif match.group("attr"):
+            if match.group("value") is None:
+                current["predicates"].append(f"@{match.group('attr')}")
+            else:
+                current["predicates"].append(f"@{match.group('attr')}={_quote(match.group('value'))}")
+        elif match.group("nth"):
+            current["nth"] = int(match.group("nth"))
+
+    return compounds, combinators
+
+
+def _split_selector_list(css):
+    return [part for part in re.split(r",(?![^\[]*\])", css) if part.strip()]
+
+
+def css_to_xpath(css):
+    """
+    Translate a CSS selector (list) into an XPath selecting matching descendants
+    of the context node, in document order
+    """
+    expressions = []
+    for selector in _split_selector_list(css):
+        compounds, combinators = _parse_css(selector)
+        steps = []
+        for idx, compound in enumerate(compounds):
+            step = compound["tag"]
+            if compound["nth"]:
+                step += f"[{compound['nth']}]"
+            step += "".join(f"[{p}]" for p in compound["predicates"])
+
+            if idx > 0 and combinators[idx - 1] == ">":
+                steps.append(step)
+            elif compound["nth"]:
+                # nth-of-type needs the child step so the position counts siblings
+                steps.append(f"descendant-or-self::node()/{step}")
+            else:
+                steps.append(f"descendant::{step}")
+        expressions.append("/".join(steps))
+    return " | ".join(expressions)
+
+
+def css_to_self_test(css):
+    """
+    Translate a CSS selector (list) into an XPath that is non-empty when the
+    context node itself matches the selector
+    """
+    expressions = []
+    for selector in _split_selector_list(css):
+        compounds, combinators = _parse_css(selector)
+        condition = ""
+        for idx, compound in enumerate(compounds):
+            step = compound["tag"]
+            if compound["nth"]:
+                step += f"[count(preceding-sibling::{compound['tag']})={compound['nth'] - 1}]"
+            step += "".join(f"[{p}]" for p in compound["predicates"])
+            if idx > 0:
+                axis = "parent" if combinators[idx - 1] == ">" else "ancestor"
+                step += f"[{axis}::{condition}]"
+            condition = step
+        expressions.append(f"self::{condition}")
+    return " | ".join(expressions)
+
+
+def _first(css):
+    return etree.XPath(f"({css_to_xpath(css)})[1]") if css else None
+
+
+def compile_spec(selectors):
+    """
+    Precompile a selector spec (see scrapper.dom_extract for the keys).
+    Every section's container selector is merged into a single XPath union so
+    one pass over the document finds all containers; each container is then
+    assigned to its section(s) with a cheap self-test on the node
+    """
+    sections = []
+    container_selectors = []
+    for spec in selectors:
+        # A spec without a container treats every matching item as its own container
+        container_css = spec.get("container") or spec.get("item")
+        item_css = spec.get("item") if spec.get("container") else None
+        container_selectors.append(css_to_xpath(container_css))
+        sections.append({
+            "spec": spec,
+            "match": etree.XPath(css_to_self_test(container_css)),
+            "heading": _first(spec.get("heading")),
+            "items": etree.XPath(css_to_xpath(item_css)) if item_css else None,
+            "link": _first(spec.get("link")),
+            "title": _first(spec.get("title")),
+            "image": _first(spec.get("image")),
+            "time": _first(spec.get("time")),
+            "time_pattern": re.compile(spec["time_pattern"]) if spec.get("time_pattern") else None,
+            "url_template": re.compile(r"\{([\w-]+)\}") if spec.get("url_template") else None,
+        })
+    return {
+        "containers": etree.XPath(" | ".join(container_selectors)),
+        "sections": sections,
+    }
+
+
+# Text nodes of a subtree, leaving out script/style bodies and comments like BeautifulSoup does
+_TEXT_NODES = etree.XPath("descendant-or-self::text()[not(parent::script) and not(parent::style)]")
+
+
+def _text(node, separator=""):
+    """ Same result as BeautifulSoup's get_text(separator, strip=True) """
+    return separator.join(text.strip() for text in _TEXT_NODES(node) if text.strip())
+
+
+def _first_or_none(xpath, node):
+    if xpath is None:
+        return None
+    found = xpath(node)
+    return found[0] if found else None
+
+
+def extract_records(html_content, compiled, base_url=""):
+    """
+    Run a compiled spec over a page
+    Args:
+        html_content: Raw HTML Data
+        compiled: Result of compile_spec
+        base_url: Used to resolve relative urls for specs marked absolute
+    Returns:
+        records: List of {title, news_url, image_url, published_at} dicts, deduplicated by title
+    """
+    root = lxml.html.document_fromstring(html_content)
+    sections = compiled["sections"]
+
+    # Single traversal: every container of every section, in document order
+    buckets = [[] for _ in sections]
+    for node in compiled["containers"](root):
+        for idx, section in enumerate(sections):
+            if section["match"](node):
+                buckets[idx].append(node)
+
+    records = []
+    seen = set()
+    for section, containers in zip(sections, buckets):
+        spec = section["spec"]
+        if spec.get("first"):
+            containers = containers[:1]
+
+        for container in containers:
+            if section["heading"] is not None:
+                heading = _first_or_none(section["heading"], container)
+                if heading is None:
+                    continue
+                heading_text = _text(heading, " ").upper()
+                matches = spec.get("heading_match") or []
+                if matches and not any(m.upper() in heading_text for m in matches):
+                    continue
+
+            items = section["items"](container) if section["items"] is not None else [container]
+            if spec.get("limit"):
+                items = items[:spec["limit"]]
+
+            for item in items:
+                link = _first_or_none(section["link"], item)
+                title_elem = _first_or_none(section["title"], item) if section["title"] is not None else link
+                if title_elem is None:
+                    continue
+
+                title = _text(title_elem)
+                if not title or title in seen:
+                    continue
+
+                record = {"title": title, "news_url": "", "image_url": None}
+
+                if link is not None:
+                    href = link.get("href", "")
+                    record["news_url"] = urljoin(base_url, href) if spec.get("absolute") else href
+                elif section["url_template"] is not None:
+                    record["news_url"] = section["url_template"].sub(
+                        lambda m: item.get(m.group(1), ""), spec["url_template"]
+                    )
+
+                if spec.get("no_image"):
+                    del record["image_url"]
+
+                if section["image"] is not None:
+                    img = _first_or_none(section["image"], root if spec.get("image_global") else item)
+                    if img is not None and spec.get("image_style"):
+                        match = re.search(r"url\(([^)]*)\)", img.get("style", ""))
+                        record["image_url"] = match.group(1) if match else None
+                    elif img is not None:
+                        value = ""
+                        for attr in spec.get("image_attrs", ["src"]):
+                            value = img.get(attr)
+                            if value:
+                                break
+                        value = value or ""
+                        record["image_url"] = urljoin(base_url, value) if spec.get("absolute") and value else value
+
+                if section["time"] is not None:
+                    time_elem = _first_or_none(section["time"], item)
+                    if time_elem is not None:
+                        record["published_at"] = _text(time_elem)
+                elif section["time_pattern"] is not None:
+                    match = section["time_pattern"].search(_text(item, " "))
+                    if match:
+                        record["published_at"] = match.group(0)
+
+                seen.add(title)
+                records.append(record)
+
+    return records
+
+
+def extract_parsed_data(source_name, source_url, selectors, html_content):
+    """
+    Parse a page with a source's selector spec, returning the same structure as
+    the parse_*_news adapters. Module level so it can run in the parser process pool
+    Args:
+        source_name: Name of the source (compiled spec cache key)
+        source_url: Source homepage, base for relative urls
+        selectors: The source's selector spec
+        html_content: Raw HTML Data
+    Returns:
+        parsed_data: Parsed Data in JSON Format, or None on failure
+    """
+    try:
+        start = time.time()
+        if source_name not in _compiled_specs:
+            _compiled_specs[source_name] = compile_spec(selectors)
+
+        records = extract_records(html_content, _compiled_specs[source_name], source_url)
+        end = time.time()
+        logging.info(f"Extracted {len(records)} Articles From {source_name}. Time Taken: {end - start:.2f} seconds.")
+        return records_to_parsed_data(source_name, source_url, records)
+
+    except Exception as e:
+        logging.error(f"An Error Occurred When Extracting {source_name} Articles: {e}")
+        return None
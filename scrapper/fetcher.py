@@ -0,0 +1,129 @@
+import logging
+import sys
+
+import httpx
+
+from scrapper.state import StateStore
+from scrapper.adapter.feed import FeedParser
+from config import HTTP_TIMEOUT, HTTP_MAX_CONNECTIONS
+
+logger = logging.getLogger("runner")
+logging.basicConfig(
+    stream=sys.stdout,
+    level=logging.INFO,
+    format="%(asctime)s [%(levelname)s] %(message)s",
+)
+
+HTTP_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/131.0 Safari/537.36"
+    ),
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9",
+}
+
+FEED_ACCEPT = "application/rss+xml, application/atom+xml, application/xml;q=0.9, text/xml;q=0.8, */*;q=0.5"
+
+NOT_MODIFIED = 304
+
+validators = StateStore("http_validators")
+
+
+def create_http_client():
+    """ Create the pooled async HTTP client shared by all sources in a run """
+    return httpx.AsyncClient(
+        headers=HTTP_HEADERS,
+        timeout=HTTP_TIMEOUT,
+        follow_redirects=True,
+        limits=httpx.Limits(
+            max_connections=HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=HTTP_MAX_CONNECTIONS,
+        ),
+    )
+
+
+def uses_http(source):
+    """ Check whether a registry source should be tried over plain HTTP first """
+    return source.get("fetch") == 'http'
+
+
+def conditional_headers(url):
+    """ If-None-Match / If-Modified-Since headers from the validators stored for a url """
+    headers = {}
+    stored = validators.get(url) or {}
+    if stored.get("etag"):
+        headers["If-None-Match"] = stored["etag"]
+    if stored.get("last_modified"):
+        headers["If-Modified-Since"] = stored["last_modified"]
+    return headers
+
+
+def response_validators_of(response):
+    return {
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified"),
+    }
+
+
+async def fetch_http(client, url):
+    """
+    Conditional GET of a page using the validators stored from the last fetch
+    Args:
+        client: Pooled httpx.AsyncClient
+        url: Page to load
+    Returns:
+        (status_code, content, response_validators). content is None on 304 or failure
+    """
+    try:
+        response = await client.get(url, headers=conditional_headers(url))
+
+        if response.status_code == NOT_MODIFIED:
+            logging.info(f"{url} Not Modified Since Last Fetch")
+            return NOT_MODIFIED, None, validators.get(url)
+
+        response.raise_for_status()
+        return response.status_code, response.text, response_validators_of(response)
+
+    except Exception as e:
+        logging.warning(f"HTTP Fetch Failed For {url}: {e}")
+        return None, None, None
+
+
+async def fetch_feed(client, url):
+    """
+    Conditional GET of an RSS/Atom feed or news sitemap, parsed chunk by chunk
+    as it downloads so the whole document is never held in memory
+    Args:
+        client: Pooled httpx.AsyncClient
+        url: Feed url
+    Returns:
+        (status_code, records, response_validators). records is None on 304 or failure
+    """
+    try:
+        headers = {**conditional_headers(url), "Accept": FEED_ACCEPT}
+        async with client.stream("GET", url, headers=headers) as response:
+            if response.status_code == NOT_MODIFIED:
+                logging.info(f"{url} Not Modified Since Last Fetch")
+                return NOT_MODIFIED, None, validators.get(url)
+
+            response.raise_for_status()
+
+            feed_parser = FeedParser()
+            async for chunk in response.aiter_bytes():
+                feed_parser.feed(chunk)
+            return response.status_code, feed_parser.close(), response_validators_of(response)
+
+    except Exception as e:
+        logging.warning(f"Feed Fetch Failed For {url}: {e}")
+        return None, None, None
+
+
+def save_validators(url, response_validators):
+    """
+    Store validators for a url. Only call once the page's articles are stored,
+    otherwise a 304 could hide a page we never managed to read or keep
+    """
+    if response_validators and any(response_validators.values()):
+        validators.set(url, response_validators)
+        validators.save()
@@ -0,0 +1,95 @@
+import logging
+import sys
+from urllib.parse import urlparse
+
+logger = logging.getLogger("runner")
+logging.basicConfig(
+    stream=sys.stdout,
+    level=logging.INFO,
+    format="%(asctime)s [%(levelname)s] %(message)s",
+)
+
+# Resource types the adapters never read. Only the HTML (and img src attributes) matter
+BLOCKED_RESOURCE_TYPES = {"image", "media", "font", "stylesheet", "texttrack", "manifest"}
+
+# Ads, trackers and video embeds common to the news homepages
+BLOCKED_DOMAINS = {
+    "doubleclick.net",
+    "googlesyndication.com",
+    "googleadservices.com",
+    "googletagservices.com",
+    "googletagmanager.com",
+    "google-analytics.com",
+    "adservice.google.com",
+    "amazon-adsystem.com",
+    "adnxs.com",
+    "criteo.com",
+    "criteo.net",
+    "pubmatic.com",
+    "rubiconproject.com",
+    "openx.net",
+    "taboola.com",
+    "outbrain.com",
+    "mgid.com",
+    "scorecardresearch.com",
+    "quantserve.com",
+    "hotjar.com",
+    "chartbeat.com",
+    "connect.facebook.net",
+    "platform.twitter.com",
+    "onesignal.com",
+    "youtube.com",
+    "youtube-nocookie.com",
+    "ytimg.com",
+    "vimeo.com",
+    "jwplayer.com",
+    "jwpcdn.com",
+}
+
+def get_block_rules(rules):
+    """
+    Resolve the blocked resource types and domains for a source
+    Args:
+        rules: The source's block_rules overrides (see scrapper.registry)
+            block_resources / block_domains: added to the defaults
+            allow_resources / allow_domains: removed from the defaults
+    Returns:
+        (resource_types, domains) sets
+    """
+    rules = rules or {}
+    resources = (BLOCKED_RESOURCE_TYPES | rules.get("block_resources", set())) - rules.get("allow_resources", set())
+    domains = (BLOCKED_DOMAINS | rules.get("block_domains", set())) - rules.get("allow_domains", set())
+    return resources, domains
+
+
+def is_blocked_url(url, domains):
+    """ Check whether a request url belongs to one of the blocked domains (or their subdomains) """
+    host = (urlparse(url).hostname or "").lower()
+    return any(host == domain or host.endswith("." + domain) for domain in domains)
+
+
+async def install_request_blocking(context, rules=None):
+    """
+    Abort every request of a browser context that the adapters do not need
+    Args:
+        context: Playwright browser context (or page)
+        rules: block_rules overrides of the source the context is loading
+    Returns:
+        stats: Dict counting allowed and blocked requests, filled while the page loads
+    """
+    resources, domains = get_block_rules(rules)
+    stats = {"allowed": 0, "blocked": 0}
+
+    async def handle_route(route):
+        request = route.request
+        if request.resource_type != "document" and (
+            request.resource_type in resources or is_blocked_url(request.url, domains)
+        ):
+            stats["blocked"] += 1
+            await route.abort()
+        else:
+            stats["allowed"] += 1
+            await route.continue_()
+
+    await context.route("**/*", handle_route)
+    return stats
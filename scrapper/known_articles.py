@@ -0,0 +1,119 @@
+import logging
+import sys
+import threading
+from collections import OrderedDict
+
+from scrapper.database import Database
+from scrapper.preprocessor import article_hash, compute_article_hash
+from config import KNOWN_ARTICLES_DAYS, KNOWN_ARTICLES_MAX
+
+logger = logging.getLogger("runner")
+logging.basicConfig(
+    stream=sys.stdout,
+    level=logging.INFO,
+    format="%(asctime)s [%(levelname)s] %(message)s",
+)
+
+
+def _key(h):
+    """
+    Index key of a sha256 hex hash: its first 64 bits as an int, a quarter of the
+    memory of the hex string (collisions are negligible at KNOWN_ARTICLES_MAX entries)
+    """
+    return int(h[:16], 16)
+
+
+class KnownArticles:
+    """
+    Bounded in-process index of article hashes already stored in parsed_articles,
+    shared by the HTML scraper and the Telegram ingesters (batch and listener).
+    Filled from the database once per process and kept current after every insert,
+    so articles and messages seen before, including before a restart, are dropped
+    before they reach the database. Least recently stored hashes are evicted past
+    max_size, so memory stays flat however long the process runs (the database
+    ON CONFLICT still catches anything evicted)
+    """
+
+    def __init__(self, max_size: int = KNOWN_ARTICLES_MAX):
+        self.max_size = max_size
+        self.hashes = OrderedDict()
+        self.loaded = False
+        self._lock = threading.Lock()
+
+    def load(self, days: int = KNOWN_ARTICLES_DAYS) -> bool:
+        """
+        Warm the index with the hashes stored in the last few days
+        Args:
+            days: How far back to read parsed_articles
+        Returns:
+            True if the index was loaded
+        """
+        try:
+            with Database() as database:
+                rows = database.fetch_all(
+                    """
+                    SELECT hash FROM parsed_articles
+                    WHERE scraped_at >= NOW() - make_interval(days => %s)
+                    ORDER BY scraped_at DESC
+                    LIMIT %s
+                    """,
+                    (days, self.max_size),
+                )
+            # Oldest first, so eviction order matches insertion order
+            self.add(row["hash"] for row in reversed(rows) if row.get("hash"))
+            self.loaded = True
+            logging.info(f"Loaded {len(self.hashes)} Known Article Hashes")
+            return True
+        except Exception as e:
+            logging.warning(f"Failed To Load Known Articles, Relying On Database Conflicts: {e}")
+            return False
+
+    def add(self, hashes) -> None:
+        with self._lock:
+            for h in hashes:
+                key = _key(h)
+                self.hashes[key] = None
+                self.hashes.move_to_end(key)
+            while len(self.hashes) > self.max_size:
+                self.hashes.popitem(last=False)
+
+    def __contains__(self, h) -> bool:
+        return _key(h) in self.hashes
+
+    def __len__(self) -> int:
+        return len(self.hashes)
+
+    def filter_new(self, articles: list, base_url: str = None) -> list:
+        """
+        Drop the articles that are already stored, or repeated within the batch.
+        Each kept article gets its hash and canonical_url (see preprocessor.article_hash)
+        Args:
+            articles: Parsed articles of one source
+            base_url: Page the articles were parsed from (resolves relative links)
+        Returns:
+            The articles not seen before
+        """
+        new_articles = []
+        batch = set()
+        for article in articles:
+            h = article_hash(article, base_url)
+            if h in self or h in batch:
+                continue
+            # Rows stored before canonical urls (and not re-keyed by migration 003) carry the title hash
+            legacy = compute_article_hash(article.get("title") or "", article.get("url") or "")
+            if legacy and legacy in self:
+                continue
+            batch.add(h)
+            article["hash"] = h
+            new_articles.append(article)
+        return new_articles
+
+
+known_articles = KnownArticles()
+
+
+def get_known_articles():
+    """ Return the shared index, loading it from the database on first use """
+    if not known_articles.loaded:
+        known_articles.load()
+    return known_articles
@@ -0,0 +1,114 @@
+import argparse
+import importlib.util
+import logging
+import sys
+from pathlib import Path
+
+from scrapper.database import Database
+
+logger = logging.getLogger("runner")
+logging.basicConfig(
+    stream=sys.stdout,
+    level=logging.INFO,
+    format="%(asctime)s [%(levelname)s] %(message)s",
+)
+
+# Schema changes live in migrations/ and are applied in name order, once each,
+# by running `python -m scrapper.migrate` before deploying code that needs them.
+# A migration is a .sql file, or a .py file whose apply(database) returns True
+# (for data changes SQL alone cannot make). The application itself never alters the schema
+MIGRATIONS_DIR = Path(__file__).resolve().parent.parent / "migrations"
+
+MIGRATIONS_TABLE = """
+CREATE TABLE IF NOT EXISTS schema_migrations (
+    name TEXT PRIMARY KEY,
+    applied_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+)
+"""
+
+
+def list_migrations():
+    """ Migration files, in the order they are applied """
+    return sorted(
+        [*MIGRATIONS_DIR.glob("*.sql"), *MIGRATIONS_DIR.glob("*.py")],
+        key=lambda path: path.name,
+    )
+
+
+def applied_migrations(database):
+    """ Names of the migrations already applied """
+    return {row["name"] for row in database.fetch_all("SELECT name FROM schema_migrations")}
+
+
+def run_python_migration(database, path):
+    """ Load a .py migration and call its apply(database) """
+    try:
+        spec = importlib.util.spec_from_file_location(f"migrations.{path.stem}", path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return bool(module.apply(database))
+    except Exception as e:
+        logging.error(f"Migration {path.stem} Raised: {e}", exc_info=True)
+        database.conn.rollback()
+        return False
+
+
+def apply_migration(database, path):
+    """
+    Run one migration and record it as applied. SQL files run outside a
+    transaction block (so they may use CREATE INDEX CONCURRENTLY)
+    Returns:
+        True if the migration was applied
+    """
+    if path.suffix == ".py":
+        applied = run_python_migration(database, path)
+    else:
+        try:
+            # Close the transaction earlier reads opened: autocommit cannot change inside one
+            database.conn.commit()
+            database.conn.autocommit = True
+            applied = database.execute(path.read_text(encoding="utf-8"))
+        except Exception as e:
+            logging.error(f"Migration {path.stem} Raised: {e}", exc_info=True)
+            database.conn.rollback()
+            applied = False
+        finally:
+            database.conn.autocommit = False
+    if applied:
+        database.execute("INSERT INTO schema_migrations (name) VALUES (%s) ON CONFLICT DO NOTHING", (path.stem,))
+    return applied
+
+
+def migrate(dry_run=False):
+    """
+    Apply the pending migrations, stopping at the first one that fails
+    Args:
+        dry_run: Only list the pending migrations
+    Returns:
+        True if every migration is applied
+    """
+    with Database() as database:
+        if not database.execute(MIGRATIONS_TABLE):
+            return False
+        done = applied_migrations(database)
+        database.conn.commit()
+        pending = [path for path in list_migrations() if path.stem not in done]
+        if not pending:
+            logging.info("Schema Is Up To Date")
+            return True
+        for path in pending:
+            if dry_run:
+                logging.info(f"Pending Migration {path.stem}")
+                continue
+            logging.info(f"Applying Migration {path.stem}")
+            if not apply_migration(database, path):
+                logging.error(f"Migration {path.stem} Failed, Stopping")
+                return False
+        return True
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description="Apply the pending schema migrations in migrations/")
+    arg_parser.add_argument("--dry-run", action="store_true", help="Only list the pending migrations")
+    args = arg_parser.parse_args()
+    sys.exit(0 if migrate(args.dry_run) else 1)
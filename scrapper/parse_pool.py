@@ -0,0 +1,65 @@
+import asyncio
+import logging
+import multiprocessing
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from config import PARSE_WORKERS
+
+logger = logging.getLogger("runner")
+logging.basicConfig(
+    stream=sys.stdout,
+    level=logging.INFO,
+    format="%(asctime)s [%(levelname)s] %(message)s",
+)
+
+_executor = None
+
+
+def get_parse_pool():
+    """
+    Return the shared parser process pool, creating it on first use.
+    Workers are spawned (not forked) so they never inherit the event loop,
+    the Playwright driver or open database connections
+    """
+    global _executor
+    if _executor is None:
+        logging.info(f"Starting Parser Process Pool With {PARSE_WORKERS} Workers")
+        _executor = ProcessPoolExecutor(
+            max_workers=PARSE_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _executor
+
+
+def shutdown_parse_pool():
+    """Stop the parser workers (API shutdown)"""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=True, cancel_futures=True)
+        _executor = None
+        logging.info("Parser Process Pool Stopped")
+
+
+async def parse_html(parser, html_content):
+    """
+    Run an adapter's parse_*_news function outside the event loop
+    Args:
+        parser: Module-level adapter function (must be picklable)
+        html_content: Raw HTML Data
+    Returns:
+        parsed_data: The adapter's result
+    """
+    if PARSE_WORKERS <= 0:
+        return parser(html_content)
+
+    global _executor
+    loop = asyncio.get_running_loop()
+    try:
+        return await loop.run_in_executor(get_parse_pool(), parser, html_content)
+    except BrokenProcessPool as e:
+        # A worker died (e.g. OOM on a huge page); rebuild the pool on next use
+        logging.error(f"Parser Process Pool Broken, Parsing In A Thread Instead: {e}")
+        _executor = None
+        return await asyncio.to_thread(parser, html_content)
@@ -1,5 +1,7 @@
 from datetime import datetime, timedelta
 from dateutil import parser
+from collections import Counter
+from functools import lru_cache
 import re
 import hashlib
 
@@ -11,6 +13,53 @@ logging.basicConfig(
     format="%(asctime)s [%(levelname)s] %(message)s",
 )
 
+from scrapper.canonical import canonical_url
+from config import DATE_CACHE_SIZE
+
+RELATIVE_TIME_PATTERN = re.compile(r"(\d+)\s*(min|mins|minute|minutes|hr|hrs|hour|hours|day|days)")
+PATH_DATE_PATTERN = re.compile(r"(20\d{2})[/-](\d{2})(?:[/-](\d{2}))?")
+
+# Absolute formats the sources actually use, tried before dateutil
+DATE_FORMATS = (
+    "%b %d, %Y",            # Jan 5, 2026
+    "%B %d, %Y",            # January 5, 2026
+    "%d %B %Y",             # 5 January 2026
+    "%d %b %Y",             # 5 Jan 2026
+    "%B %d, %Y %I:%M %p",   # January 5, 2026 4:30 PM
+    "%b %d, %Y %I:%M %p",   # Jan 5, 2026 4:30 PM
+    "%d/%m/%Y",             # 05/01/2026
+)
+
+
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def relative_offset(text: str):
+    """
+    Offset of a relative time ('4 hrs ago', '15 mins ago', 'yesterday'),
+    memoized per distinct string
+    Returns:
+        timedelta, or None when the text is not a relative time
+    """
+    text = text.lower().strip()
+
+    if text == "yesterday":
+        return timedelta(days=1)
+
+    match = RELATIVE_TIME_PATTERN.search(text)
+    if not match:
+        return None
+
+    value = int(match.group(1))
+    unit = match.group(2)
+
+    if unit.startswith("min"):
+        return timedelta(minutes=value)
+    if unit.startswith("hr") or unit.startswith("hour"):
+        return timedelta(hours=value)
+    if unit.startswith("day"):
+        return timedelta(days=value)
+
+    return None
+
 
 def parse_relative_time(text: str, reference_time: datetime):
     """
@@ -25,31 +74,37 @@ def parse_relative_time(text: str, reference_time: datetime):
             logging.warning("No Data Found")
             return None
 
-        text = text.lower().strip()
-
-        if text == "yesterday":
-            return reference_time - timedelta(days=1)
-
-        match = re.search(r"(\d+)\s*(min|mins|minute|minutes|hr|hrs|hour|hours|day|days)", text)
-        if not match:
-            return None
-
-        value = int(match.group(1))
-        unit = match.group(2)
-
-        if unit.startswith("min"):
-            return reference_time - timedelta(minutes=value)
-        if unit.startswith("hr") or unit.startswith("hour"):
-            return reference_time - timedelta(hours=value)
-        if unit.startswith("day"):
-            return reference_time - timedelta(days=value)
-
-        return None
+        offset = relative_offset(text)
+        return reference_time - offset if offset is not None else None
     except Exception as e:
         logging.error(f"Error Parsing Relative Time. {e}")
         return None
 
 
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def parse_absolute_date(text: str):
+    """
+    Parse an absolute date: ISO 8601 and the formats in DATE_FORMATS directly,
+    anything else with dateutil. Memoized per distinct string
+    Returns:
+        datetime, or None when the text is not a date
+    """
+    text = text.strip()
+    try:
+        return datetime.fromisoformat(text)
+    except ValueError:
+        pass
+    for date_format in DATE_FORMATS:
+        try:
+            return datetime.strptime(text, date_format)
+        except ValueError:
+            pass
+    try:
+        return parser.parse(text)
+    except Exception:
+        return None
+
+
 def extract_date_from_string(text: str):
     """
     Extract YYYY/MM or YYYY/MM/DD from URL or image paths.
@@ -58,7 +113,7 @@ def extract_date_from_string(text: str):
         if not text:
             return None
 
-        match = re.search(r"(20\d{2})[/-](\d{2})(?:[/-](\d{2}))?", text)
+        match = PATH_DATE_PATTERN.search(text)
         if not match:
             return None
 
@@ -83,12 +138,65 @@ def compute_article_hash(title: str, url: str):
         return None
 
 
+def article_hash(article: dict, base_url: str = None):
+    """
+    Dedup key of a scraped article (the parsed_articles conflict column): the
+    hash of its canonical url, so a retitled headline or a tracking/AMP variant
+    of the link is the same article. Articles without a usable link fall back
+    to the title. Relative links are resolved against base_url (the source page).
+    Sets article["canonical_url"]
+    """
+    url = canonical_url(article.get("news_url") or article.get("url"), base_url)
+    article["canonical_url"] = url
+    if url:
+        return compute_article_hash("", url)
+    return compute_article_hash(article.get("title", ""), "")
+
+
+def resolve_published_at(article: dict, scraped_at: datetime):
+    """
+    Publication time of an article, from the best evidence it carries
+    Returns:
+        (published_at, source): source is one of PUBLISHED_AT_SOURCES
+    """
+    # Date text as the source printed it (adapters emit it as published_at; feeds as an ISO timestamp)
+    text = article.get("date_posted") or article.get("published_at")
+    if isinstance(text, str) and text.strip():
+        offset = relative_offset(text)
+        if offset is not None:
+            return scraped_at - offset, "relative"
+        published_at = parse_absolute_date(text)
+        if published_at:
+            return published_at, "absolute"
+
+    # Infer from image URL
+    published_at = extract_date_from_string(article.get("image_url"))
+    if published_at:
+        return published_at, "image_url"
+
+    # Infer from article URL
+    published_at = extract_date_from_string(article.get("news_url") or article.get("url"))
+    if published_at:
+        return published_at, "url"
+
+    # Fallback
+    return scraped_at, "scraped_at_fallback"
+
+
+PUBLISHED_AT_SOURCES = ("relative", "absolute", "image_url", "url", "scraped_at_fallback")
+
+
 def preprocessor(data: dict):
     """
-    Preprocess and normalize articles with:
-    - published_at timestamp
-    - published_at_source
+    Preprocess and normalize a whole adapter result in one pass:
+    - published_at timestamp of every article
     - article hash
+    - published_at_sources: share of the articles dated from each source
+      (relative time, absolute date, image url, article url, scrape time)
+    Args:
+        data: Adapter result ({'scraped_at', 'articles', ...})
+    Returns:
+        data with the articles normalized, or None on failure
     """
     try:
         logging.info("Preprocessing Step Initialized")
@@ -99,49 +207,25 @@ def preprocessor(data: dict):
             
         scraped_at = parser.isoparse(data["scraped_at"])
         articles = data.get("articles", [])
+        sources = Counter()
 
         for article in articles:
-            published_at = None
-            source = None
-
-            # Relative time first
-            if "date_posted" in article:
-                published_at = parse_relative_time(article["date_posted"], scraped_at)
-                if published_at:
-                    source = "date_posted_relative"
-
-            # Absolute date
-            if not published_at and article.get("date_posted"):
-                try:
-                    published_at = parser.parse(article["date_posted"])
-                    source = "date_posted_absolute"
-                except Exception:
-                    pass
-
-            # Infer from image URL
-            if not published_at:
-                published_at = extract_date_from_string(article.get("image_url"))
-                if published_at:
-                    source = "image_url"
-
-            # Infer from article URL
-            if not published_at:
-                published_at = extract_date_from_string(article.get("url"))
-                if published_at:
-                    source = "url"
-
-            # Fallback
-            if not published_at:
-                published_at = scraped_at
-                source = "scraped_at_fallback"
-
+            published_at, source = resolve_published_at(article, scraped_at)
+            sources[source] += 1
             article["published_at"] = published_at.isoformat()
 
-            # Compute unique hash
-            article["hash"] = compute_article_hash(article.get("title", ""), article.get("url", ""))
+            # Compute unique hash (already set when the known-articles filter ran)
+            if not article.get("hash"):
+                article["hash"] = article_hash(article, data.get("source_url"))
+
+        data["published_at_sources"] = {
+            source: round(sources[source] / len(articles), 3) for source in PUBLISHED_AT_SOURCES if sources[source]
+        }
+        if articles:
+            shares = ", ".join(f"{source} {share:.0%}" for source, share in data["published_at_sources"].items())
+            logging.info(f"Preprocessed {len(articles)} Articles. Published At Sources: {shares}")
         logging.info("Preprocessing Step Completed")
         return data
     except Exception as e:
-        logging.error(f"Failed To Preprocess Data")
+        logging.error(f"Failed To Preprocess Data: {e}")
         return None 
-    
@@ -0,0 +1,123 @@
+from functools import partial
+
+from config import PARSE_ENGINE
+
+from scrapper.adapter.punch import parse_punch_news, PUNCH_SELECTORS
+from scrapper.adapter.channeltv import parse_channel_news, CHANNEL_SELECTORS
+from scrapper.adapter.vanguard import parse_vanguard_news, VANGUARD_SELECTORS
+from scrapper.adapter.premuimtimes import parse_premuimtimes_news, PREMUIMTIMES_SELECTORS
+from scrapper.adapter.businessday import parse_businessday_news, BUSINESSDAY_SELECTORS
+from scrapper.adapter.saharareporters import parse_saharareporters_news, SAHARAREPORTERS_SELECTORS
+from scrapper.adapter.guardian import parse_guardian_news, GUARDIAN_SELECTORS
+from scrapper.adapter.arise import parse_arise_news, ARISE_SELECTORS
+from scrapper.extractor import extract_parsed_data
+
+# Every scraped news source, declared once.
+#   name         Source name (matches the sources table)
+#   url          Homepage to scrape
+#   source_id    UUID of the row in the sources table
+#   feed         RSS/Atom feed or news sitemap read before the homepage (None if the site has none).
+#                A poll is a few KB of XML with real publication dates; the homepage is only
+#                fetched when the feed fails or is empty
+#   fetch        'http'    - plain GET first, browser only when nothing is extracted
+#                'browser' - always rendered with Playwright (article lists built by JavaScript)
+#   selectors    Section -> selector spec, run in the page or by scrapper.extractor
+#   parser       Hand-written adapter. Optional: without it (or with PARSE_ENGINE = 'lxml') the
+#                selector spec is the parser, so a new source only needs an entry here
+#   block_rules  Request blocking overrides (see scrapper.interceptor)
+SOURCES = [
+    {
+        "name": "Punch Nigeria",
+        "url": "https://punchng.com",
+        "source_id": "431e3d96-3927-4481-be94-db8d6f2f9f5b",
+        "feed": "https://punchng.com/feed/",
+        "fetch": "http",
+        "selectors": PUNCH_SELECTORS,
+        "parser": parse_punch_news,
+        "block_rules": {},
+    },
+    {
+        "name": "Channels TV",
+        "url": "https://www.channelstv.com/",
+        "source_id": "b62f770e-7a5e-48a0-8187-b9e6477fe453",
+        "feed": None,
+        "fetch": "browser",
+        "selectors": CHANNEL_SELECTORS,
+        "parser": parse_channel_news,
+        "block_rules": {},
+    },
+    {
+        "name": "Vanguard Nigeria",
+        "url": "https://www.vanguardngr.com/",
+        "source_id": "0bdb95b0-c023-4ef1-9328-af977afce3bc",
+        "feed": "https://www.vanguardngr.com/feed/",
+        "fetch": "browser",
+        "selectors": VANGUARD_SELECTORS,
+        "parser": parse_vanguard_news,
+        "block_rules": {},
+    },
+    {
+        "name": "Premium Times Nigeria",
+        "url": "https://www.premiumtimesng.com",
+        "source_id": "74eea32e-d6a4-4688-81ff-126badd873c0",
+        "feed": "https://www.premiumtimesng.com/feed",
+        "fetch": "browser",
+        "selectors": PREMUIMTIMES_SELECTORS,
+        "parser": parse_premuimtimes_news,
+        "block_rules": {"block_domains": {"disqus.com"}},
+    },
+    {
+        "name": "BusinessDay Nigeria",
+        "url": "https://businessday.ng/",
+        "source_id": "d9fb80d4-4837-47eb-bf72-7d04e7d70c76",
+        "feed": "https://businessday.ng/feed/",
+        "fetch": "browser",
+        "selectors": BUSINESSDAY_SELECTORS,
+        "parser": parse_businessday_news,
+        "block_rules": {},
+    },
+    {
+        "name": "Sahara Reporters",
+        "url": "https://saharareporters.com/news",
+        "source_id": "6ce1b673-431c-4a11-9749-47643ca3a96f",
+        "feed": None,
+        "fetch": "http",
+        "selectors": SAHARAREPORTERS_SELECTORS,
+        "parser": parse_saharareporters_news,
+        "block_rules": {"block_resources": {"script"}},
+    },
+    {
+        "name": "The Guardian Nigeria",
+        "url": "https://guardian.ng/",
+        "source_id": "1f55e458-834b-4807-b209-004f0690f5f3",
+        "feed": "https://guardian.ng/feed/",
+        "fetch": "http",
+        "selectors": GUARDIAN_SELECTORS,
+        "parser": parse_guardian_news,
+        "block_rules": {},
+    },
+    {
+        "name": "Arise News TV",
+        "url": "https://www.arise.tv/",
+        "source_id": "7b907be0-59ce-4cba-b0d0-ef58034ea8f3",
+        "feed": None,
+        "fetch": "browser",
+        "selectors": ARISE_SELECTORS,
+        "parser": parse_arise_news,
+        "block_rules": {},
+    },
+]
+
+SOURCES_BY_NAME = {source["name"]: source for source in SOURCES}
+
+
+def get_parser(source):
+    """
+    Return the function that turns a source's HTML into parsed data:
+    its adapter if it has one and PARSE_ENGINE is 'bs4', otherwise the compiled
+    selector-spec extractor (same records, several times faster;
+    compare with tests/benchmark_parsers.py)
+    """
+    if source.get("parser") and PARSE_ENGINE == "bs4":
+        return source["parser"]
+    return partial(extract_parsed_data, source["name"], source["url"], source["selectors"])
@@ -0,0 +1,94 @@
+import argparse
+import logging
+import sys
+import time
+
+from scrapper.database import Database
+from scrapper.registry import SOURCES, SOURCES_BY_NAME, get_parser
+from scrapper.dom_extract import records_to_parsed_data
+from scrapper.preprocessor import preprocessor
+from scrapper.known_articles import KnownArticles
+from scrapper.snapshots import list_snapshots, load_snapshot, snapshot_time
+from scrapper.canonical import canonical_column_ready
+
+logger = logging.getLogger("runner")
+logging.basicConfig(
+    stream=sys.stdout,
+    level=logging.INFO,
+    format="%(asctime)s [%(levelname)s] %(message)s",
+)
+
+
+def replay_source(source, known, store=False):
+    """
+    Run a source's archived snapshots, oldest first, through the parse,
+    known-article filter and preprocess stages, as the live pipeline would.
+    Each snapshot is dated by when it was taken, so relative dates ("4 hrs ago")
+    resolve as they did live and replays are reproducible
+    Args:
+        source: Registry entry of the source
+        known: KnownArticles index shared by the replay
+        store: Insert the new articles into parsed_articles
+    Returns:
+        List of (snapshot path, parsed articles, new articles) per snapshot
+    """
+    parser = get_parser(source)
+    results = []
+    for path in list_snapshots(source["name"]):
+        payload = load_snapshot(path)
+        scraped_at = snapshot_time(path).isoformat()
+        if isinstance(payload, str):
+            parsed = parser(payload)
+        else:
+            parsed = records_to_parsed_data(source["name"], source["url"], payload)
+        if parsed is None:
+            logging.warning(f"Replay Failed To Parse {path}")
+            continue
+        parsed["scraped_at"] = scraped_at
+
+        parsed_count = len(parsed.get("articles", []))
+        parsed["articles"] = known.filter_new(parsed.get("articles", []), parsed.get("source_url") or source["url"])
+        data = preprocessor(parsed)
+        articles = data.get("articles", []) if data else []
+        known.add(article["hash"] for article in articles)
+
+        if store and articles:
+            for article in articles:
+                article['source_id'] = source["source_id"]
+                article['scraped_at'] = scraped_at
+            with Database() as database:
+                if not canonical_column_ready(database):
+                    for article in articles:
+                        article.pop('canonical_url', None)
+                database.insert('parsed_articles', articles, conflict_column = 'hash')
+
+        results.append((path, parsed_count, len(articles)))
+    return results
+
+
+def replay(source_names=None, store=False):
+    """
+    Replay the snapshot archive of the given sources (all by default)
+    Returns:
+        Dict of source name -> replay results
+    """
+    start = time.time()
+    sources = [SOURCES_BY_NAME[name] for name in source_names] if source_names else SOURCES
+    known = KnownArticles()
+    report = {}
+    for source in sources:
+        report[source["name"]] = replay_source(source, known, store)
+        snapshots = report[source["name"]]
+        logging.info(f"Replayed {source['name']}: {len(snapshots)} Snapshots, "
+                     f"{sum(new for _, _, new in snapshots)} New Articles")
+    end = time.time()
+    logging.info(f"Replay Completed. Time Taken: {end - start:.2f} seconds")
+    return report
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description="Replay archived homepage snapshots through the pipeline")
+    arg_parser.add_argument("sources", nargs="*", help="Source names (default: all)")
+    arg_parser.add_argument("--store", action="store_true", help="Insert the replayed articles into parsed_articles")
+    args = arg_parser.parse_args()
+    replay(args.sources, args.store)
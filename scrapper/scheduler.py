@@ -0,0 +1,91 @@
+import logging
+import sys
+import time
+
+from scrapper.state import StateStore
+from config import (
+    SCHEDULE_MIN_INTERVAL,
+    SCHEDULE_MAX_INTERVAL,
+    SCHEDULE_TARGET_ARTICLES,
+    SCHEDULE_SMOOTHING,
+    SCHEDULE_GRACE,
+)
+
+logger = logging.getLogger("runner")
+logging.basicConfig(
+    stream=sys.stdout,
+    level=logging.INFO,
+    format="%(asctime)s [%(levelname)s] %(message)s",
+)
+
+# Per source: {"last_run", "next_due", "interval", "rate"}, rate in new articles per hour
+schedules = StateStore("schedules")
+
+
+def is_due(source_name, now=None):
+    """
+    Check whether a source should be scraped on this run (new sources always are).
+    SCHEDULE_GRACE absorbs jitter in the external trigger so a source due a few
+    seconds after this run does not wait for the next one
+    """
+    schedule = schedules.get(source_name)
+    if not schedule:
+        return True
+    return (now or time.time()) + SCHEDULE_GRACE >= schedule.get("next_due", 0)
+
+
+def due_sources(sources, now=None):
+    """
+    Split the registry into the sources to scrape now and the ones still waiting
+    Returns:
+        (due, skipped) lists of registry entries
+    """
+    now = now or time.time()
+    due, skipped = [], []
+    for source in sources:
+        (due if is_due(source["name"], now) else skipped).append(source)
+    return due, skipped
+
+
+def record_yield(source_name, new_articles, now=None):
+    """
+    Update a source's polling interval from the new articles its last scrape found.
+    The publishing rate is smoothed across runs and the interval is set so the next
+    scrape should find about SCHEDULE_TARGET_ARTICLES new articles, within bounds
+    Args:
+        source_name: Name of the source
+        new_articles: New articles stored on this run
+        now: Run time (defaults to the current time)
+    Returns:
+        The new interval in seconds
+    """
+    now = now or time.time()
+    schedule = schedules.get(source_name) or {}
+    last_run = schedule.get("last_run")
+    interval = schedule.get("interval", SCHEDULE_MIN_INTERVAL)
+
+    if last_run:
+        hours = max(now - last_run, 1) / 3600
+        observed = new_articles / hours
+        rate = schedule.get("rate")
+        rate = observed if rate is None else SCHEDULE_SMOOTHING * observed + (1 - SCHEDULE_SMOOTHING) * rate
+        if rate > 0:
+            interval = SCHEDULE_TARGET_ARTICLES / rate * 3600
+        else:
+            interval = interval * 2
+    else:
+        # First observation: no elapsed time to turn the yield into a rate yet
+        rate = None
+
+    interval = min(max(interval, SCHEDULE_MIN_INTERVAL), SCHEDULE_MAX_INTERVAL)
+    schedules.set(source_name, {
+        "last_run": now,
+        "next_due": now + interval,
+        "interval": interval,
+        "rate": rate,
+    })
+    return interval
+
+
+def save_schedules():
+    return schedules.save()
@@ -1,21 +1,30 @@
+import asyncio
 import logging
+import random
 import sys
 import time
-from playwright.async_api import async_playwright
-
-from scrapper.adapter.punch import parse_punch_news
-from scrapper.adapter.channeltv import parse_channel_news
-from scrapper.adapter.vanguard import parse_vanguard_news
-from scrapper.adapter.premuimtimes import parse_premuimtimes_news
-from scrapper.adapter.businessday import parse_businessday_news
-from scrapper.adapter.saharareporters import parse_saharareporters_news
-from scrapper.adapter.guardian import parse_guardian_news
-from scrapper.adapter.arise import parse_arise_news
+
+from contextlib import asynccontextmanager
 from datetime import datetime
 
 from scrapper.database import Database
+from scrapper.registry import SOURCES, get_parser
 from scrapper.preprocessor import preprocessor
+from scrapper.known_articles import known_articles, get_known_articles
+from scrapper.scheduler import due_sources, record_yield, save_schedules
+from scrapper.breaker import is_open, record_success, record_failure, save_breakers
+from scrapper.snapshots import payload_hash, is_unchanged, save_snapshot
+from scrapper.canonical import canonical_column_ready
 from scrapper.telegram import scrape_recent_messages
+from scrapper.interceptor import install_request_blocking
+from scrapper.dom_extract import extract_in_page, records_to_parsed_data
+from scrapper.browser import LazyBrowser
+from scrapper.parse_pool import parse_html
+from scrapper.fetcher import create_http_client, fetch_http, fetch_feed, save_validators, uses_http, NOT_MODIFIED
+from config import (
+    SCRAPE_CONCURRENCY, BLOCK_REQUESTS, DOM_EXTRACTION, SNAPSHOTS,
+    PAGE_LOAD_TIMEOUT, SOURCE_BUDGET, SOURCE_RETRIES, RETRY_BACKOFF,
+)
 
 logger = logging.getLogger("runner")
 logging.basicConfig(
@@ -24,70 +33,296 @@ logging.basicConfig(
     format="%(asctime)s [%(levelname)s] %(message)s",
 )
 
+# One lock per source so overlapping runs never load the same site twice at once
+source_locks = {}
+
+
+def get_source_lock(source_name):
+    """ Return the per-source semaphore, creating it on first use """
+    if source_name not in source_locks:
+        source_locks[source_name] = asyncio.Semaphore(1)
+    return source_locks[source_name]
+
+
+@asynccontextmanager
+async def unbudgeted_wait(semaphore, budget=None):
+    """
+    Hold a semaphore; the time spent waiting for it is not charged to the
+    source's budget (its asyncio.timeout is paused until the slot is acquired)
+    Args:
+        semaphore: Semaphore to acquire
+        budget: Budget dict of scrape_with_retries ("timeout", "queued"), or None
+    """
+    timeout = budget and budget.get("timeout")
+    if timeout is None or timeout.when() is None:
+        async with semaphore:
+            yield
+        return
+
+    loop = asyncio.get_running_loop()
+    queued = loop.time()
+    remaining = timeout.when() - queued
+    timeout.reschedule(None)
+    try:
+        await semaphore.acquire()
+    finally:
+        budget["queued"] += loop.time() - queued
+        timeout.reschedule(loop.time() + remaining)
+    try:
+        yield
+    finally:
+        semaphore.release()
+
+
+async def fetch_page(browser, source, page_selectors=None):
+    """
+    Load a source's url in its own browser context.
+    With page_selectors the articles are extracted inside the page and only the
+    compact records come back; the full HTML is only read when that finds nothing
+    Args:
+        browser: Running Playwright browser
+        source: Registry entry of the source
+        page_selectors: Selector spec for in-page extraction (optional)
+    Returns:
+        (records, content): records from in-page extraction, or the page HTML
+    """
+    source_name = source["name"]
+    context = await browser.new_context()
+    try:
+        if BLOCK_REQUESTS:
+            stats = await install_request_blocking(context, source.get("block_rules"))
+        page = await context.new_page()
+        await page.goto(source["url"], wait_until="domcontentloaded", timeout=PAGE_LOAD_TIMEOUT)
+        if BLOCK_REQUESTS:
+            logging.info(f"{source_name} Requests Blocked: {stats['blocked']}, Allowed: {stats['allowed']}")
+
+        if page_selectors:
+            records = await extract_in_page(page, page_selectors)
+            if records:
+                return records, None
+            logging.info(f"In-Page Extraction Found No Articles For {source_name}, Reading Full HTML")
+
+        return None, await page.content()
+    finally:
+        await context.close()
+
+
+async def scrape_source(get_browser, http_client, page_pool, source, budget=None):
+    """
+    Fetch, parse and store a single source.
+    Sources with a feed are read from it first. Static sources are fetched over
+    HTTP and only rendered in the browser when the parser finds no articles in
+    the plain HTML. A payload whose content hash matches the last stored run is
+    skipped before parsing
+    Args:
+        get_browser: Coroutine function returning the run's browser, launched on first use
+        http_client: Pooled HTTP client for static sources
+        page_pool: Semaphore bounding the number of pages open at once
+        source: Registry entry of the source (see scrapper.registry)
+        budget: Budget of scrape_with_retries; waiting for a page slot is not charged to it
+    Returns:
+        Number of new articles stored, or None on failure
+    """
+    source_name = source["name"]
+    url = source["url"]
+    parser = get_parser(source)
+    try:
+        start = time.time()
+        parsed = None
+        payload = digest = None
+        # (url, validators) of the response that was parsed, saved once its articles are stored
+        pending_validators = None
+        async with get_source_lock(source_name):
+            feed_url = source.get("feed")
+            if feed_url:
+                logging.info(f"Fetching Feed {feed_url}")
+                status, records, response_validators = await fetch_feed(http_client, feed_url)
+                if status == NOT_MODIFIED:
+                    return 0
+                if records:
+                    payload, digest = records, payload_hash(records) if SNAPSHOTS else None
+                    if SNAPSHOTS and is_unchanged(source_name, digest):
+                        logging.info(f"{source_name} Unchanged Since Last Run, Skipping")
+                        return 0
+                    parsed = records_to_parsed_data(source_name, url, records)
+                    pending_validators = (feed_url, response_validators)
+                else:
+                    logging.info(f"No Articles Found In Feed For {source_name}, Falling Back To Homepage")
+
+            if parsed is None and uses_http(source):
+                logging.info(f"Fetching {url} Over HTTP")
+                status, content, response_validators = await fetch_http(http_client, url)
+                if status == NOT_MODIFIED:
+                    return 0
+                if content:
+                    payload, digest = content, payload_hash(content) if SNAPSHOTS else None
+                    if SNAPSHOTS and is_unchanged(source_name, digest):
+                        logging.info(f"{source_name} Unchanged Since Last Run, Skipping")
+                        return 0
+                    parsed = await parse_html(parser, content)
+                    if parsed and parsed.get("articles"):
+                        pending_validators = (url, response_validators)
+                    else:
+                        logging.info(f"No Articles Found Over HTTP For {source_name}, Falling Back To Browser")
+                        parsed = None
+
+            if parsed is None:
+                page_selectors = source.get("selectors") if DOM_EXTRACTION else None
+                async with unbudgeted_wait(page_pool, budget):
+                    logging.info(f"Scraping {url}")
+                    records, content = await fetch_page(await get_browser(), source, page_selectors)
+                payload = records or content
+                digest = payload_hash(payload) if SNAPSHOTS and payload else None
+                if digest and is_unchanged(source_name, digest):
+                    logging.info(f"{source_name} Unchanged Since Last Run, Skipping")
+                    return 0
+                if records:
+                    parsed = records_to_parsed_data(source_name, url, records)
+                else:
+                    parsed = await parse_html(parser, content)
+
+        if parsed is None:
+            logging.warning(f"No Data Parsed For {source_name}")
+            return None
+
+        # Drop articles already stored on earlier runs before the preprocess and DB stages
+        parsed_count = len(parsed.get("articles", []))
+        parsed["articles"] = known_articles.filter_new(parsed.get("articles", []), parsed.get("source_url") or url)
+        logging.info(f"{source_name} New Articles: {len(parsed['articles'])} Of {parsed_count}")
+
+        data = preprocessor(parsed)
+        if data is None:
+            logging.warning(f"Preprocessing Failed For {source_name}")
+            return None
+        articles = data.get("articles", [])
+
+        for article in articles:
+            article['source_id'] = source["source_id"]
+            article['scraped_at'] = datetime.now().isoformat()
+
+        with Database() as database:
+            # Rows only carry canonical_url once its migration has run
+            if not canonical_column_ready(database):
+                for article in articles:
+                    article.pop('canonical_url', None)
+            stored = not articles or database.insert('parsed_articles', articles, conflict_column = 'hash')
+            if articles and stored:
+                known_articles.add(article["hash"] for article in articles)
+            database.update("sources", source["source_id"], data.get('scraped_at', time.strftime("%Y-%m-%dT%H:%M:%S")))
+
+        # Archive the page and keep its validators only once it has been stored, so a failed
+        # insert is not mistaken for "unchanged" (or answered with a 304) on the next attempt
+        if digest and stored:
+            save_snapshot(source_name, payload, digest)
+        if pending_validators and stored:
+            save_validators(*pending_validators)
+
+        if not stored:
+            logging.warning(f"Failed To Store Articles For {source_name}")
+            return None
+
+        end = time.time()
+        logging.info(f"Scraped {source_name}. New Articles: {len(articles)}. Time Taken: {end - start:.2f} seconds")
+        return len(articles)
+
+    except Exception as e:
+        logging.error(f"An Error Occurred While Scraping {source_name}: {e}")
+        return None
+
+
+async def scrape_with_retries(get_browser, http_client, page_pool, source):
+    """
+    Scrape a source within its latency budget, retrying failed attempts with
+    jittered exponential backoff. Sources whose circuit is open are skipped.
+    Time spent queuing for a browser page slot does not count against the budget
+    Args:
+        get_browser: Coroutine function returning the run's browser, launched on first use
+        http_client: Pooled HTTP client for static sources
+        page_pool: Semaphore bounding the number of pages open at once
+        source: Registry entry of the source
+    Returns:
+        Number of new articles stored, or None on failure / open circuit
+    """
+    source_name = source["name"]
+    if is_open(source_name):
+        logging.warning(f"Circuit Open For {source_name}, Skipping")
+        return None
+
+    budget = {"timeout": None, "queued": 0.0}
+    started = time.monotonic()
+
+    def remaining():
+        return started + SOURCE_BUDGET + budget["queued"] - time.monotonic()
+
+    for attempt in range(SOURCE_RETRIES + 1):
+        if remaining() <= 0:
+            break
+        try:
+            async with asyncio.timeout(remaining()) as timeout:
+                budget["timeout"] = timeout
+                count = await scrape_source(get_browser, http_client, page_pool, source, budget)
+        except TimeoutError:
+            logging.warning(f"{source_name} Exceeded Its {SOURCE_BUDGET}s Budget")
+            break
+
+        if count is not None:
+            record_success(source_name)
+            return count
+
+        if attempt < SOURCE_RETRIES:
+            delay = min(RETRY_BACKOFF * 2 ** attempt + random.uniform(0, RETRY_BACKOFF), remaining())
+            if delay <= 0:
+                break
+            logging.info(f"Retrying {source_name} In {delay:.1f} Seconds (Attempt {attempt + 2} Of {SOURCE_RETRIES + 1})")
+            await asyncio.sleep(delay)
+
+    record_failure(source_name)
+    return None
+
+
 async def main():
     try:
         start = time.time()
         logging.info("Data Scraping Initialized")
 
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            page = await browser.new_page()
-
-            data_url = [
-                "https://punchng.com",
-                "https://www.channelstv.com/",
-                "https://www.vanguardngr.com/",
-                "https://www.premiumtimesng.com",
-                "https://businessday.ng/",
-                "https://saharareporters.com/news",
-                "https://guardian.ng/",
-                "https://www.arise.tv/",
-            ]
-
-            source_id = {
-                'Punch Nigeria': '431e3d96-3927-4481-be94-db8d6f2f9f5b',
-                'Channels TV': 'b62f770e-7a5e-48a0-8187-b9e6477fe453',
-                'Vanguard Nigeria': '0bdb95b0-c023-4ef1-9328-af977afce3bc',
-                'Premium Times Nigeria': '74eea32e-d6a4-4688-81ff-126badd873c0',
-                'BusinessDay Nigeria': 'd9fb80d4-4837-47eb-bf72-7d04e7d70c76',
-                'Sahara Reporters': '6ce1b673-431c-4a11-9749-47643ca3a96f',
-                'The Guardian Nigeria': '1f55e458-834b-4807-b209-004f0690f5f3',
-                'Arise News TV': '7b907be0-59ce-4cba-b0d0-ef58034ea8f3'
-            }
-
-            parsers = [
-                parse_punch_news,
-                parse_channel_news,
-                parse_vanguard_news,
-                parse_premuimtimes_news,
-                parse_businessday_news,
-                parse_saharareporters_news,
-                parse_guardian_news,
-                parse_arise_news
-            ]
-
-            database = Database()
-
-            for idx, url in enumerate(data_url):
-                logging.info(f"Scraping {url}")
-                await page.goto(url, wait_until="domcontentloaded", timeout=60000)
-                content = await page.content()
-
-                parsed = parsers[idx](content)
-                data = preprocessor(parsed)
-                articles = data.get("articles", [])
-
-                # Correct source_id mapping
-                source_name = list(source_id.keys())[idx]
-                for article in articles:
-                    article['source_id'] = source_id[source_name]
-                    article['scraped_at'] = datetime.now().isoformat()
+        # Warm the known-articles index once per process (retried next run if the DB is down)
+        get_known_articles()
+
+        # Only scrape the sources whose polling interval has elapsed
+        sources, skipped = due_sources(SOURCES)
+        if skipped:
+            logging.info(f"Sources Not Due Yet: {', '.join(source['name'] for source in skipped)}")
+
+        if sources:
+            # A browser or network failure here must not stop the Telegram stage below
+            try:
+                # Chromium is only launched once a source falls back to rendering
+                browser = LazyBrowser()
+                try:
+                    page_pool = asyncio.Semaphore(SCRAPE_CONCURRENCY)
 
-                if articles:
-                    database.insert('parsed_articles', articles, conflict_column = 'hash')
-                    database.update("sources", source_id[source_name], data.get('scraped_at', time.strftime("%Y-%m-%dT%H:%M:%S")))
+                    async with create_http_client() as http_client:
+                        results = await asyncio.gather(*(
+                            scrape_with_retries(browser.get, http_client, page_pool, source)
+                            for source in sources
+                        ))
+                finally:
+                    await browser.release()
 
-            await browser.close()
+                # Failed sources keep their schedule and are retried on the next run
+                for source, count in zip(sources, results):
+                    if count is not None:
+                        interval = record_yield(source["name"], count)
+                        logging.info(f"{source['name']} Next Scrape In {interval / 60:.0f} Minutes")
+
+                failed = [source["name"] for source, count in zip(sources, results) if count is None]
+                if failed:
+                    logging.warning(f"Failed Sources: {', '.join(failed)}")
+            except Exception as e:
+                logging.error(f"An Error Occurred While Scraping News Sources: {e}")
+            finally:
+                save_schedules()
+                save_breakers()
 
         await scrape_recent_messages()
 
@@ -97,4 +332,3 @@ async def main():
 
     except Exception as e:
         logging.error(f"An Error Occurred During Data Scraping: {e}")
-
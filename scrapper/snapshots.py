@@ -0,0 +1,122 @@
+import hashlib
+import json
+import logging
+import re
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+import zstandard
+
+from scrapper.state import StateStore
+from config import SNAPSHOT_DIR, SNAPSHOT_KEEP, SNAPSHOT_MAX_AGE_DAYS, SNAPSHOT_LEVEL
+
+logger = logging.getLogger("runner")
+logging.basicConfig(
+    stream=sys.stdout,
+    level=logging.INFO,
+    format="%(asctime)s [%(levelname)s] %(message)s",
+)
+
+# Per source: {"hash", "path", "saved_at"} of the last page that was parsed and stored
+last_snapshots = StateStore("snapshots")
+
+# Parts of a page that change on every load without changing its articles
+# (inline scripts with nonces/timestamps, styles, comments)
+_VOLATILE = re.compile(r"<script\b.*?</script>|<style\b.*?</style>|<!--.*?-->", re.S | re.I)
+
+
+def _slug(source_name):
+    return re.sub(r"[^a-z0-9]+", "-", source_name.lower()).strip("-")
+
+
+def payload_hash(payload):
+    """
+    Content hash of what a source returned: page HTML (scripts, styles and
+    comments ignored) or the records of in-page extraction
+    """
+    if isinstance(payload, str):
+        data = _VOLATILE.sub("", payload).encode("utf-8")
+    else:
+        data = json.dumps(payload, sort_keys=True).encode("utf-8")
+    return hashlib.sha256(data).hexdigest()
+
+
+def is_unchanged(source_name, digest):
+    """ Check whether a source returned the same content as its last stored run """
+    last = last_snapshots.get(source_name)
+    return bool(last) and last.get("hash") == digest
+
+
+def save_snapshot(source_name, payload, digest):
+    """
+    Archive a source's payload zstd-compressed, keyed by source and content hash,
+    record it as the source's latest content and apply the retention limits
+    Args:
+        source_name: Name of the source
+        payload: Page HTML (str) or in-page records (list)
+        digest: payload_hash(payload)
+    Returns:
+        Path of the snapshot, or None on failure
+    """
+    try:
+        folder = Path(SNAPSHOT_DIR) / _slug(source_name)
+        folder.mkdir(parents=True, exist_ok=True)
+        is_html = isinstance(payload, str)
+        data = payload if is_html else json.dumps(payload, ensure_ascii=False)
+        path = folder / f"{time.strftime('%Y%m%dT%H%M%S')}-{digest[:16]}.{'html' if is_html else 'json'}.zst"
+
+        with open(path, "wb") as f:
+            f.write(zstandard.ZstdCompressor(level=SNAPSHOT_LEVEL).compress(data.encode("utf-8")))
+
+        last_snapshots.set(source_name, {"hash": digest, "path": str(path), "saved_at": time.time()})
+        last_snapshots.save()
+        prune_snapshots(source_name)
+        return path
+    except Exception as e:
+        logging.error(f"Failed To Save Snapshot For {source_name}: {e}")
+        return None
+
+
+def list_snapshots(source_name):
+    """ Snapshot paths of a source, oldest first """
+    folder = Path(SNAPSHOT_DIR) / _slug(source_name)
+    if not folder.exists():
+        return []
+    return sorted(folder.glob("*.zst"))
+
+
+def prune_snapshots(source_name):
+    """ Keep at most SNAPSHOT_KEEP snapshots per source, none older than SNAPSHOT_MAX_AGE_DAYS """
+    snapshots = list_snapshots(source_name)
+    cutoff = time.time() - SNAPSHOT_MAX_AGE_DAYS * 86400
+    for index, path in enumerate(snapshots):
+        if index < len(snapshots) - SNAPSHOT_KEEP or path.stat().st_mtime < cutoff:
+            path.unlink(missing_ok=True)
+
+
+def snapshot_time(path):
+    """
+    When a snapshot was taken: the timestamp in its file name (local time, as
+    written by save_snapshot), or its modification time
+    Returns:
+        Naive local datetime, like the scraped_at of a live run
+    """
+    path = Path(path)
+    try:
+        return datetime.strptime(path.name.split("-", 1)[0], "%Y%m%dT%H%M%S")
+    except ValueError:
+        return datetime.fromtimestamp(path.stat().st_mtime)
+
+
+def load_snapshot(path):
+    """
+    Read an archived snapshot
+    Returns:
+        Page HTML (str) or in-page records (list)
+    """
+    path = Path(path)
+    with open(path, "rb") as f:
+        data = zstandard.ZstdDecompressor().decompress(f.read()).decode("utf-8")
+    return data if path.name.endswith(".html.zst") else json.loads(data)
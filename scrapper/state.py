@@ -0,0 +1,58 @@
+import json
+import logging
+import os
+import sys
+import threading
+from pathlib import Path
+
+from config import STATE_DIR
+
+logger = logging.getLogger("runner")
+logging.basicConfig(
+    stream=sys.stdout,
+    level=logging.INFO,
+    format="%(asctime)s [%(levelname)s] %(message)s",
+)
+
+
+class StateStore:
+    """
+    Small JSON file store for scraper state that has to survive restarts
+    (HTTP validators, schedules, circuit breakers)
+    """
+
+    _lock = threading.Lock()
+
+    def __init__(self, name: str):
+        self.path = Path(STATE_DIR) / f"{name}.json"
+        self.data = self._load()
+
+    def _load(self) -> dict:
+        """Read the state file, starting empty if it is missing or corrupt"""
+        try:
+            if self.path.exists():
+                with open(self.path, "r", encoding="utf-8") as f:
+                    return json.load(f)
+        except Exception as e:
+            logging.error(f"Failed To Load State File {self.path}: {e}")
+        return {}
+
+    def get(self, key: str, default=None):
+        return self.data.get(key, default)
+
+    def set(self, key: str, value) -> None:
+        self.data[key] = value
+
+    def save(self) -> bool:
+        """Write the state atomically (temp file + rename)"""
+        try:
+            with StateStore._lock:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = self.path.with_suffix(".tmp")
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(self.data, f, indent=2, default=str)
+                os.replace(tmp_path, self.path)
+            return True
+        except Exception as e:
+            logging.error(f"Failed To Save State File {self.path}: {e}")
+            return False
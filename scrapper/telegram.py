@@ -1,20 +1,22 @@
 import os
-from telethon import TelegramClient
+import asyncio
+import random
 from dotenv import load_dotenv
 from datetime import datetime, timedelta, timezone
 import hashlib
 import logging
 import re
-from scrapper.database import Database 
+from scrapper.database import shared_database
+from scrapper.known_articles import known_articles, get_known_articles
 import time
+from config import (
+    TELEGRAM_CONCURRENCY, TELEGRAM_RETRIES, TELEGRAM_MAX_FLOOD_WAIT, TELEGRAM_BACKFILL_HOURS, RETRY_BACKOFF,
+)
 
 load_dotenv()
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
 
-api_id = int(os.getenv("TG_API_ID"))
-api_hash = os.getenv("TG_API_HASH")
-
 CHANNELS = {
     "Gist Ng": {"id": "Gist_Ng"},
     "Naija News": {"id": "naijanews"},
@@ -32,11 +34,19 @@ telegram_id = {
     'Nigeria News': '9dc82a1a-dceb-47f1-8807-6c4703bbc46c',
 }
 
-TIME_CUTOFF = datetime.utcnow().replace(tzinfo=timezone.utc) - timedelta(hours=3)
+_client = None
 
-client = TelegramClient("flashreport_session", api_id, api_hash)
 
-seen_hashes = set()
+def get_client():
+    """
+    The Telegram client, created on first use. Telethon is imported here and the
+    credentials read here, so importing this module needs neither
+    """
+    global _client
+    if _client is None:
+        from telethon import TelegramClient
+        _client = TelegramClient("flashreport_session", int(os.getenv("TG_API_ID")), os.getenv("TG_API_HASH"))
+    return _client
 
 # Extract first URL from text
 URL_PATTERN = re.compile(r"https?://\S+")
@@ -54,66 +64,212 @@ def extract_url(text):
     match = URL_PATTERN.search(text)
     return match.group(0) if match else None
 
-database = Database()  
+def time_cutoff():
+    """ Oldest message date read on this run (computed per run, not at import) """
+    return datetime.now(timezone.utc) - timedelta(hours=TELEGRAM_BACKFILL_HOURS)
+
+def get_database():
+    """ Connection used by the Telegram ingesters, opened on first use """
+    return shared_database("telegram")
+
+# Per-channel watermark: id of the newest message already ingested, stored on the
+# channel's row in the sources table (sources.last_message_id, added by
+# migrations/001_sources_last_message_id.sql) so it survives restarts
+_watermark_column = False
+_watermark_warned = False
+
+
+def watermark_column_ready():
+    """
+    Whether sources.last_message_id exists (checked until it does, then cached).
+    Without it every channel is read from the backfill window, as before watermarks
+    """
+    global _watermark_column, _watermark_warned
+    if not _watermark_column:
+        _watermark_column = get_database().has_column("sources", "last_message_id")
+        if not _watermark_column and not _watermark_warned:
+            _watermark_warned = True
+            logging.warning("sources.last_message_id Missing, Reading Channels Without Watermarks (Run python -m scrapper.migrate)")
+    return _watermark_column
+
+
+def load_watermarks():
+    """
+    Last ingested message id of every channel
+    Returns:
+        Dict of channel source_id -> last_message_id (channels never read are missing,
+        and every channel when the column does not exist)
+    """
+    if not watermark_column_ready():
+        return {}
+    rows = get_database().fetch_all(
+        'SELECT id, last_message_id FROM "sources" WHERE id::text = ANY(%s)',
+        (list(telegram_id.values()),),
+    )
+    return {str(row["id"]): row["last_message_id"] for row in rows if row.get("last_message_id")}
+
+
+def save_watermarks(watermarks):
+    """
+    Store the newest message id read from each channel
+    Args:
+        watermarks: Dict of channel source_id -> message id
+    """
+    if watermarks and watermark_column_ready():
+        get_database().execute_batch(
+            'UPDATE "sources" SET last_message_id = %s WHERE id = %s',
+            [(message_id, source_uuid) for source_uuid, message_id in watermarks.items()],
+        )
+
+def message_row(channel_name, channel, message):
+    """
+    Turn a channel message into a parsed_articles row
+    Returns:
+        Row dict, or None for messages without text or already seen
+    """
+    if not message.text:
+        return None
+
+    text = normalize_text(message.text)
+    h = message_hash(channel["id"], text, message.date)
+
+    if h in known_articles:
+        return None
+
+    title = text[:150] if text else None
+    news_url = extract_url(text)
+    image_url = None  # can add media later
+    published_at = message.date
+    scraped_at = datetime.utcnow()
+
+    return {
+        "source_id": telegram_id.get(channel_name),
+        "title": title,
+        "news_url": news_url,
+        "image_url": image_url,
+        "published_at": published_at,
+        "scraped_at": scraped_at,
+        "hash": h
+    }
+
+
+async def read_channel(channel_name, channel, min_id=None):
+    """
+    Read a channel's messages newer than its watermark (and not older than time_cutoff)
+    Args:
+        channel_name: Name of the channel in CHANNELS
+        channel: CHANNELS entry
+        min_id: Last message id already ingested (None on the first run)
+    Returns:
+        (rows, last_id): parsed_articles rows and the newest message id seen
+    """
+    cutoff = time_cutoff()
+    rows = []
+    last_id = min_id
+
+    # Newest first; min_id makes Telegram return only messages after the watermark
+    async for message in get_client().iter_messages(channel["id"], min_id=min_id or 0):
+        last_id = max(last_id or 0, message.id)
+        if message.date < cutoff:
+            break
+        row = message_row(channel_name, channel, message)
+        if row:
+            rows.append(row)
+    return rows, last_id
+
+
+async def fetch_channel(channel_name, channel, channel_pool, min_id=None):
+    """
+    Read one channel under the concurrency cap, retrying transient errors.
+    A FloodWait is slept off when it is short; a long one skips the channel
+    for this run rather than holding up the others
+    Args:
+        channel_name: Name of the channel in CHANNELS
+        channel: CHANNELS entry
+        channel_pool: Semaphore bounding the channels read at once
+        min_id: Channel watermark (see read_channel)
+    Returns:
+        (rows, last_id), or None on failure
+    """
+    from telethon.errors import FloodWaitError
+
+    for attempt in range(TELEGRAM_RETRIES + 1):
+        try:
+            # The slot is only held while reading, not while backing off
+            async with channel_pool:
+                start = time.time()
+                rows, last_id = await read_channel(channel_name, channel, min_id)
+            logging.info(f"{channel_name} New Messages: {len(rows)}. Time Taken: {time.time() - start:.2f} seconds")
+            return rows, last_id
+        except FloodWaitError as e:
+            if e.seconds > TELEGRAM_MAX_FLOOD_WAIT or attempt == TELEGRAM_RETRIES:
+                logging.warning(f"{channel_name} Flood Wait Of {e.seconds}s, Skipping Channel This Run")
+                return None
+            delay = e.seconds + random.uniform(0, RETRY_BACKOFF)
+        except Exception as e:
+            if attempt == TELEGRAM_RETRIES:
+                logging.error(f"Failed To Read {channel_name}: {e}")
+                return None
+            delay = RETRY_BACKOFF * 2 ** attempt + random.uniform(0, RETRY_BACKOFF)
+        logging.info(f"Retrying {channel_name} In {delay:.1f} Seconds")
+        await asyncio.sleep(delay)
+
 
 async def scrape_recent_messages():
     try:
         start = time.time()
+        # The real-time listener (scrapper.telegram_listener) may already hold the connection
+        client = get_client()
+        was_connected = client.is_connected()
         await client.start()
-        logging.info(f"Scraping messages since {TIME_CUTOFF.isoformat()}")
+        get_known_articles()
+        watermarks = load_watermarks()
+        logging.info(f"Scraping messages after stored watermarks, since {time_cutoff().isoformat()} at most")
 
-        parsed_articles = []
+        # Channels are read concurrently, so the stage takes as long as the slowest channel
+        channel_pool = asyncio.Semaphore(TELEGRAM_CONCURRENCY)
+        try:
+            results = await asyncio.gather(*(
+                fetch_channel(channel_name, channel, channel_pool, watermarks.get(telegram_id.get(channel_name)))
+                for channel_name, channel in CHANNELS.items()
+            ))
+        finally:
+            if not was_connected:
+                await client.disconnect()
 
-        for channel_name, channel in CHANNELS.items():
+        last_scraped_time = datetime.utcnow().isoformat()
+        parsed_articles = []
+        batch_hashes = set()
+        new_watermarks = {}
+        for channel_name, result in zip(CHANNELS, results):
+            if result is None:
+                continue
+            rows, last_id = result
             source_uuid = telegram_id.get(channel_name)
-            last_scraped_time = datetime.utcnow().isoformat()
-
-            async for message in client.iter_messages(channel["id"]):
-                if message.date < TIME_CUTOFF:
-                    break
-                if not message.text:
-                    continue
-
-                text = normalize_text(message.text)
-                h = message_hash(channel["id"], text, message.date)
-
-                if h in seen_hashes:
-                    continue
-                seen_hashes.add(h)
-
-                title = text[:150] if text else None
-                news_url = extract_url(text)
-                image_url = None  # can add media later
-                published_at = message.date
-                scraped_at = datetime.utcnow()
-
-                parsed_articles.append({
-                    "source_id": source_uuid,
-                    "title": title,
-                    "news_url": news_url,
-                    "image_url": image_url,
-                    "published_at": published_at,
-                    "scraped_at": scraped_at,
-                    "hash": h
-                })
-
-            # Update the sources table for this channel after scraping it
-            database.update(
-                'sources',
-                source_uuid,
-                last_scraped_time
-            )
+            if last_id and last_id != watermarks.get(source_uuid):
+                new_watermarks[source_uuid] = last_id
+            for row in rows:
+                if row["hash"] not in known_articles and row["hash"] not in batch_hashes:
+                    batch_hashes.add(row["hash"])
+                    parsed_articles.append(row)
+            # Update the sources table for each channel that was read
+            get_database().update('sources', source_uuid, last_scraped_time)
 
         logging.info(f"Prepared {len(parsed_articles)} parsed_articles entries")
-        await client.disconnect()
 
-        # Insert all scraped articles
-        database.insert('parsed_articles', parsed_articles,conflict_column = 'hash')
+        # One bulk insert for all channels. Watermarks only move once the rows are stored,
+        # so a failed insert is read again on the next run
+        stored = not parsed_articles or get_database().insert('parsed_articles', parsed_articles, conflict_column = 'hash')
+        if stored:
+            known_articles.add(row["hash"] for row in parsed_articles)
+            save_watermarks(new_watermarks)
+
+        failed = [channel_name for channel_name, result in zip(CHANNELS, results) if result is None]
+        if failed:
+            logging.warning(f"Failed Channels: {', '.join(failed)}")
         end = time.time()
         logging.info(f" Telegram Messages Retrived Successfully. Time Taken: {end-start:.2f} seconds")
+        return True
     except Exception as e:
         logging.error(f" An Error Occurred When Retrieving Telegram Messages {e}")
         return False
-
-    
-
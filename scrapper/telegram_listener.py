@@ -0,0 +1,159 @@
+import asyncio
+import logging
+import sys
+import time
+
+from scrapper.telegram import CHANNELS, telegram_id, get_client, get_database, message_row, save_watermarks
+from scrapper.known_articles import known_articles, get_known_articles
+from Algorithm.filter import ingest_message, filter_rows
+from config import TELEGRAM_FLUSH_INTERVAL, TELEGRAM_FLUSH_MAX
+
+logger = logging.getLogger("runner")
+logging.basicConfig(
+    stream=sys.stdout,
+    level=logging.INFO,
+    format="%(asctime)s [%(levelname)s] %(message)s",
+)
+
+
+class TelegramListener:
+    """
+    Real-time mode for the Telegram channels: new messages are pushed by
+    Telegram (events.NewMessage), buffered, and every TELEGRAM_FLUSH_INTERVAL
+    seconds written to parsed_articles in one insert. The keyword matches of
+    each batch go straight to the Gemini filter, so a breaking incident becomes
+    a signal within seconds instead of at the next pipeline run
+    """
+
+    def __init__(self):
+        self.buffer = []
+        self.watermarks = {}
+        self.channel_names = {}
+        self.flush_task = None
+        self.flush_lock = asyncio.Lock()
+        self.filter_lock = asyncio.Lock()
+        self.filter_tasks = set()
+
+    @property
+    def running(self):
+        return self.flush_task is not None
+
+    async def start(self):
+        """ Connect, subscribe to the channels and start the flush loop """
+        if self.running:
+            return
+        from telethon import events
+
+        client = get_client()
+        await client.start()
+        get_known_articles()
+        for channel_name, channel in CHANNELS.items():
+            self.channel_names[await client.get_peer_id(channel["id"])] = channel_name
+        client.add_event_handler(self.on_message, events.NewMessage(chats=[c["id"] for c in CHANNELS.values()]))
+        self.flush_task = asyncio.create_task(self.flush_loop())
+        logging.info(f"Telegram Listener Started For {len(self.channel_names)} Channels")
+
+    async def stop(self):
+        """ Flush what is buffered, unsubscribe and disconnect """
+        if not self.running:
+            return
+        self.flush_task.cancel()
+        try:
+            await self.flush_task
+        except asyncio.CancelledError:
+            pass
+        self.flush_task = None
+        client = get_client()
+        client.remove_event_handler(self.on_message)
+        await self.flush()
+        if self.filter_tasks:
+            await asyncio.gather(*self.filter_tasks, return_exceptions=True)
+        await client.disconnect()
+        logging.info("Telegram Listener Stopped")
+
+    async def on_message(self, event):
+        channel_name = self.channel_names.get(event.chat_id)
+        if channel_name is None:
+            return
+        row = message_row(channel_name, CHANNELS[channel_name], event.message)
+        source_uuid = telegram_id.get(channel_name)
+        self.watermarks[source_uuid] = max(self.watermarks.get(source_uuid, 0), event.message.id)
+        if row:
+            self.buffer.append(row)
+            if len(self.buffer) >= TELEGRAM_FLUSH_MAX:
+                await self.flush()
+
+    async def flush_loop(self):
+        while True:
+            await asyncio.sleep(TELEGRAM_FLUSH_INTERVAL)
+            try:
+                await self.flush()
+            except Exception as e:
+                logging.error(f"An Error Occurred When Flushing Telegram Messages: {e}")
+
+    async def flush(self):
+        """
+        Insert the buffered messages and hand their keyword matches to the filter.
+        The database work runs in a worker thread, so the event loop Telethon shares
+        with the API keeps serving messages and requests meanwhile
+        Returns:
+            Number of rows inserted
+        """
+        async with self.flush_lock:
+            return await self._flush()
+
+    async def _flush(self):
+        rows, self.buffer = self.buffer, []
+        watermarks, self.watermarks = self.watermarks, {}
+        batch = {row["hash"]: row for row in rows if row["hash"] not in known_articles}
+        rows = list(batch.values())
+
+        if rows and not await asyncio.to_thread(get_database().insert, 'parsed_articles', rows, conflict_column = 'hash'):
+            # Keep the rows for the next flush; the batch scrape also re-reads them from the watermark
+            self.buffer = rows + self.buffer
+            for source_uuid, message_id in watermarks.items():
+                self.watermarks.setdefault(source_uuid, message_id)
+            return 0
+        known_articles.add(batch)
+        await asyncio.to_thread(save_watermarks, watermarks)
+
+        matched = [row["hash"] for row in rows if ingest_message(row["title"])]
+        if matched:
+            task = asyncio.create_task(self.classify(matched))
+            self.filter_tasks.add(task)
+            task.add_done_callback(self.filter_tasks.discard)
+        if rows:
+            logging.info(f"Telegram Listener Stored {len(rows)} Messages, {len(matched)} Keyword Matches")
+        return len(rows)
+
+    async def classify(self, hashes):
+        """ Run the Gemini filter on freshly stored keyword matches, one batch at a time """
+        async with self.filter_lock:
+            try:
+                start = time.time()
+                # The query, Gemini and the article fetches are blocking, keep them off the event loop
+                rows = await asyncio.to_thread(
+                    get_database().fetch_all,
+                    'SELECT id, title, news_url FROM parsed_articles WHERE hash = ANY(%s)',
+                    (hashes,),
+                )
+                await asyncio.to_thread(filter_rows, rows)
+                end = time.time()
+                logging.info(f"Filtered {len(rows)} Telegram Messages. Time Taken: {end - start:.2f} seconds")
+            except Exception as e:
+                logging.error(f"An Error Occurred When Filtering Telegram Messages: {e}")
+
+
+telegram_listener = TelegramListener()
+
+
+async def run_forever():
+    await telegram_listener.start()
+    try:
+        await get_client().run_until_disconnected()
+    finally:
+        await telegram_listener.stop()
+
+
+if __name__ == "__main__":
+    asyncio.run(run_forever())
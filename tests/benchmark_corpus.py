@@ -0,0 +1,200 @@
+"""
+Offline regression and performance check of every adapter against the snapshot
+corpus in tests/fixtures/snapshots (see tests/fixtures/make_snapshots.py).
+
+For each source it reports the articles extracted, parse latency percentiles,
+throughput and peak Python allocations, and compares them with
+tests/fixtures/benchmark_baseline.json. The run fails (exit code 1) when:
+- a source extracts different articles than the baseline (output regression)
+- its fastest parse is more than --threshold slower than the baseline's (the
+  minimum is the least noisy figure on a shared machine; percentiles are reported)
+
+Each source is preceded by a short fixed calibration workload, and the allowed
+time is scaled by how much slower the machine is running it than when the
+baseline was recorded, so CPU contention or a slower host does not read as a
+regression.
+
+    python tests/benchmark_corpus.py [--engine bs4|lxml] [--runs 20] [--threshold 0.5] [--update]
+
+--update records the current results as the new baseline.
+"""
+import argparse
+import gc
+import hashlib
+import json
+import logging
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import lxml.html
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmark_parsers import load_snapshot, snapshot_name
+from scrapper.registry import SOURCES
+from scrapper.extractor import extract_parsed_data
+from config import PARSE_ENGINE
+
+FIXTURES = Path(__file__).resolve().parent / "fixtures"
+SNAPSHOT_DIR = FIXTURES / "snapshots"
+BASELINE_FILE = FIXTURES / "benchmark_baseline.json"
+
+
+def get_engine_parser(source, engine):
+    if engine == "lxml":
+        return lambda content: extract_parsed_data(source["name"], source["url"], source["selectors"], content)
+    return source["parser"]
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, round(pct / 100 * (len(ordered) - 1)))
+    return ordered[index]
+
+
+CALIBRATION_HTML = "<div class='a'><ul>" + "".join(f"<li><a href='/{i}'>Item {i}</a></li>" for i in range(200)) + "</ul></div>"
+
+
+def calibrate(rounds=5):
+    """
+    Fastest time (ms) of a fixed parse-and-walk workload, the machine speed
+    reference the timings are scaled by
+    """
+    best = None
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for _ in range(20):
+            root = lxml.html.fromstring(CALIBRATION_HTML)
+            sorted((a.get("href"), a.text_content()) for a in root.iter("a"))
+        elapsed = (time.perf_counter() - start) * 1000
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def records_digest(articles):
+    """ Stable fingerprint of the extracted records """
+    return hashlib.sha256(json.dumps(articles, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def bench_source(source, engine, html_content, runs):
+    """
+    Parse one snapshot `runs` times, then once more under tracemalloc
+    Returns:
+        Result dict for the source
+    """
+    parser = get_engine_parser(source, engine)
+    parser(html_content)  # warm-up (compiled specs, imports)
+    calibration = calibrate()
+
+    timings = []
+    parsed_data = None
+    gc.collect()
+    gc.disable()  # keep collector pauses out of the latency figures
+    try:
+        for _ in range(runs):
+            start = time.perf_counter()
+            parsed_data = parser(html_content)
+            timings.append((time.perf_counter() - start) * 1000)
+    finally:
+        gc.enable()
+
+    tracemalloc.start()
+    parser(html_content)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    articles = parsed_data["articles"] if parsed_data else []
+    p50 = statistics.median(timings)
+    return {
+        "articles": len(articles),
+        "digest": records_digest(articles),
+        "min_ms": round(min(timings), 3),
+        "p50_ms": round(p50, 3),
+        "p95_ms": round(percentile(timings, 95), 3),
+        "p99_ms": round(percentile(timings, 99), 3),
+        "articles_per_s": round(len(articles) / (p50 / 1000)) if p50 else 0,
+        "peak_kb": round(peak / 1024),
+        "calibration_ms": round(calibration, 3),
+    }
+
+
+def load_baseline():
+    if BASELINE_FILE.exists():
+        with open(BASELINE_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    return {}
+
+
+def check(result, expected, threshold):
+    """
+    Compare a source's result with its baseline
+    Returns:
+        List of failure messages (empty when the source passes)
+    """
+    if not expected:
+        return ["no baseline (run with --update)"]
+    failures = []
+    if result["articles"] != expected["articles"]:
+        failures.append(f"articles {expected['articles']} -> {result['articles']}")
+    elif result["digest"] != expected["digest"]:
+        failures.append("extracted records changed")
+    machine_factor = result["calibration_ms"] / expected["calibration_ms"]
+    limit = expected["min_ms"] * max(machine_factor, 1) * (1 + threshold)
+    if result["min_ms"] > limit:
+        failures.append(f"fastest {result['min_ms']:.1f} ms > {limit:.1f} ms allowed")
+    return failures
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument("--engine", choices=["bs4", "lxml"], default=PARSE_ENGINE)
+    arg_parser.add_argument("--runs", type=int, default=20)
+    arg_parser.add_argument("--threshold", type=float, default=0.5, help="Allowed slowdown (0.5 = 50%%)")
+    arg_parser.add_argument("--snapshots", default=str(SNAPSHOT_DIR))
+    arg_parser.add_argument("--update", action="store_true", help="Record the results as the new baseline")
+    args = arg_parser.parse_args()
+
+    logging.disable(logging.INFO)
+    baseline = load_baseline()
+    engine_baseline = baseline.get(args.engine, {})
+    results = {}
+    failed = False
+
+    header = (f"{'Source':<24}{'Articles':>9}{'min ms':>9}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}"
+              f"{'Art/s':>9}{'Peak KB':>9}  Status")
+    print(f"Engine: {args.engine}, Runs: {args.runs}")
+    print(header)
+    print("-" * len(header))
+
+    for source in SOURCES:
+        html_content = load_snapshot(args.snapshots, source)
+        if html_content is None:
+            print(f"{source['name']:<24}  missing snapshot {snapshot_name(source)}.html.gz")
+            failed = True
+            continue
+
+        result = bench_source(source, args.engine, html_content, args.runs)
+        results[source["name"]] = result
+
+        failures = [] if args.update else check(result, engine_baseline.get(source["name"]), args.threshold)
+        failed = failed or bool(failures)
+        status = "; ".join(failures) if failures else "ok"
+        print(f"{source['name']:<24}{result['articles']:>9}{result['min_ms']:>9.1f}{result['p50_ms']:>9.1f}{result['p95_ms']:>9.1f}"
+              f"{result['p99_ms']:>9.1f}{result['articles_per_s']:>9}{result['peak_kb']:>9}  {status}")
+
+    if args.update:
+        baseline[args.engine] = results
+        with open(BASELINE_FILE, "w", encoding="utf-8") as f:
+            json.dump(baseline, f, indent=2)
+        print(f"Baseline Written To {BASELINE_FILE}")
+        return 0
+
+    print("FAILED" if failed else "PASSED")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
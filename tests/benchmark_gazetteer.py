@@ -0,0 +1,164 @@
+"""
+Checks and micro-benchmark of the LGA gazetteer (Algorithm/gazetteer.py and
+Algorithm/data/nigeria_lgas.csv).
+
+Fails (exit code 1) when:
+- the bundled file does not hold 774 LGAs across the 36 states and the FCT, or
+  has coordinates outside Nigeria
+- one of the CASES below resolves to the wrong state / LGA, or one of the
+  STATE_NAME_CASES does when state names may not stand for an LGA (as when
+  clustering events)
+- one of the FOREIGN_CASES (places outside Nigeria) resolves to an LGA, or
+  gets a state from extract_state_from_location
+
+Also reports how many locations naming only an LGA or a town get a state from
+the state keywords alone and from extract_state_from_location (keywords, then
+gazetteer), and the lookup times of exact and misspelt names.
+
+    python tests/benchmark_gazetteer.py [--runs 2000]
+"""
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from Algorithm.filter import STATE_KEYWORDS, STATE_MATCHER, extract_state_from_location
+from Algorithm.gazetteer import GazetteerIndex, normalize_place
+
+# (location, state already known, expected state, expected LGA)
+CASES = [
+    ("Gwoza, Borno State", None, "Borno", "Gwoza"),
+    ("Kafanchan", None, "Kaduna", "Jema'a"),
+    ("Kuriga community", None, "Kaduna", "Chikun"),
+    ("Yelwata, Guma LGA", None, "Benue", "Guma"),
+    ("Dapchi", None, "Yobe", "Bursari"),
+    ("Obio-Akpor", None, "Rivers", "Obio/Akpor"),
+    ("Birnin-Gwari road", None, "Kaduna", "Birnin Gwari"),
+    ("Surulere, Lagos", "Lagos", "Lagos", "Surulere"),
+    ("Surulere, Ogbomoso", None, "Oyo", "Surulere"),
+    ("Surulere", None, None, None),
+    ("Maidugiri", None, "Borno", "Maiduguri"),
+    ("Kachiya, Kaduna", "Kaduna", "Kaduna", "Kachia"),
+    ("Abuja", None, None, None),
+    ("Northern Nigeria", None, None, None),
+]
+
+# (location, expected LGA) with state_names=False: a bare state name is not its capital LGA
+STATE_NAME_CASES = [
+    ("Gombe, Nigeria", None),
+    ("Katsina, Nigeria", None),
+    ("Bauchi", None),
+    ("Lagos, Nigeria", None),
+    ("Billiri, Gombe", "Billiri"),
+    ("Yenagoa, Bayelsa State", "Yenagoa"),
+]
+
+# Outside Nigeria: no LGA, no state (they once fuzzy-matched Khana, Kudan, Wamako, Alaba)
+FOREIGN_CASES = [
+    "Accra, Greater Accra, Ghana",
+    "Kumasi, Ghana",
+    "Sudan",
+    "Juba, South Sudan",
+    "Bamako, Mali",
+    "Bamako",
+    "Addis Ababa",
+    "Bali, Indonesia",
+    "Douala, Cameroon",
+]
+
+NIGERIA_BOUNDS = ((4.0, 14.0), (2.6, 14.7))
+
+
+def check_data(gazetteer):
+    failures = []
+    states = {entry["state"] for entry in gazetteer.entries}
+    if len(gazetteer.entries) != 774 or len(states) != 37:
+        failures.append(f"{len(gazetteer.entries)} LGAs in {len(states)} states, expected 774 in 37")
+    (south, north), (west, east) = NIGERIA_BOUNDS
+    for entry in gazetteer.entries:
+        if not (south < entry["latitude"] < north and west < entry["longitude"] < east):
+            failures.append(f"{entry['lga']}, {entry['state']} is outside Nigeria")
+    return failures
+
+
+def check_cases(gazetteer):
+    failures = []
+    for location, state, expected_state, expected_lga in CASES:
+        place = gazetteer.lookup(location, state)
+        got = (place["state"], place["lga"]) if place else (None, None)
+        if got != (expected_state, expected_lga):
+            failures.append(f"{location!r}: {got} != {(expected_state, expected_lga)}")
+    for location, expected_lga in STATE_NAME_CASES:
+        place = gazetteer.lookup(location, state_names=False)
+        got = place["lga"] if place else None
+        if got != expected_lga:
+            failures.append(f"{location!r} (state_names=False): {got} != {expected_lga}")
+    for location in FOREIGN_CASES:
+        place = gazetteer.lookup(location)
+        if place:
+            failures.append(f"{location!r} is outside Nigeria, resolved to {place['lga']}, {place['state']}")
+        state = extract_state_from_location(location)
+        if state:
+            failures.append(f"{location!r} is outside Nigeria, given the state {state}")
+    return failures
+
+
+def keyword_state(location):
+    """ State from the state keywords alone (extract_state_from_location before the gazetteer) """
+    hits = STATE_MATCHER.find_all(normalize_place(location))
+    return max(hits, key=lambda hit: hit[1] - hit[0])[2][0] if hits else None
+
+
+def coverage(gazetteer):
+    """ LGA names and towns (not themselves state keywords), as Gemini would report them """
+    keywords = {normalize_place(keyword) for keywords in STATE_KEYWORDS.values() for keyword in keywords}
+    locations = [
+        (name.title(), gazetteer.entries[indexes[0]]["state"])
+        for name, indexes in gazetteer.names.items()
+        if name not in keywords and len({gazetteer.entries[index]["state"] for index in indexes}) == 1
+    ]
+    by_keywords = sum(1 for location, state in locations if keyword_state(location) == state)
+    resolved = sum(1 for location, state in locations if extract_state_from_location(location) == state)
+    return len(locations), by_keywords, resolved
+
+
+def time_lookup(gazetteer, location, runs):
+    start = time.perf_counter()
+    for _ in range(runs):
+        gazetteer.lookup(location)
+    return (time.perf_counter() - start) / runs * 1e6
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument("--runs", type=int, default=2000)
+    args = arg_parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    start = time.perf_counter()
+    gazetteer = GazetteerIndex.load()
+    build_ms = (time.perf_counter() - start) * 1000
+    if gazetteer is None:
+        print("FAILED: gazetteer could not be loaded")
+        return 1
+
+    failures = check_data(gazetteer) + check_cases(gazetteer)
+    total, by_keywords, resolved = coverage(gazetteer)
+
+    print(f"Gazetteer: {len(gazetteer.entries)} LGAs, {len(gazetteer.names)} place names, built in {build_ms:.0f} ms")
+    print(f"LGA / town locations given a state: keywords {by_keywords}/{total}, keywords + gazetteer {resolved}/{total}")
+    print(f"{'Lookup':<36}{'us':>10}")
+    for location in ("Gwoza, Borno State", "Kafanchan", "Maidugiri", "Unknown village in the north east"):
+        print(f"{location:<36}{time_lookup(gazetteer, location, args.runs):>10.1f}")
+
+    for failure in failures:
+        print(f"  {failure}")
+    print("FAILED" if failures else "PASSED")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
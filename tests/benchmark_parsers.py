@@ -0,0 +1,150 @@
+"""
+Compare the BeautifulSoup adapters with the lxml selector engine (scrapper.extractor).
+
+Reads one saved homepage per source from a directory (default: the snapshot
+corpus in tests/fixtures/snapshots), named after the adapter module
+(punch.txt, vanguard.txt, ... or the gzipped .html.gz form), and for each
+engine reports the median parse time, the peak resident memory growth and
+whether the lxml output is identical to the adapter output.
+
+    python tests/benchmark_parsers.py [snapshot_dir] [runs]
+
+Every (source, engine) pair is measured in a fresh process so the memory figures
+include libxml2's C allocations, which tracemalloc cannot see.
+"""
+import gzip
+import multiprocessing
+import resource
+import statistics
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from scrapper.registry import SOURCES
+from scrapper.extractor import extract_parsed_data
+
+
+def snapshot_name(source):
+    """ Snapshot files are named after the source's adapter module """
+    return source["parser"].__module__.rsplit(".", 1)[-1]
+
+
+def load_snapshot(directory, source):
+    """
+    Read a saved homepage for a source
+    Returns:
+        html_content or None when there is no snapshot for it
+    """
+    name = snapshot_name(source)
+    gz_path = Path(directory) / f"{name}.html.gz"
+    txt_path = Path(directory) / f"{name}.txt"
+    if gz_path.exists():
+        with gzip.open(gz_path, "rt", encoding="utf-8") as f:
+            return f.read()
+    if txt_path.exists():
+        with open(txt_path, "r", encoding="utf-8") as f:
+            return f.read()
+    return None
+
+
+def comparable(parsed_data):
+    """
+    The article records of a parse result. The envelope (source label, source_url,
+    scraped_at) is not compared: the pipeline takes source identity from the registry
+    """
+    if parsed_data is None:
+        return None
+    return parsed_data["articles"]
+
+
+def reset_peak_rss():
+    """ Reset the process's peak RSS (Linux); returns the RSS to measure growth from """
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        return read_rss_kb("VmRSS")
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def read_rss_kb(field="VmHWM"):
+    """ Peak (VmHWM) or current (VmRSS) resident memory in KB """
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith(field):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def measure(source, engine, html_content, runs):
+    """
+    Parse one snapshot repeatedly with one engine (runs in a child process)
+    Returns:
+        (timings, peak_kb, parsed_data)
+    """
+    import logging
+    logging.disable(logging.INFO)
+
+    if engine == "lxml":
+        def parser(content):
+            return extract_parsed_data(source["name"], source["url"], source["selectors"], content)
+    else:
+        parser = source["parser"]
+
+    baseline = reset_peak_rss()
+    timings = []
+    parsed_data = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        parsed_data = parser(html_content)
+        timings.append(time.perf_counter() - start)
+    peak_kb = read_rss_kb() - baseline
+    return timings, peak_kb, comparable(parsed_data)
+
+
+def run_isolated(source, engine, html_content, runs):
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+        return executor.submit(measure, source, engine, html_content, runs).result()
+
+
+def main(directory, runs):
+    header = f"{'Source':<24}{'Articles':>9}{'bs4 ms':>10}{'lxml ms':>10}{'Speedup':>9}{'bs4 KB':>10}{'lxml KB':>10}  Identical"
+    print(header)
+    print("-" * len(header))
+
+    for source in SOURCES:
+        html_content = load_snapshot(directory, source)
+        if html_content is None:
+            print(f"{source['name']:<24}  no snapshot ({snapshot_name(source)}.txt)")
+            continue
+
+        bs4_times, bs4_kb, bs4_result = run_isolated(source, "bs4", html_content, runs)
+        lxml_times, lxml_kb, lxml_result = run_isolated(source, "lxml", html_content, runs)
+
+        bs4_ms = statistics.median(bs4_times) * 1000
+        lxml_ms = statistics.median(lxml_times) * 1000
+        articles = len(bs4_result) if bs4_result else 0
+        identical = "yes" if bs4_result == lxml_result else "NO"
+        print(f"{source['name']:<24}{articles:>9}{bs4_ms:>10.1f}{lxml_ms:>10.1f}{bs4_ms / lxml_ms:>8.1f}x"
+              f"{bs4_kb:>10}{lxml_kb:>10}  {identical}")
+
+        if bs4_result != lxml_result and bs4_result and lxml_result:
+            for index, (expected, actual) in enumerate(zip(bs4_result, lxml_result)):
+                if expected != actual:
+                    print(f"    first difference at article {index}:\n      bs4:  {expected}\n      lxml: {actual}")
+                    break
+            else:
+                print(f"    article counts differ: bs4 {len(bs4_result)}, lxml {len(lxml_result)}")
+
+
+if __name__ == "__main__":
+    directory = sys.argv[1] if len(sys.argv) > 1 else Path(__file__).resolve().parent / "fixtures" / "snapshots"
+    runs = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    main(directory, runs)
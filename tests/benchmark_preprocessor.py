@@ -0,0 +1,196 @@
+"""
+Benchmark of scrapper.preprocessor against the per-article implementation it
+replaced, on a corpus of --size articles (default 10k) built from the adapter
+output of the snapshot corpus in tests/fixtures/snapshots, with the date
+strings the sources print (relative times, "Jan 5, 2026", ISO timestamps,
+undated items).
+
+Both implementations must date every article identically; the run fails
+(exit code 1) when they differ. (Hashes are not compared: the article hash is
+now keyed on the canonical url, see scrapper.canonical.)
+
+    python tests/benchmark_preprocessor.py [--size 10000] [--runs 5]
+"""
+import argparse
+import copy
+import logging
+import random
+import re
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from dateutil import parser
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmark_parsers import load_snapshot
+from scrapper.registry import SOURCES
+from scrapper import preprocessor as batch
+from scrapper.preprocessor import compute_article_hash
+
+SNAPSHOT_DIR = Path(__file__).resolve().parent / "fixtures" / "snapshots"
+
+
+# --- Previous implementation (one article at a time, uncompiled patterns, dateutil per article) ---
+
+def legacy_parse_relative_time(text, reference_time):
+    if not text:
+        return None
+    text = text.lower().strip()
+    if text == "yesterday":
+        return reference_time - timedelta(days=1)
+    match = re.search(r"(\d+)\s*(min|mins|minute|minutes|hr|hrs|hour|hours|day|days)", text)
+    if not match:
+        return None
+    value = int(match.group(1))
+    unit = match.group(2)
+    if unit.startswith("min"):
+        return reference_time - timedelta(minutes=value)
+    if unit.startswith("hr") or unit.startswith("hour"):
+        return reference_time - timedelta(hours=value)
+    if unit.startswith("day"):
+        return reference_time - timedelta(days=value)
+    return None
+
+
+def legacy_extract_date_from_string(text):
+    try:
+        if not text:
+            return None
+        match = re.search(r"(20\d{2})[/-](\d{2})(?:[/-](\d{2}))?", text)
+        if not match:
+            return None
+        year, month, day = match.group(1), match.group(2), match.group(3) or "01"
+        return datetime(int(year), int(month), int(day))
+    except ValueError:
+        return None
+
+
+def legacy_preprocessor(data):
+    scraped_at = parser.isoparse(data["scraped_at"])
+    for article in data.get("articles", []):
+        published_at = None
+        if "date_posted" in article:
+            published_at = legacy_parse_relative_time(article["date_posted"], scraped_at)
+        if not published_at and article.get("date_posted"):
+            try:
+                published_at = parser.parse(article["date_posted"])
+            except Exception:
+                pass
+        if not published_at:
+            published_at = legacy_extract_date_from_string(article.get("image_url"))
+        if not published_at:
+            published_at = legacy_extract_date_from_string(article.get("url"))
+        if not published_at:
+            published_at = scraped_at
+        article["published_at"] = published_at.isoformat()
+        article["hash"] = compute_article_hash(article.get("title", ""), article.get("url", ""))
+    return data
+
+
+# --- Corpus ---
+
+def date_text(rng, now):
+    """ A date string in one of the forms the sources print """
+    kind = rng.random()
+    if kind < 0.45:
+        return f"{rng.randint(1, 59)} {rng.choice(['mins', 'hrs', 'hours', 'days'])} ago"
+    if kind < 0.50:
+        return "yesterday"
+    day = now - timedelta(days=rng.randint(0, 60))
+    if kind < 0.70:
+        return day.strftime("%b %-d, %Y")
+    if kind < 0.80:
+        return day.strftime("%B %-d, %Y")
+    if kind < 0.90:
+        return day.replace(hour=rng.randint(0, 23), minute=rng.randint(0, 59)).isoformat() + "+01:00"
+    return None  # undated: falls through to the image url, article url or scrape time
+
+
+def build_corpus(size, seed=7):
+    """
+    Adapter records of every snapshot, repeated with varied titles and date
+    strings up to `size` articles
+    Returns:
+        Adapter-style result dict
+    """
+    rng = random.Random(seed)
+    now = datetime(2026, 1, 15, 12, 0)
+    records = []
+    for source in SOURCES:
+        html_content = load_snapshot(str(SNAPSHOT_DIR), source)
+        if html_content:
+            records.extend(source["parser"](html_content)["articles"])
+
+    articles = []
+    while len(articles) < size:
+        record = rng.choice(records)
+        article = {
+            "title": f"{record['title']} {len(articles)}",
+            "url": record.get("news_url", ""),
+            "image_url": record.get("image_url"),
+        }
+        text = date_text(rng, now)
+        if text:
+            article["date_posted"] = text
+        articles.append(article)
+    return {"source": "corpus", "scraped_at": now.isoformat(), "articles": articles}
+
+
+def time_runs(function, corpus, runs, before=None):
+    """ Fastest of `runs` timings (ms) and the last result """
+    best, result = None, None
+    for _ in range(runs):
+        data = copy.deepcopy(corpus)
+        if before:
+            before()
+        start = time.perf_counter()
+        result = function(data)
+        elapsed = (time.perf_counter() - start) * 1000
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def clear_caches():
+    batch.relative_offset.cache_clear()
+    batch.parse_absolute_date.cache_clear()
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument("--size", type=int, default=10000)
+    arg_parser.add_argument("--runs", type=int, default=5)
+    args = arg_parser.parse_args()
+
+    logging.disable(logging.INFO)
+    corpus = build_corpus(args.size)
+
+    legacy_ms, legacy = time_runs(legacy_preprocessor, corpus, args.runs)
+    batch_ms, result = time_runs(batch.preprocessor, corpus, args.runs, before=clear_caches)
+
+    mismatches = sum(
+        1 for old, new in zip(legacy["articles"], result["articles"])
+        if old["published_at"] != new["published_at"]
+    )
+
+    size = len(corpus["articles"])
+    print(f"Articles: {size}, Runs: {args.runs} (fastest run, date caches cleared before each)")
+    print(f"{'Implementation':<16}{'ms':>10}{'articles/s':>14}")
+    print(f"{'per-article':<16}{legacy_ms:>10.1f}{size / legacy_ms * 1000:>14.0f}")
+    print(f"{'batch':<16}{batch_ms:>10.1f}{size / batch_ms * 1000:>14.0f}")
+    print(f"Speed-up: {legacy_ms / batch_ms:.1f}x")
+    print("Published At Sources: " + ", ".join(f"{source} {share:.1%}" for source, share in result["published_at_sources"].items()))
+    info = batch.parse_absolute_date.cache_info()
+    print(f"Absolute date memo: {info.hits} hits, {info.misses} misses")
+
+    if mismatches:
+        print(f"FAILED: {mismatches} articles dated differently")
+        return 1
+    print("PASSED")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
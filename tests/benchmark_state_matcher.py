@@ -0,0 +1,131 @@
+"""
+Micro-benchmark of Algorithm.filter.extract_state_from_location (one pass of
+the prebuilt keyword automaton) against the implementation it replaced (one
+regex search per keyword, state by state), on --size location strings in the
+forms Gemini returns ("Maiduguri, Borno State", "Lagos, Nigeria", "Nigeria").
+
+Where a string names a single state both must agree; the run fails (exit code
+1) otherwise. Two kinds of difference are expected and listed separately:
+- hyphenated keywords ("Ado-Ekiti", "Ile-Ife") the old function never matched,
+  as it stripped punctuation from the string but not from the keywords
+- strings naming several states: the old function answered with whichever
+  state came first in STATE_KEYWORDS, the new one with the longest / most
+  specific match
+
+    python tests/benchmark_state_matcher.py [--size 5000] [--runs 5]
+"""
+import argparse
+import logging
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from Algorithm.filter import STATE_KEYWORDS, STATE_MATCHER, extract_state_from_location
+from Algorithm.gazetteer import normalize_place
+
+
+# --- Previous implementation ---
+
+def legacy_extract_state_from_location(location_string):
+    if not location_string:
+        return None
+    location_clean = re.sub(r'[^\w\s]', '', location_string.lower().strip())
+    for state, keywords in STATE_KEYWORDS.items():
+        for keyword in keywords:
+            if re.search(rf'\b{re.escape(keyword.lower())}\b', location_clean):
+                return state
+    return None
+
+
+# --- Corpus ---
+
+FILLERS = ["", "Nigeria", "community", "market", "LGA", "road", "police station", "northern", "village"]
+
+
+def build_corpus(size, seed=11):
+    """ Location strings built from the keywords, plus some that name no state """
+    rng = random.Random(seed)
+    aliases = [(state, alias) for state, keywords in STATE_KEYWORDS.items() for alias in keywords]
+    corpus = []
+    while len(corpus) < size:
+        kind = rng.random()
+        if kind < 0.6:
+            state, alias = rng.choice(aliases)
+            text = f"{alias.title()}, {state} State" if rng.random() < 0.5 else alias.title()
+        elif kind < 0.8:
+            state, alias = rng.choice(aliases)
+            text = f"{rng.choice(FILLERS).title()} {alias}, {rng.choice(FILLERS)}"
+        elif kind < 0.9:
+            text = rng.choice(["Nigeria", "North-East Nigeria", "Unknown", "Sahel region", "Nigerian border"])
+        else:
+            text = f"{rng.choice(aliases)[1]} and {rng.choice(aliases)[1]}"
+        corpus.append(text)
+    return corpus
+
+
+def states_named(text):
+    return {value[0] for _, _, value in STATE_MATCHER.find_all(normalize_place(text))}
+
+
+def time_runs(function, corpus, runs):
+    """ Fastest of `runs` timings (ms) and the results of the last run """
+    best, results = None, None
+    for _ in range(runs):
+        start = time.perf_counter()
+        results = [function(text) for text in corpus]
+        elapsed = (time.perf_counter() - start) * 1000
+        best = elapsed if best is None else min(best, elapsed)
+    return best, results
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument("--size", type=int, default=5000)
+    arg_parser.add_argument("--runs", type=int, default=5)
+    args = arg_parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    corpus = build_corpus(args.size)
+
+    legacy_ms, legacy = time_runs(legacy_extract_state_from_location, corpus, args.runs)
+    matcher_ms, result = time_runs(extract_state_from_location, corpus, args.runs)
+
+    mismatches, recovered, resolved = [], [], []
+    for text, old, new in zip(corpus, legacy, result):
+        if old == new:
+            continue
+        if old is None and "-" in text:
+            recovered.append((text, old, new))
+        elif len(states_named(text)) > 1:
+            resolved.append((text, old, new))
+        else:
+            mismatches.append((text, old, new))
+
+    size = len(corpus)
+    print(f"Locations: {size}, Runs: {args.runs} (fastest run)")
+    print(f"{'Implementation':<16}{'ms':>10}{'us/call':>10}")
+    print(f"{'regex per key':<16}{legacy_ms:>10.1f}{legacy_ms / size * 1000:>10.1f}")
+    print(f"{'automaton':<16}{matcher_ms:>10.1f}{matcher_ms / size * 1000:>10.1f}")
+    print(f"Speed-up: {legacy_ms / matcher_ms:.1f}x")
+    print(f"Hyphenated names now matched: {len(recovered)}")
+    for text, old, new in recovered[:5]:
+        print(f"  {text!r}: {old} -> {new}")
+    print(f"Several states named, resolved differently: {len(resolved)}")
+    for text, old, new in resolved[:5]:
+        print(f"  {text!r}: {old} -> {new}")
+
+    if mismatches:
+        print(f"FAILED: {len(mismatches)} single-state locations resolved differently")
+        for text, old, new in mismatches[:10]:
+            print(f"  {text!r}: {old} -> {new}")
+        return 1
+    print("PASSED")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
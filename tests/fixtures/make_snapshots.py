@@ -0,0 +1,186 @@
+"""
+Build the homepage snapshot corpus used by tests/benchmark_corpus.py.
+
+Each snapshot reproduces the markup every section of an adapter in
+scrapper/adapter/ looks for (class names, nesting, lazy-load attributes),
+filled with deterministic articles, so the corpus exercises all eight
+adapters offline. Real pages saved from the sites can replace any file
+as long as they keep the <adapter module>.html.gz name.
+
+    python tests/fixtures/make_snapshots.py [output_dir] [articles_per_section]
+"""
+import gzip
+import sys
+from pathlib import Path
+
+SNAPSHOT_DIR = Path(__file__).resolve().parent / "snapshots"
+
+n = 25
+counter = [0]
+
+
+def t(prefix):
+    """ Unique, deterministic headline """
+    counter[0] += 1
+    return f"{prefix} headline number {counter[0]} about Lagos flood"
+
+
+def page(body, title):
+    """ Wrap a body in a document with the script and ad noise of a real homepage """
+    filler = "".join(f'<script>var x{i} = "{"y" * 200}";</script><div class="ad-slot"><span>Ad</span></div>' for i in range(20))
+    return f"<!DOCTYPE html><html><head><title>{title}</title>{filler}</head><body>{body}</body></html>"
+
+
+def punch():
+    b = '<div class="just-in-timeline"><ul>'
+    for i in range(n):
+        b += f'<li class="new-item"><h3 class="entry-title"><a href="https://punchng.com/a{i}/">{t("Punch latest")}</a></h3><div class="meta-time">{i+1} hrs ago</div></li>'
+    b += '</ul></div>'
+    b += f'<div class="feature-article"><h2 class="post-title"><a href="https://punchng.com/feat/">{t("Punch featured")}</a></h2><img data-src="https://cdn.punchng.com/2026/01/f.jpg" src="lazy.gif"></div>'
+    b += '<div class="top-news">' + "".join(f'<article><h2 class="post-title"><a href="https://punchng.com/top{i}/">{t("Punch top")}</a></h2><img src="https://cdn.punchng.com/2026/01/t{i}.jpg"></article>' for i in range(n)) + '</div>'
+    b += '<div class="col-lg-12 nine-post"><h2 class="header-title"><a>Metro Plus</a></h2>'
+    b += f'<div class="news-widget-1"><h2 class="post-title"><a href="https://punchng.com/m/">{t("Punch metro main")}</a></h2><img data-src="https://cdn.punchng.com/m.jpg"></div>'
+    b += '<div class="news-widget-2">' + "".join(f'<article><h2 class="post-title"><a href="https://punchng.com/ms{i}/">{t("Punch metro side")}</a></h2></article>' for i in range(n)) + '</div></div>'
+    for sec in ["Business", "Politics", "Sports"]:
+        b += f'<div class="news-section-three"><h2 class="header-title"><a>{sec}</a></h2>' + "".join(f'<article><h2 class="post-title"><a href="https://punchng.com/{sec}{i}/">{t("Punch "+sec)}</a></h2><img src="https://cdn.punchng.com/{sec}{i}.jpg"></article>' for i in range(n)) + '</div>'
+    return page(b, "Punch")
+
+
+def channels():
+    b = f'<div class="leading-article"><h3 class="post-title"><a href="https://www.channelstv.com/lead/">{t("Channels lead")}</a></h3></div>'
+    b += '<div class="main__article-thumbnail"><img data-lazy-src="https://www.channelstv.com/wp-content/uploads/2026/01/lead.jpg" src="x.gif"></div>'
+    def posts(prefix, time=False):
+        r = ""
+        for i in range(n):
+            cls = "post-title" if i % 2 else "sumry-title"
+            r += f'<article class="post"><h3 class="{cls}"><a href="https://www.channelstv.com/{prefix}{i}/">{t("Channels "+prefix)}</a></h3><img data-lazy-src="https://www.channelstv.com/{prefix}{i}.jpg">'
+            if time: r += f'<div class="post_time"><span>{i+2} mins ago</span></div>'
+            r += '</article>'
+        return r
+    b += f'<section class="headlines">{posts("top", True)}</section>'
+    b += f'<section class="features"><h3>AFCON 2025</h3>{posts("afcon")}</section>'
+    b += f'<section class="more_stories">{posts("more")}</section>'
+    b += f'<div class="latest_stories">{posts("latest", True)}</div>'
+    b += f'<section class="sports">{posts("sports")}</section>'
+    b += f'<section class="politics">{posts("politics")}</section>'
+    return page(b, "Channels")
+
+
+def vanguard():
+    def entry(cls, prefix, i, time=False):
+        r = f'<article class="{cls}"><h3 class="entry-title"><a href="https://www.vanguardngr.com/2026/01/{prefix}{i}/">{t("Vanguard "+prefix)}</a></h3><img data-lazy-src="https://cdn.vanguardngr.com/2026/01/{prefix}{i}.jpg" src="x.gif">'
+        if time: r += f'<div class="entry-date">{i+1} hours ago</div>'
+        return r + '</article>'
+    b = '<div class="section-format-vertical_list"><h2 class="heading-title">Latest News</h2>' + "".join(entry("entry", "latest", i, True) for i in range(n)) + '</div>'
+    b += '<section class="section-category-preview"><h2 class="heading-title">Politics</h2>' + "".join(entry("entry-card", "pol", i) for i in range(n)) + '</section>'
+    for sec in ["News", "Metro", "Entertainment", "Sports", "Business"]:
+        b += f'<div class="section-fulwidth"><h2 class="heading-title">{sec}</h2>'
+        b += f'<div class="section-content-featured"><h3 class="entry-title"><a href="https://www.vanguardngr.com/f{sec}/">{t("Vanguard featured "+sec)}</a></h3><img src="https://cdn.vanguardngr.com/f{sec}.jpg"></div>'
+        b += '<div class="section-content-entry-list">' + "".join(entry("entry-card", sec, i) for i in range(n)) + '</div></div>'
+    b += '<div class="section-format-horizontal_list">' + "".join(entry("entry", "col", i, True) for i in range(n)) + '</div>'
+    return page(b, "Vanguard")
+
+
+def premium():
+    def post(tag, prefix, i):
+        return (f'<article class="jeg_post"><{tag} class="jeg_post_title"><a href="https://www.premiumtimesng.com/{prefix}{i}.html">{t("Premium "+prefix)}</a></{tag}>'
+                f'<div class="thumbnail-container"><img data-src="https://media.premiumtimesng.com/wp-content/files/2026/01/{prefix}{i}.jpg" src="x.gif"></div>'
+                f'<div class="jeg_meta_date"><a href="#">January {i+1}, 2026</a></div></article>')
+    b = (f'<article class="jeg_post jeg_hero_item_1"><h2 class="jeg_post_title"><a href="https://www.premiumtimesng.com/hero.html">{t("Premium hero")}</a></h2>'
+         '<div class="thumbnail-container"><img src="https://media.premiumtimesng.com/hero.jpg"></div><div class="jeg_meta_date"><a>January 9, 2026</a></div></article>')
+    for blk, name in [("jeg_postblock_21", "Top News"), ("jeg_postblock_22", "More News"), ("jeg_postblock_39", "Investigations")]:
+        b += f'<div class="jeg_postblock {blk}"><div class="jeg_block_heading"><h3>{name}</h3></div>' + "".join(post("h3", blk, i) for i in range(n)) + '</div>'
+    b += '<div class="jeg_newsfeed_list">' + "".join(f'<div class="jeg_newsfeed_item"><h3 class="jeg_post_title"><a href="https://www.premiumtimesng.com/feed{i}.html">{t("Premium feed")}</a></h3><img src="https://media.premiumtimesng.com/feed{i}.jpg"></div>' for i in range(n)) + '</div>'
+    return page(b, "Premium Times")
+
+
+def businessday():
+    def art(prefix, i, title_tag="h2", time_cls="post-time", img=True):
+        r = f'<article><{title_tag} class="post-title"><a href="https://businessday.ng/{prefix}/article/{i}/">{t("BusinessDay "+prefix)}</a></{title_tag}><span class="{time_cls}">{i+1} hours ago</span>'
+        if img: r += f'<img data-src="https://cdn.businessday.ng/2026/01/{prefix}{i}.jpg">'
+        return r + '</article>'
+    b = '<div class="top_stories">' + "".join(art("top", i, time_cls="time", img=False) for i in range(n)) + '</div>'
+    b += f'<div class="main"><article><h2><a href="https://businessday.ng/main/">{t("BusinessDay main")}</a></h2><span class="post-time">1 hour ago</span><img src="https://cdn.businessday.ng/main.jpg"></article></div>'
+    b += '<div class="recent">' + "".join(art("recent", i, time_cls="time", img=False) for i in range(n)) + '</div>'
+    b += '<div class="pro-section">' + "".join(art("pro", i, time_cls="post-date") for i in range(n)) + '</div>'
+    b += '<div class="other-news-section">' + "".join(art("other", i) for i in range(n)) + '</div>'
+    b += '<div class="columnist-news">' + "".join(art("columnist", i, img=False) for i in range(n)) + '</div>'
+    b += '<div class="opinion-news">' + "".join(art("opinion", i, title_tag="p", img=False) for i in range(n)) + '</div>'
+    for sec in ["Economy", "Energy", "Technology"]:
+        b += f'<section class="news-block-2"><div class="section-heading"><a href="#"><span>{sec}</span></a></div>' + "".join(art(sec, i, time_cls="post-date") for i in range(n)) + '</section>'
+    b += '<section class="news-block-3"><div class="section-heading"><a><span>Partner Content</span></a></div>' + "".join(art("partner", i, time_cls="post-date") for i in range(n)) + '</section>'
+    return page(b, "BusinessDay")
+
+
+def sahara():
+    months = ["January", "February", "March"]
+    b = '<div class="view-content">'
+    for i in range(n * 6):
+        b += (f'<div class="node node--type-article"><h2 class="title"><a href="/2026/01/{i:02d}/story-{i}">{t("Sahara")}</a></h2>'
+              f'<img property="schema:image" src="/sites/default/files/styles/2026-01/s{i}.jpg">'
+              f'<div class="field">{months[i % 3]} {i % 27 + 1}, 2026</div></div>')
+    return page(b + '</div>', "Sahara")
+
+
+def guardian():
+    b = f'<div class="breaking-news-widget"><span>Breaking</span><a href="https://guardian.ng/breaking/">{t("Guardian breaking")}</a></div>'
+    b += '<section class="top-section">'
+    b += f'<article class="top-news-article"><h2 class="post-title"><a href="https://guardian.ng/top/">{t("Guardian top")}</a></h2><img src="https://guardian.ng/top.jpg"></article>'
+    b += "".join(f'<article class="top-section-news-widget-one"><h2 class="post-title"><a href="https://guardian.ng/side{i}/">{t("Guardian side")}</a></h2><img src="https://guardian.ng/side{i}.jpg"></article>' for i in range(3))
+    b += '</section><div class="latest-news-top-section">'
+    b += "".join(f'<article><h2><a href="https://guardian.ng/latest{i}/">{t("Guardian latest")}</a></h2><div class="post-meta"><span>News</span><span>{i+1} hours ago</span></div></article>' for i in range(n))
+    b += '</div>'
+    for sec in ["News", "Metro", "Politics"]:
+        b += f'<section class="news-group-one"><header><h2><a>{sec}</a></h2></header>'
+        b += "".join(f'<article class="news-type-one"><h2 class="post-title"><a href="https://guardian.ng/{sec}/one{i}/">{t("Guardian one "+sec)}</a></h2><img data-src="https://guardian.ng/{sec}{i}.jpg"></article>' for i in range(2))
+        b += "".join(f'<article class="news-type-two"><h2 class="post-title"><a href="https://guardian.ng/{sec}/two{i}/">{t("Guardian two "+sec)}</a></h2><img src="https://guardian.ng/{sec}t{i}.jpg"><span class="post-date">{i+3} hours ago</span></article>' for i in range(n))
+        b += "".join(f'<article class="news-type-three"><h2 class="post-title"><a href="https://guardian.ng/{sec}/three{i}/">{t("Guardian three "+sec)}</a></h2><span class="post-date">{i+3} hours ago</span></article>' for i in range(n))
+        b += '</section>'
+    b += '<section class="news-group-two"><header><h2><a>Health</a></h2></header>' + "".join(f'<article class="news-type-four"><h2 class="post-title"><a href="https://guardian.ng/health{i}/">{t("Guardian four")}</a></h2><img src="https://guardian.ng/h{i}.jpg"><p class="post-meta">{i+1} days ago</p></article>' for i in range(n)) + '</section>'
+    b += '<section class="news-group-three"><header><h2><a>Sport</a></h2></header>'
+    b += "".join(f'<article class="news-type-five"><h2 class="post-title"><a href="https://guardian.ng/five{i}/">{t("Guardian five")}</a></h2><img src="https://guardian.ng/f{i}.jpg"></article>' for i in range(2))
+    b += "".join(f'<article class="news-type-two"><h2 class="post-title"><a href="https://guardian.ng/sport{i}/">{t("Guardian sport")}</a></h2><span class="post-date">2 days ago</span></article>' for i in range(n))
+    b += '</section>'
+    for cls, dt in [("guardian-life-section", None), ("gwoman-section", "p"), ("gangels-section", "span"), ("gtv-section", "p"), ("marie-claire-section", "span")]:
+        b += f'<section class="{cls}">'
+        for i in range(n):
+            b += f'<article><h2 class="post-title"><a href="https://guardian.ng/{cls}/{i}/">{t("Guardian "+cls)}</a></h2><img data-src="https://guardian.ng/{cls}{i}.jpg">'
+            if dt: b += f'<{dt} class="post-date">January {i+1}, 2026</{dt}>'
+            b += '</article>'
+        b += '</section>'
+    return page(b, "Guardian")
+
+
+def arise():
+    def snip(prefix, i):
+        return f'<article class="snippet"><h3><a href="https://www.arise.tv/{prefix}-{i}/">{t("Arise "+prefix)}</a></h3><img class="wp-post-image" src="https://www.arise.tv/wp-content/uploads/2026/01/{prefix}{i}.jpg"></article>'
+    b = f'<article class="snippet typography featured"><h3><a href="https://www.arise.tv/featured/">{t("Arise featured")}</a></h3><img class="wp-post-image" src="https://www.arise.tv/featured.jpg"></article>'
+    b += '<div class="panel"><h2 class="panel-title">Latest News</h2>' + "".join(snip("latest", i) for i in range(n)) + '</div>'
+    for sec in ["Global", "Africa", "Politics", "Business"]:
+        b += f'<div class="panel"><h2 class="panel-title"><a href="#">{sec}</a></h2>' + "".join(snip(sec, i) for i in range(n)) + '</div>'
+    b += '<div class="epyt-gallery">' + "".join(f'<div class="epyt-gallery-thumb" data-videoid="vid{i}"><div class="epyt-gallery-img" style="background-image: url(https://i.ytimg.com/vi/vid{i}/hq.jpg)"></div><div class="epyt-gallery-title">{t("Arise video")}</div></div>' for i in range(n)) + '</div>'
+    b += '<div class="arise-sidebar"><div class="panel"><h2 class="panel-title">Popular</h2>' + "".join(snip("popular", i) for i in range(n)) + '</div></div>'
+    b += '<div class="arise-sidebar"><div class="panel"><h2 class="panel-title"><a>Top Stories</a></h2>' + "".join(snip("topstories", i) for i in range(n)) + '</div></div>'
+    return page(b, "Arise")
+
+SNAPSHOTS = {
+    "punch": punch,
+    "channeltv": channels,
+    "vanguard": vanguard,
+    "premuimtimes": premium,
+    "businessday": businessday,
+    "saharareporters": sahara,
+    "guardian": guardian,
+    "arise": arise,
+}
+
+
+if __name__ == "__main__":
+    out = Path(sys.argv[1]) if len(sys.argv) > 1 else SNAPSHOT_DIR
+    n = int(sys.argv[2]) if len(sys.argv) > 2 else n
+    out.mkdir(parents=True, exist_ok=True)
+    for name, build in SNAPSHOTS.items():
+        # mtime=0 keeps the gzip output byte-identical between runs
+        with open(out / f"{name}.html.gz", "wb") as raw, gzip.GzipFile(fileobj=raw, mode="wb", mtime=0) as f:
+            f.write(build().encode("utf-8"))
+        print(f"Wrote {out / name}.html.gz")
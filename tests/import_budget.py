@@ -0,0 +1,90 @@
+"""
+Import-time budget of the API module.
+
+Imports Auth.app in fresh interpreters with the Telegram and database
+credentials removed from the environment, and fails (exit code 1) when:
+- the import raises (a resource is being created at import time)
+- the import opens the database pool, or loads Telethon or Playwright
+- the fastest of --runs imports takes longer than --budget milliseconds
+
+    python tests/import_budget.py [--module Auth.app] [--runs 5] [--budget 1500]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+CREDENTIALS = ("TG_API_ID", "TG_API_HASH", "DB_HOST", "DB_NAME", "DB_USER", "DB_PASSWORD", "DB_PORT")
+HEAVY_MODULES = ("telethon", "playwright")
+
+PROBE = """
+import json, sys, time
+import dotenv
+dotenv.load_dotenv = lambda *args, **kwargs: False  # keep a local .env out of the measurement
+start = time.perf_counter()
+__import__(sys.argv[1])
+elapsed = (time.perf_counter() - start) * 1000
+from scrapper.database import Database
+print(json.dumps({
+    "ms": elapsed,
+    "pool": Database._pool is not None,
+    "loaded": sorted({name.split(".")[0] for name in sys.modules} & set(sys.argv[2:])),
+}))
+"""
+
+
+def measure(module):
+    """
+    Import `module` once in a fresh interpreter without credentials
+    Returns:
+        Result dict (ms, pool, loaded), or None when the import failed
+    """
+    env = {key: value for key, value in os.environ.items() if key not in CREDENTIALS}
+    proc = subprocess.run(
+        [sys.executable, "-c", PROBE, module, *HEAVY_MODULES],
+        cwd=ROOT, env=env, capture_output=True, text=True,
+    )
+    if proc.returncode != 0:
+        print(proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else "import failed")
+        return None
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument("--module", default="Auth.app")
+    arg_parser.add_argument("--runs", type=int, default=5)
+    arg_parser.add_argument("--budget", type=float, default=1500, help="Allowed import time (ms)")
+    args = arg_parser.parse_args()
+
+    results = []
+    for _ in range(args.runs):
+        result = measure(args.module)
+        if result is None:
+            print(f"FAILED: importing {args.module} without credentials raised")
+            return 1
+        results.append(result)
+
+    fastest = min(result["ms"] for result in results)
+    failures = []
+    if fastest > args.budget:
+        failures.append(f"import took {fastest:.0f} ms > {args.budget:.0f} ms budget")
+    if any(result["pool"] for result in results):
+        failures.append("database pool opened at import")
+    loaded = sorted({name for result in results for name in result["loaded"]})
+    if loaded:
+        failures.append(f"loaded at import: {', '.join(loaded)}")
+
+    print(f"{args.module}: fastest {fastest:.0f} ms of {args.runs} imports (budget {args.budget:.0f} ms)")
+    for failure in failures:
+        print(f"  {failure}")
+    print("FAILED" if failures else "PASSED")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,75 @@
+"""
+Checks of scrapper.canonical.canonical_url and the article hash built on it
+(scrapper.preprocessor.article_hash). Fails (exit code 1) when a link does not
+canonicalise as listed, or when links that name no article ("#",
+"javascript:void(0)", "mailto:") or relative links from two sites collide.
+
+    python tests/test_canonical.py
+"""
+import logging
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from scrapper.canonical import canonical_url
+from scrapper.preprocessor import article_hash
+
+# (link, page it was found on, expected canonical url)
+CASES = [
+    ("https://www.punchng.com/gunmen-attack/?utm_source=twitter&fbclid=x", None, "https://punchng.com/gunmen-attack"),
+    ("http://m.vanguardngr.com/2024/06/flood/amp/", None, "https://vanguardngr.com/2024/06/flood"),
+    ("https://punchng.com/story?b=2&a=1#comments", None, "https://punchng.com/story?a=1&b=2"),
+    ("//www.channelstv.com/2024/06/01/fire", None, "https://channelstv.com/2024/06/01/fire"),
+    ("/news/1", "https://punchng.com", "https://punchng.com/news/1"),
+    ("/news/1", "https://www.vanguardngr.com/", "https://vanguardngr.com/news/1"),
+    ("news/1", None, None),
+    ("/news/1", None, None),
+    ("#", "https://punchng.com", None),
+    ("#top", None, None),
+    ("javascript:void(0)", "https://punchng.com", None),
+    ("mailto:x", "https://punchng.com", None),
+    ("tel:+2348000000000", None, None),
+    ("/", "https://punchng.com", None),
+    ("https://punchng.com/", None, None),
+    ("", None, None),
+]
+
+
+def check_cases():
+    failures = []
+    for url, base_url, expected in CASES:
+        got = canonical_url(url, base_url)
+        if got != expected:
+            failures.append(f"{url!r} on {base_url}: {got!r} != {expected!r}")
+    return failures
+
+
+def check_hashes():
+    """ Articles with unusable links are keyed on their titles, relative links on their site """
+    failures = []
+    junk = [
+        {"title": f"Headline {index}", "news_url": link}
+        for index, link in enumerate(["#", "javascript:void(0)", "mailto:x", "/"])
+    ]
+    if len({article_hash(article, "https://punchng.com") for article in junk}) != len(junk):
+        failures.append("articles without a usable link share a hash")
+    punch = article_hash({"title": "A", "news_url": "/news/1"}, "https://punchng.com")
+    vanguard = article_hash({"title": "B", "news_url": "/news/1"}, "https://www.vanguardngr.com")
+    if punch == vanguard:
+        failures.append("/news/1 from two sites shares a hash")
+    return failures
+
+
+def main():
+    logging.disable(logging.WARNING)
+    failures = check_cases() + check_hashes()
+    print(f"Canonical urls: {len(CASES)} links checked")
+    for failure in failures:
+        print(f"  {failure}")
+    print("FAILED" if failures else "PASSED")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())